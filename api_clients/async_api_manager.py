@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+
+from constants.constants import ASYNC_CONCURRENCY_LIMIT, ASYNC_REQUEST_TIMEOUT
+from .async_auth_api import AsyncAuthAPI
+from .async_user_api import AsyncUserAPI
+from .async_movies_api import AsyncMoviesAPI
+
+
+class AsyncApiManager:
+    """
+    Асинхронный двойник ApiManager: один httpx.AsyncClient и общий лимит
+    одновременных запросов для всех API-классов.
+
+    Пример:
+        async with AsyncApiManager(concurrency=100) as api:
+            await api.auth_api.authenticate((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+            responses = await api.gather(*(api.movies_api.create_movie(m) for m in movies))
+    """
+    def __init__(self, client: httpx.AsyncClient = None, concurrency: int = ASYNC_CONCURRENCY_LIMIT):
+        """
+        Инициализация AsyncApiManager.
+        :param client: HTTP-клиент, используемый всеми API-классами. Если не передан - создаётся новый.
+        :param concurrency: Максимальное число запросов в полёте одновременно.
+        """
+        self.client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            timeout=ASYNC_REQUEST_TIMEOUT,
+        )
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.auth_api = AsyncAuthAPI(self.client, self.semaphore)
+        self.user_api = AsyncUserAPI(self.client, self.semaphore)
+        self.movies_api = AsyncMoviesAPI(self.client, self.semaphore)
+
+    @staticmethod
+    async def gather(*coroutines, return_exceptions=False):
+        """
+        Запускает корутины конкурентно (лимит задаётся семафором менеджера).
+        :param coroutines: Корутины вызовов API-методов.
+        :param return_exceptions: Возвращать исключения в списке результатов вместо их проброса.
+        :return: Список результатов в порядке переданных корутин.
+        """
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    async def close_session(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
@@ -0,0 +1,49 @@
+import asyncio
+
+import httpx
+from constants.constants import MOVIES_BASE_URL, MOVIES_ENDPOINT
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncMoviesAPI(AsyncCustomRequester):
+
+    def __init__(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore = None):
+        super().__init__(client=client, base_url=MOVIES_BASE_URL, semaphore=semaphore)
+
+    async def get_movies(self, params=None, expected_status=200):
+        return await self.send_request(
+            method="GET",
+            endpoint=MOVIES_ENDPOINT,
+            params=params,
+            expected_status=expected_status,
+        )
+
+    async def get_movie_by_id(self, movie_id, expected_status=200):
+        return await self.send_request(
+            method="GET",
+            endpoint=f"{MOVIES_ENDPOINT}/{movie_id}",
+            expected_status=expected_status,
+        )
+
+    async def create_movie(self, movie_data, expected_status=201):
+        return await self.send_request(
+            method="POST",
+            endpoint=MOVIES_ENDPOINT,
+            data=movie_data,
+            expected_status=expected_status,
+        )
+
+    async def update_movie(self, movie_id, movie_data, expected_status=200):
+        return await self.send_request(
+            method="PATCH",
+            endpoint=f"{MOVIES_ENDPOINT}/{movie_id}",
+            data=movie_data,
+            expected_status=expected_status,
+        )
+
+    async def delete_movie(self, movie_id, expected_status=200):
+        return await self.send_request(
+            method="DELETE",
+            endpoint=f"{MOVIES_ENDPOINT}/{movie_id}",
+            expected_status=expected_status,
+        )
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+from constants.constants import AUTH_BASE_URL
+from custom_requester.async_custom_requester import AsyncCustomRequester
+
+
+class AsyncUserAPI(AsyncCustomRequester):
+    """
+    Асинхронный класс для работы с API пользователей.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore = None):
+        super().__init__(client=client, base_url=AUTH_BASE_URL, semaphore=semaphore)
+
+    async def get_user(self, user_locator, expected_status=200):
+        """
+        Получение данных о пользователе
+        :param user_locator: id or email пользователя
+        :param expected_status: Ожидаемый статус-код
+        :return: Response
+        """
+        return await self.send_request(
+            method="GET",
+            endpoint=f"/user/{user_locator}",
+            expected_status=expected_status
+        )
+
+    async def create_user(self, user_data, expected_status=201):
+        """
+        Создание пользователя
+        :param user_data: данные пользователя
+        :param expected_status: Ожидаемый статус-код
+        :return: Response
+        """
+        return await self.send_request(
+            method="POST",
+            endpoint="/user",
+            data=user_data,
+            expected_status=expected_status
+        )
+
+    async def delete_user(self, user_locator, expected_status=200):
+        """
+        Удаление пользователя.
+        :param user_locator: id or email пользователя
+        :param expected_status: Ожидаемый статус-код.
+        :return: Response
+        """
+        return await self.send_request(
+            method="DELETE",
+            endpoint=f"/user/{user_locator}",
+            expected_status=expected_status
+        )
+
+    async def edit_user(self, user_id, user_data, expected_status=200):
+        """
+        Изменение данных пользователя
+        :param user_id: ID пользователя
+        :param user_data: Данные для обновления (roles, verified, banned)
+        :param expected_status: Ожидаемый статус-код
+        :return: Response
+        """
+        return await self.send_request(
+            method="PATCH",
+            endpoint=f"/user/{user_id}",
+            data=user_data,
+            expected_status=expected_status
+        )
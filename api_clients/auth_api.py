@@ -2,6 +2,8 @@ from requests import Session, Response
 from constants.constants import (REGISTER_ENDPOINT, AUTH_BASE_URL, LOGIN_ENDPOINT,
                                   LOGOUT_ENDPOINT, REFRESH_TOKENS_ENDPOINT, CONFIRM_EMAIL_ENDPOINT)
 from custom_requester.custom_requester import CustomRequester
+from utils.token_utils import decode_jwt_payload
+from .token_cache import CachedToken, token_cache
 
 class AuthAPI(CustomRequester):
     """
@@ -9,6 +11,10 @@ class AuthAPI(CustomRequester):
     """
     def __init__(self, session: Session):
         super().__init__(session=session, base_url=AUTH_BASE_URL)
+        # Заполняются в authenticate: профиль из ответа логина и claims access-токена (подпись не проверяется)
+        self.user_profile = {}
+        self.token_claims = {}
+        self.token_expires_at = None
 
     def register_user(self, user_data: dict, expected_status=201) -> Response:
         """
@@ -75,11 +81,37 @@ class AuthAPI(CustomRequester):
             expected_status=expected_status
         )
 
-    def authenticate(self, user_creds: tuple):
+    def authenticate(self, user_creds: tuple, use_cache=True):
         """
-        Аутентификация и сохранение токена в сессии
+        Аутентификация и сохранение токена в сессии.
+        Токен берётся из token_cache, если учётка уже логинилась в этом прогоне;
+        незадолго до истечения он обновляется через /refresh-tokens, а не новым логином.
         :param user_creds: Кортеж (email, password)
+        :param use_cache: Использовать кэш токенов (False - всегда делать POST /login)
+        После вызова доступны user_profile, token_claims, token_expires_at, user_id и user_roles.
         """
+        if not (use_cache and token_cache.enabled):
+            self._apply_token(self._login(user_creds))
+            return
+        with token_cache.lock_for(user_creds):
+            cached = token_cache.get(user_creds)
+            if cached is not None and not cached.expires_within(token_cache.refresh_margin):
+                token_cache.hits += 1
+            else:
+                # Логин/refresh под межпроцессной блокировкой: другой воркер мог уже получить токен
+                with token_cache.shared_lock():
+                    cached = token_cache.load_shared(user_creds) or cached
+                    if cached is not None and cached.expires_within(token_cache.refresh_margin):
+                        cached = self._refresh(user_creds, cached)
+                    elif cached is not None:
+                        token_cache.hits += 1
+                    if cached is None:
+                        cached = self._login(user_creds)
+                        token_cache.logins += 1
+                    token_cache.put(user_creds, cached)
+        self._apply_token(cached)
+
+    def _login(self, user_creds: tuple) -> CachedToken:
         login_data = {
             "email": user_creds[0],
             "password": user_creds[1]
@@ -87,5 +119,34 @@ class AuthAPI(CustomRequester):
         response = self.login_user(login_data).json()
         if "accessToken" not in response:
             raise KeyError("token is missing")
-        token = response["accessToken"]
-        self._update_session_headers(self.session, **{"authorization": f"Bearer {token}"})
+        return CachedToken.from_response(response, cookies=self.session.cookies.get_dict())
+
+    def _refresh(self, user_creds: tuple, cached: CachedToken):
+        """Обновляет истекающий токен через /refresh-tokens; None - если обновить не удалось."""
+        self.session.cookies.update(cached.cookies)
+        try:
+            response = self.refresh_tokens().json()
+            token = CachedToken.from_response(response, cookies=self.session.cookies.get_dict(),
+                                              login_response=cached.login_response)
+        except (ValueError, KeyError):
+            token_cache.invalidate(user_creds)
+            return None
+        token_cache.refreshes += 1
+        return token
+
+    @property
+    def user_id(self):
+        """id авторизованного пользователя - из профиля логина, иначе из claims токена."""
+        return self.user_profile.get("id") or self.token_claims.get("id") or self.token_claims.get("sub")
+
+    @property
+    def user_roles(self) -> list:
+        """Роли авторизованного пользователя по данным сервиса."""
+        return self.user_profile.get("roles") or self.token_claims.get("roles") or []
+
+    def _apply_token(self, token: CachedToken):
+        self.user_profile = token.login_response.get("user", {})
+        self.token_claims = decode_jwt_payload(token.access_token)
+        self.token_expires_at = token.expires_at
+        self.session.cookies.update(token.cookies)
+        self._update_session_headers(self.session, **{"authorization": f"Bearer {token.access_token}"})
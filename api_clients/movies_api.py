@@ -1,5 +1,7 @@
 from custom_requester.custom_requester import CustomRequester
+from custom_requester.json_stream import iter_json_array
 from constants.constants import MOVIES_BASE_URL, MOVIES_ENDPOINT
+from .movies_pager import MoviesPageIterator
 
 
 class MoviesAPI(CustomRequester):
@@ -7,19 +9,40 @@ class MoviesAPI(CustomRequester):
     def __init__(self, session):
         super().__init__(session=session, base_url=MOVIES_BASE_URL)
                         #TODO Исправил на params
-    def get_movies(self, params=None, expected_status=200):
+    def get_movies(self, params=None, expected_status=200, stream=False):
         return self.send_request(
             method="GET",
             endpoint=MOVIES_ENDPOINT,
             params=params,
             expected_status=expected_status,
+            stream=stream,
+            cacheable=True,
         )
 
+    def stream_movies(self, params=None):
+        """
+        Потоковый разбор страницы /movies: фильмы отдаются по одному по мере загрузки ответа,
+        память не зависит от pageSize.
+        :param params: Фильтры /movies (pageSize, page, minPrice и т.д.).
+        """
+        response = self.get_movies(params=params, stream=True)
+        yield from iter_json_array(response, "movies")
+
+    def iter_movies(self, params=None, prefetch=3) -> MoviesPageIterator:
+        """
+        Ленивый обход всех страниц /movies с фоновой подгрузкой следующих страниц.
+        :param params: Фильтры /movies (pageSize, minPrice, locations и т.д.).
+        :param prefetch: Сколько страниц загружать одновременно.
+        :return: Итератор по фильмам; page_count и max_pages_in_flight доступны как атрибуты.
+        """
+        return MoviesPageIterator(self, params=params, prefetch=prefetch)
+
     def get_movie_by_id(self, movie_id, expected_status=200):
         return self.send_request(
             method="GET",
             endpoint=f"{MOVIES_ENDPOINT}/{movie_id}",
             expected_status=expected_status,
+            cacheable=True,
         )
 
     def create_movie(self, movie_data, expected_status=201):
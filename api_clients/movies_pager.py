@@ -0,0 +1,61 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MoviesPageIterator:
+    """
+    Ленивый обход каталога /movies по всем страницам.
+    Пока тест обрабатывает текущую страницу, следующие prefetch страниц уже загружаются в фоне,
+    поэтому на окно из prefetch страниц тратится время примерно одного запроса.
+    """
+
+    def __init__(self, movies_api, params=None, prefetch=3):
+        """
+        :param movies_api: Экземпляр MoviesAPI, через который идут запросы.
+        :param params: Фильтры /movies (pageSize, minPrice, locations и т.д.). page - стартовая страница.
+        :param prefetch: Сколько следующих страниц загружать одновременно.
+        """
+        self.movies_api = movies_api
+        self.params = dict(params or {})
+        self.prefetch = max(prefetch, 1)
+        self.page_count = None
+        self.pages_fetched = 0
+        self.pages_in_flight = 0
+        self.max_pages_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _fetch_page(self, page: int) -> dict:
+        with self._lock:
+            self.pages_in_flight += 1
+            self.max_pages_in_flight = max(self.max_pages_in_flight, self.pages_in_flight)
+        try:
+            return self.movies_api.get_movies(params={**self.params, "page": page}).json()
+        finally:
+            with self._lock:
+                self.pages_in_flight -= 1
+                self.pages_fetched += 1
+
+    def __iter__(self):
+        page = int(self.params.get("page", 1))
+        first = self._fetch_page(page)
+        self.page_count = first["pageCount"]
+        yield from first["movies"]
+
+        pool = ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="movies-prefetch")
+        pending = deque()
+        try:
+            next_page = page + 1
+            while next_page <= self.page_count and len(pending) < self.prefetch:
+                pending.append(pool.submit(self._fetch_page, next_page))
+                next_page += 1
+            while pending:
+                data = pending.popleft().result()
+                # Освободился слот окна - сразу ставим в очередь следующую страницу
+                if next_page <= self.page_count:
+                    pending.append(pool.submit(self._fetch_page, next_page))
+                    next_page += 1
+                yield from data["movies"]
+        finally:
+            # Если обход прервали раньше (break в тесте) - не грузим оставшиеся страницы
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+from utils.token_utils import decode_jwt_payload
+
+DEFAULT_TOKEN_TTL = 15 * 60  # если срок жизни токена не удалось определить, секунды
+
+
+class CachedToken:
+    """Токен доступа пользователя вместе с cookies сессии и ответом логина."""
+
+    def __init__(self, access_token: str, expires_at: float, cookies: dict = None, login_response: dict = None):
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.cookies = cookies or {}
+        self.login_response = login_response or {}
+
+    @classmethod
+    def from_response(cls, response_data: dict, cookies: dict = None, login_response: dict = None):
+        """
+        :param response_data: Тело ответа /login или /refresh-tokens с accessToken.
+        :param cookies: Cookies сессии после запроса (refresh-токен).
+        :param login_response: Ответ логина (профиль пользователя); по умолчанию - response_data.
+        """
+        token = response_data["accessToken"]
+        return cls(token, cls._expires_at(token, response_data), cookies, login_response or response_data)
+
+    @staticmethod
+    def _expires_at(token: str, response_data: dict) -> float:
+        exp = decode_jwt_payload(token).get("exp")
+        if exp:
+            return float(exp)
+        expires_in = response_data.get("expiresIn")
+        if expires_in:
+            expires_in = float(expires_in)
+            if expires_in > 1e12:  # метка времени в миллисекундах
+                return expires_in / 1000
+            if expires_in > 1e9:  # метка времени в секундах
+                return expires_in
+            return time.time() + expires_in  # время жизни в секундах
+        return time.time() + DEFAULT_TOKEN_TTL
+
+    def expires_within(self, seconds: float) -> bool:
+        return self.expires_at - time.time() <= seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "access_token": self.access_token,
+            "expires_at": self.expires_at,
+            "cookies": self.cookies,
+            "login_response": self.login_response,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["access_token"], data["expires_at"], data.get("cookies"), data.get("login_response"))
+
+
+class TokenCache:
+    """
+    Кэш токенов на время прогона: каждая учётка логинится один раз, а не в каждом тесте.
+    Ключ - (email, password). За refresh_margin секунд до истечения токен обновляется через /refresh-tokens.
+    """
+
+    def __init__(self, refresh_margin=60.0, store=None):
+        """
+        :param refresh_margin: За сколько секунд до истечения обновлять токен.
+        :param store: Межпроцессное хранилище (FileTokenStore) для воркеров xdist; None - только память процесса.
+        """
+        self.enabled = True
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.logins = 0
+        self.refreshes = 0
+        self.hits = 0
+        self._tokens = {}
+        self._key_locks = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(user_creds: tuple) -> tuple:
+        return user_creds[0], user_creds[1]
+
+    def lock_for(self, user_creds: tuple) -> threading.Lock:
+        """Блокировка учётки: параллельные потоки не логинятся одним пользователем дважды."""
+        with self._lock:
+            return self._key_locks[self.key(user_creds)]
+
+    def get(self, user_creds: tuple):
+        token = self._tokens.get(self.key(user_creds))
+        if token is not None and token.expires_within(0):
+            self.invalidate(user_creds)
+            return None
+        return token
+
+    def put(self, user_creds: tuple, token: CachedToken):
+        """Сохраняет токен в памяти и, если настроено, в общем хранилище (вызывать под shared_lock)."""
+        self._tokens[self.key(user_creds)] = token
+        if self.store is not None:
+            self.store.write(user_creds, token.to_dict())
+
+    def shared_lock(self):
+        """Межпроцессная блокировка на время логина/refresh; без хранилища - пустой контекст."""
+        return self.store.locked() if self.store is not None else nullcontext()
+
+    def load_shared(self, user_creds: tuple):
+        """Токен, полученный другим воркером, или None. Вызывать под shared_lock."""
+        if self.store is None:
+            return None
+        data = self.store.read(user_creds)
+        if data is None:
+            return None
+        token = CachedToken.from_dict(data)
+        return None if token.expires_within(0) else token
+
+    def invalidate(self, user_creds: tuple):
+        self._tokens.pop(self.key(user_creds), None)
+
+    def clear(self):
+        self._tokens.clear()
+
+
+# Общий кэш процесса; настраивается плагином plugins.auth_tokens
+token_cache = TokenCache()
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileTokenStore:
+    """
+    Хранилище токенов на диске, общее для процессов (воркеров pytest-xdist).
+    Логин или refresh выполняется под эксклюзивной файловой блокировкой: первый воркер
+    получает токен и записывает его, остальные дожидаются блокировки и читают готовый.
+    В файле лежат bearer-токены и cookies, поэтому все файлы хранилища создаются с правами 0600.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к JSON-файлу с токенами.
+        """
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    @staticmethod
+    def key(user_creds: tuple) -> str:
+        # Пароль в файл не пишется - только его хэш в составе ключа
+        password_hash = hashlib.sha256(user_creds[1].encode("utf-8")).hexdigest()[:16]
+        return f"{user_creds[0]}:{password_hash}"
+
+    @contextmanager
+    def locked(self):
+        """Эксклюзивная межпроцессная блокировка хранилища."""
+        with os.fdopen(os.open(self.lock_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600), "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.05)
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as store_file:
+                return json.load(store_file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def read(self, user_creds: tuple):
+        """Запись учётки или None. Вызывать под locked()."""
+        return self._load().get(self.key(user_creds))
+
+    def write(self, user_creds: tuple, data: dict):
+        """Сохраняет запись учётки, отбрасывая истёкшие. Вызывать под locked()."""
+        now = time.time()
+        tokens = {key: value for key, value in self._load().items() if value.get("expires_at", 0) > now}
+        tokens[self.key(user_creds)] = data
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w",
+                           encoding="utf-8") as store_file:
+                json.dump(tokens, store_file)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def remove(self):
+        """Удаляет файл хранилища и файл блокировки (в конце прогона)."""
+        for path in (self.path, self.lock_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
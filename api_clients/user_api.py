@@ -21,7 +21,8 @@ class UserAPI(CustomRequester):
         return self.send_request(
             method="GET",
             endpoint=f"/user/{user_locator}",
-            expected_status= expected_status
+            expected_status= expected_status,
+            cacheable=True,
         )
 
     def create_user(self, user_data, expected_status=201):
@@ -0,0 +1,64 @@
+"""
+Микро-бенчмарк подготовки тела запроса: старый путь send_request
+(model_dump_json -> json.loads -> requests json=) против однопроходного serialize_body.
+
+Запуск из корня проекта: python -m benchmarks.bench_serialization
+"""
+import json
+import timeit
+
+import requests
+
+from constants.constants import AUTH_BASE_URL, REGISTER_ENDPOINT
+from constants.roles import Roles
+from custom_requester.serialization import JSON_HEADERS, orjson, serialize_body
+from models.base_models import TestUser
+from utils.data_generator import DataGenerator
+
+URL = f"{AUTH_BASE_URL}{REGISTER_ENDPOINT}"
+NUMBER = 20000
+
+
+def legacy_prepare(data):
+    if isinstance(data, TestUser):
+        data = json.loads(data.model_dump_json(exclude_unset=True))
+    return requests.Request("POST", URL, json=data).prepare()
+
+
+def single_pass_prepare(data):
+    return requests.Request("POST", URL, data=serialize_body(data), headers=JSON_HEADERS).prepare()
+
+
+def build_payloads():
+    password = DataGenerator.generate_random_password()
+    user = TestUser(
+        email=DataGenerator.generate_random_email(),
+        fullName=DataGenerator.generate_random_name(),
+        password=password,
+        passwordRepeat=password,
+        roles=[Roles.USER],
+    )
+    movie = {
+        "name": DataGenerator.generate_movie_name(),
+        "imageUrl": DataGenerator.generate_movie_image_url(),
+        "price": DataGenerator.generate_movie_price(),
+        "description": DataGenerator.generate_movie_description(),
+        "location": DataGenerator.generate_movie_location(),
+        "published": DataGenerator.generate_movie_published(),
+        "genreId": DataGenerator.generate_movie_genre_id(),
+        "rating": 1,
+    }
+    return {"TestUser": user, "movie dict": movie}
+
+
+def main():
+    print(f"JSON backend: {'orjson' if orjson is not None else 'json'}, {NUMBER} iterations")
+    for name, payload in build_payloads().items():
+        legacy = timeit.timeit(lambda: legacy_prepare(payload), number=NUMBER) / NUMBER * 1e6
+        single = timeit.timeit(lambda: single_pass_prepare(payload), number=NUMBER) / NUMBER * 1e6
+        print(f"{name:<12} legacy: {legacy:7.2f} us/request  single-pass: {single:7.2f} us/request  "
+              f"saving: {legacy - single:6.2f} us ({(1 - single / legacy) * 100:4.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,51 @@
 from datetime import datetime
-import requests
 import pytest
 from sqlalchemy.orm import Session
 from api_clients.api_manager import ApiManager
 from constants.constants import AUTH_BASE_URL, REGISTER_ENDPOINT, MOVIES_BASE_URL
 from constants.roles import Roles
 from custom_requester.custom_requester import CustomRequester
-from db_requester.db_client import get_db_session
+from db_requester.db_client import get_db_session, isolated_db_session
 from db_requester.db_helpers import DBHelper
 from entities.user import User
 from models.base_models import TestUser
 from resources.user_creds import SuperAdminCreds
 from utils.data_generator import DataGenerator
+from utils.role_registry import RoleRegistry
+from utils.user_pool import UserPool
+
+# plugins.http_transport раньше plugins.fake_stand: fake_stand импортирует его, а pytest может переписать
+# assert'ы только в модуле плагина, который ещё не был импортирован
+pytest_plugins = [
+    "plugins.http_transport",
+    "plugins.fake_stand",
+    "plugins.request_logging",
+    "plugins.latency",
+    "plugins.response_cache",
+    "plugins.timeouts",
+    "plugins.resilience",
+    "plugins.auth_tokens",
+    "plugins.cleanup",
+    "plugins.data_namespace",
+    "plugins.db_pool",
+    "plugins.sql_profiler",
+]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("user-pool", "Пул тестовых пользователей")
+    group.addoption("--user-pool-size", type=int, default=5,
+                    help="Сколько пользователей USER создавать заранее")
+    group.addoption("--user-pool-low-watermark", type=int, default=2,
+                    help="Порог свободных пользователей, ниже которого пул пополняется в фоне")
+    group = parser.getgroup("db-isolation", "Изоляция тестов БД")
+    group.addoption("--db-isolation", action="store_true", default=False,
+                    help="Выполнять каждый тест с db_helper в транзакции с откатом (как маркер db_isolated)")
+
+
+def _is_db_isolated(request) -> bool:
+    return (request.node.get_closest_marker("db_isolated") is not None
+            or request.config.getoption("--db-isolation"))
 
 @pytest.fixture
 def test_user() -> TestUser:
@@ -57,27 +91,27 @@ def registered_user(test_user, requester_auth):
 
 
 @pytest.fixture
-def requester_auth():
+def requester_auth(http_transport):
     """
     Фикстура для создания экземпляра CustomRequester.
     """
-    session = requests.Session()
+    session = http_transport.new_session()
     return CustomRequester(session=session, base_url=AUTH_BASE_URL)
 
 @pytest.fixture
-def requester_movies():
+def requester_movies(http_transport):
     """
     Фикстура для создания экземпляра CustomRequester.
     """
-    session = requests.Session()
+    session = http_transport.new_session()
     return CustomRequester(session=session, base_url=MOVIES_BASE_URL)
 
 @pytest.fixture
-def session():
+def session(http_transport):
     """
-    Фикстура для создания HTTP-сессии.
+    Фикстура для создания HTTP-сессии (пул соединений общий для всего прогона).
     """
-    http_session = requests.Session()
+    http_session = http_transport.new_session()
     yield http_session
     http_session.close()
 
@@ -121,25 +155,21 @@ def movie_data_db():
     }
 
 @pytest.fixture
-def created_movie(super_admin, movie_data):
-    """Фикстура для создания фильма и его дальнейшего удаления"""
+def created_movie(super_admin, movie_data, cleanup_registry):
+    """Фикстура для создания фильма; удаляется пачкой в конце сессии через cleanup_registry"""
     response = super_admin.api.movies_api.create_movie(movie_data)
     data = response.json()
     movie_id = data["id"]
+    cleanup_registry.register_movie(movie_id)
 
     yield movie_id, data, movie_data
-    #Делаю попытку удалить фильм, после создания.
-    try:
-        super_admin.api.movies_api.delete_movie(movie_id)
-    except ValueError:
-        pass  # Если фильм уж удален методом делит то ошибки не будет. Тест пройдёт, наверное.
 
 @pytest.fixture
-def user_session():
+def user_session(http_transport):
     user_pool = []
 
     def _create_user_session():
-        session = requests.Session()
+        session = http_transport.new_session()
         user_session = ApiManager(session)
         user_pool.append(user_session)
         return user_session
@@ -170,26 +200,52 @@ def creation_user_data(test_user):
     })
     return creation_user
 
-@pytest.fixture
-def common_user(user_session, super_admin, creation_user_data):
-    new_session = user_session()
+@pytest.fixture(scope="session")
+def super_admin_api(http_transport):
+    """
+    Сессионный ApiManager с авторизацией SUPER_ADMIN для служебных задач (пул пользователей, очистка).
+    """
+    api = ApiManager(http_transport.new_session())
+    api.auth_api.authenticate((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+    yield api
+    api.close_session()
 
-    common_user = User(
-        creation_user_data.email,
-        creation_user_data.password,
-        [Roles.USER.value],
-        new_session)
+@pytest.fixture(scope="session")
+def user_pool(request, http_transport, super_admin_api):
+    """
+    Пул заранее созданных подтверждённых пользователей USER на весь прогон.
+    Пользователи создаются параллельно до начала тестов и удаляются в конце сессии.
+    """
+    pool = UserPool(
+        super_admin_api,
+        http_transport.new_session,
+        size=request.config.getoption("--user-pool-size"),
+        low_watermark=request.config.getoption("--user-pool-low-watermark"),
+    )
+    pool.fill()
+    yield pool
+    pool.close()
 
-    super_admin.api.user_api.create_user(creation_user_data)
-    common_user.api.auth_api.authenticate(common_user.creds)
-    return common_user
+@pytest.fixture(scope="session")
+def role_registry(http_transport, super_admin_api, cleanup_registry):
+    """
+    По одному авторизованному пользователю на каждую роль Roles на весь прогон - для параметризации по ролям.
+    """
+    registry = RoleRegistry(super_admin_api, http_transport.new_session, cleanup_registry)
+    yield registry
+    registry.close()
 
 @pytest.fixture
-def user_id(api_manager, common_user):
-    login_data = {"email": common_user.email, "password": common_user.password}
-    response = api_manager.auth_api.login_user(login_data).json()
+def common_user(user_pool):
+    """Пользователь USER из пула: выдаётся на тест и возвращается в пул после него"""
+    common_user = user_pool.lease()
+    yield common_user
+    user_pool.release(common_user)
 
-    return response["user"]["id"]
+@pytest.fixture
+def user_id(common_user):
+    """id пользователя из его логина - без повторного POST /login"""
+    return common_user.id
 
 @pytest.fixture(scope="module")
 def db_session() -> Session:
@@ -202,21 +258,32 @@ def db_session() -> Session:
     db_session.close()
 
 @pytest.fixture(scope="function")
-def db_helper(db_session) -> DBHelper:
+def isolated_session():
+    """
+    Фикстура сессии БД в транзакции теста: commit = RELEASE SAVEPOINT, в конце теста всё откатывается
+    """
+    with isolated_db_session() as session:
+        yield session
+
+@pytest.fixture(scope="function")
+def db_helper(request) -> DBHelper:
     """
-    Фикстура для экземпляра хелпера
+    Фикстура для экземпляра хелпера.
+    С маркером db_isolated (или --db-isolation) работает в транзакции теста с откатом.
+    Сессии запрашиваются лениво: в изолированном режиме модульная db_session не создаётся.
     """
-    db_helper = DBHelper(db_session)
+    if _is_db_isolated(request):
+        return DBHelper(request.getfixturevalue("isolated_session"))
+    db_helper = DBHelper(request.getfixturevalue("db_session"))
     return db_helper
 
 @pytest.fixture(scope="function")
-def created_test_user(db_helper):
+def created_test_user(request, db_helper):
     """
-    Фикстура, которая создает тестового пользователя в БД
-    и удаляет его после завершения теста
+    Фикстура, которая создает тестового пользователя в БД.
+    Удаляется в конце сессии через cleanup_registry (в изолированном режиме - откатом транзакции)
     """
     user = db_helper.create_test_user(DataGenerator.generate_user_data())
-    yield user
-    # Cleanup после теста
-    if db_helper.get_user_by_id(user.id):
-        db_helper.delete_user(user)
\ No newline at end of file
+    if not _is_db_isolated(request):
+        request.getfixturevalue("cleanup_registry").register_user(user.id)
+    yield user
\ No newline at end of file
@@ -1,6 +1,21 @@
+import os
 
-AUTH_BASE_URL = "https://auth.dev-cinescope.coconutqa.ru"
-MOVIES_BASE_URL = "https://api.dev-cinescope.coconutqa.ru"
+from dotenv import load_dotenv
+
+# Настройки стенда могут лежать в .env - читаем его до первого os.getenv (как resources/user_creds.py)
+load_dotenv()
+
+# Стенд: dev (по умолчанию) или fake - локальный fake_cinescope (python -m fake_cinescope или плагин plugins.fake_stand)
+CINESCOPE_STAND = os.getenv("CINESCOPE_STAND", "dev")
+FAKE_STAND_HOST = "127.0.0.1"
+FAKE_STAND_PORT = int(os.getenv("CINESCOPE_FAKE_PORT", "8765"))
+
+if CINESCOPE_STAND == "fake":
+    # fake-стенд обслуживает auth и movies на одном адресе
+    AUTH_BASE_URL = MOVIES_BASE_URL = f"http://{FAKE_STAND_HOST}:{FAKE_STAND_PORT}"
+else:
+    AUTH_BASE_URL = os.getenv("CINESCOPE_AUTH_BASE_URL", "https://auth.dev-cinescope.coconutqa.ru")
+    MOVIES_BASE_URL = os.getenv("CINESCOPE_MOVIES_BASE_URL", "https://api.dev-cinescope.coconutqa.ru")
 
 HEADERS = {
     "Content-Type": "application/json",
@@ -20,3 +35,15 @@ MOVIES_ENDPOINT = "/movies"
 GREEN = '\033[32m'
 RED = '\033[31m'
 RESET = '\033[0m'
+
+# Async client
+ASYNC_CONCURRENCY_LIMIT = 50  # максимум одновременных запросов в AsyncApiManager
+ASYNC_REQUEST_TIMEOUT = 30  # секунды
+
+# Shared HTTP transport
+HTTP_POOL_CONNECTIONS = 10  # сколько хостов держать в пуле одновременно
+HTTP_POOL_MAXSIZE = 20  # максимум keep-alive соединений на один хост
+
+# Timeouts
+DEFAULT_CONNECT_TIMEOUT = 5  # секунды на установку соединения
+DEFAULT_READ_TIMEOUT = 30  # секунды ожидания данных ответа
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from constants.constants import ASYNC_CONCURRENCY_LIMIT
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.deadline import RequestTimeoutError, capped_by_deadline, resolve_timeout, test_deadline
+from custom_requester.latency import latency_recorder
+from custom_requester.resilience import RETRYABLE_STATUSES, circuit_breakers, retry_policy
+from custom_requester.serialization import JSON_HEADERS, serialize_body
+
+
+class AsyncCustomRequester(CustomRequester):
+    """
+    Асинхронный двойник CustomRequester на httpx.AsyncClient.
+    Сохраняет проверку expected_status, curl-логирование, повторы, circuit breaker и замер latency, но позволяет
+    держать в полёте сотни запросов, ограничивая их количество семафором.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, base_url, semaphore: asyncio.Semaphore = None):
+        """
+        Инициализация асинхронного реквестера.
+        :param client: Объект httpx.AsyncClient.
+        :param base_url: Базовый URL API.
+        :param semaphore: Семафор, ограничивающий число одновременных запросов.
+                          Обычно общий для всех API-классов одного AsyncApiManager.
+        """
+        super().__init__(session=client, base_url=base_url)
+        self.semaphore = semaphore or asyncio.Semaphore(ASYNC_CONCURRENCY_LIMIT)
+
+    async def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True,
+                           timeout=None):
+        """
+        Универсальный асинхронный метод для отправки запросов.
+        :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
+        :param endpoint: Эндпоинт (например, "/login").
+        :param data: Тело запроса (JSON-данные или pydantic-модель).
+        :param params: Query-параметры.
+        :param expected_status: Ожидаемый статус-код (по умолчанию 200).
+        :param need_logging: Флаг для логирования (по умолчанию True).
+        :param timeout: Таймаут запроса: число или кортеж (connect, read). По умолчанию default_timeout.
+                        Как и в CustomRequester, не больше, чем осталось до дедлайна теста.
+        :return: Объект ответа httpx.Response.
+        """
+        url = f"{self.base_url}{endpoint}"
+        body = serialize_body(data)
+        headers = JSON_HEADERS if body is not None else None
+        response = await self._request_with_retries(method, url, endpoint, body, params, headers,
+                                                    timeout or self.default_timeout, expected_status)
+        if need_logging:
+            self.log_request_and_response(response)
+        if response.status_code != expected_status:
+            raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
+        return response
+
+    async def _request_with_retries(self, method, url, endpoint, body, params, headers, timeout, expected_status):
+        """
+        Асинхронный двойник CustomRequester._request_with_retries: те же retry_policy и circuit breaker хоста.
+        Слот семафора занят только на время попытки - ожидание перед повтором не блокирует другие запросы.
+        """
+        breaker = circuit_breakers.get(urlsplit(url).netloc)
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                # Замер внутри семафора: ожидание свободного слота не считается временем ответа эндпоинта
+                # Таймаут считается после получения слота: ожидание в очереди тоже расходует дедлайн теста
+                connect, read = resolve_timeout(timeout, method, url)
+                breaker.before_request(method, url)
+                started = time.perf_counter()
+                try:
+                    response = await self.session.request(
+                        method, url, content=body, params=params, headers=headers,
+                        timeout=httpx.Timeout(read, connect=connect, pool=read),
+                    )
+                except httpx.TransportError as e:
+                    error, elapsed = e, time.perf_counter() - started
+                except BaseException:
+                    # В т.ч. отмена задачи: о здоровье хоста такой запрос ничего не говорит
+                    breaker.release_trial()
+                    raise
+                else:
+                    error = None
+                    latency_recorder.record(method, self.base_url, endpoint, time.perf_counter() - started)
+            if error is not None:
+                timed_out = isinstance(error, httpx.TimeoutException)
+                if timed_out and capped_by_deadline(timeout, (connect, read)):
+                    # Кончился бюджет теста, а не терпение хоста - медленный тест не должен открывать цепь
+                    breaker.release_trial()
+                else:
+                    breaker.record_failure()
+                if retry_policy.should_retry(method, attempt, exc=error) and await retry_policy.async_sleep(attempt):
+                    self.logger.info(f"Retry {attempt + 1} of {method} {url} after {type(error).__name__}")
+                    attempt += 1
+                    continue
+                if timed_out:
+                    limit = (f"test deadline of {test_deadline.budget}s" if test_deadline.active
+                             and test_deadline.remaining() <= 0 else f"timeout {(connect, read)}")
+                    raise RequestTimeoutError(f"{method} {url} timed out after {elapsed:.2f}s ({limit})") from error
+                raise error
+            if response.status_code in RETRYABLE_STATUSES and response.status_code != expected_status:
+                breaker.record_failure()
+                if retry_policy.should_retry(method, attempt, status=response.status_code) \
+                        and await retry_policy.async_sleep(attempt):
+                    self.logger.info(f"Retry {attempt + 1} of {method} {url} after status {response.status_code}")
+                    await response.aclose()
+                    attempt += 1
+                    continue
+            else:
+                breaker.record_success()
+            return response
@@ -1,15 +1,20 @@
-# Импорт модуля json для работы с JSON-данными (сериализация/десериализация)
-import json
 # Импорт библиотеки requests для выполнения HTTP-запросов
 import requests
 # Импорт модуля logging для логирования событий и отладки
 import logging
 # Импорт модуля os для работы с операционной системой (переменные окружения, пути)
 import os
+# Импорт модуля time для замера времени запросов
+import time
+from urllib.parse import urlsplit
 
-from pydantic import BaseModel
-
-from constants.constants import GREEN, RESET, RED
+from constants.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from custom_requester.deadline import RequestTimeoutError, capped_by_deadline, resolve_timeout, test_deadline
+from custom_requester.latency import latency_recorder
+from custom_requester.request_log import request_log
+from custom_requester.resilience import RETRYABLE_STATUSES, circuit_breakers, retry_policy
+from custom_requester.response_cache import response_cache
+from custom_requester.serialization import JSON_HEADERS, serialize_body
 
 
 class CustomRequester:
@@ -23,6 +28,8 @@ class CustomRequester:
         # Указываем, что ожидаем получить JSON-данные в ответе
         "Accept": "application/json"
     }
+    # Таймаут (connect, read) по умолчанию для всех запросов; меняется опциями --http-connect-timeout и --http-read-timeout
+    default_timeout = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
 
     # Конструктор класса - вызывается при создании нового объекта CustomRequester
     def __init__(self, session, base_url):
@@ -43,27 +50,93 @@ class CustomRequester:
         self.logger.setLevel(logging.INFO)
 
     # Метод для отправки HTTP-запросов с автоматической проверкой статус-кода и логированием
-    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True):
+    def send_request(self, method, endpoint, data=None, params=None, expected_status=200, need_logging=True,
+                     stream=False, timeout=None, cacheable=False):
         """
         Универсальный метод для отправки запросов.
         :param params:
         :param method: HTTP метод (GET, POST, PUT, DELETE и т.д.).
         :param endpoint: Эндпоинт (например, "/login").
-        :param data: Тело запроса (JSON-данные).
+        :param data: Тело запроса (JSON-данные или pydantic-модель). Сериализуется в байты один раз.
         :param expected_status: Ожидаемый статус-код (по умолчанию 200).
         :param need_logging: Флаг для логирования (по умолчанию True).
+        :param stream: Не загружать тело ответа сразу - для потокового разбора через json_stream.iter_json_array.
+        :param timeout: Таймаут запроса: число или кортеж (connect, read). По умолчанию default_timeout.
+                        В любом случае не больше, чем осталось до дедлайна теста.
+        :param cacheable: Ответ можно брать из response_cache. Только для GET без побочных эффектов
+                          (каталог фильмов, данные пользователя) - auth-эндпоинты не кэшируются никогда.
         :return: Объект ответа requests.Response.
         """
         url = f"{self.base_url}{endpoint}"
-        if isinstance(data, BaseModel):
-            data = json.loads(data.model_dump_json(exclude_unset=True))
-        response = self.session.request(method, url, json=data, params=params)
+        is_get = method.upper() == "GET"
+        cache_key = None
+        if response_cache.enabled and cacheable and is_get and not stream:
+            cache_key = response_cache.make_key(url, params, self.session.headers.get("authorization"),
+                                                self.session.cookies)
+            cached = response_cache.get(cache_key, expected_status)
+            if cached is not None:
+                return cached
+        body = serialize_body(data)
+        headers = JSON_HEADERS if body is not None else None
+        response = self._request_with_retries(method, url, endpoint, body, params, headers, stream,
+                                              timeout or self.default_timeout, expected_status)
+        if cache_key is not None and response.ok:
+            response_cache.put(cache_key, response)
+        elif response_cache.enabled and not is_get:
+            # Изменяющий запрос: сбрасываем закэшированные GET этого ресурса у всех пользователей
+            response_cache.invalidate(url)
         if need_logging:
             self.log_request_and_response(response)
         if response.status_code != expected_status:
             raise ValueError(f"Unexpected status code: {response.status_code}. Expected: {expected_status}")
         return response
 
+    def _request_with_retries(self, method, url, endpoint, body, params, headers, stream, timeout, expected_status):
+        """
+        Отправка запроса с таймаутом, повторами (retry_policy) и circuit breaker'ом хоста.
+        Каждая попытка ограничена дедлайном теста и попадает в статистику latency.
+        """
+        breaker = circuit_breakers.get(urlsplit(url).netloc)
+        attempt = 0
+        while True:
+            request_timeout = resolve_timeout(timeout, method, url)
+            breaker.before_request(method, url)
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, data=body, params=params, headers=headers,
+                                                stream=stream, timeout=request_timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if isinstance(e, requests.exceptions.Timeout) and capped_by_deadline(timeout, request_timeout):
+                    # Кончился бюджет теста, а не терпение хоста - медленный тест не должен открывать цепь
+                    breaker.release_trial()
+                else:
+                    breaker.record_failure()
+                if retry_policy.should_retry(method, attempt, exc=e) and retry_policy.sleep(attempt):
+                    self.logger.info(f"Retry {attempt + 1} of {method} {url} after {type(e).__name__}")
+                    attempt += 1
+                    continue
+                if isinstance(e, requests.exceptions.Timeout):
+                    elapsed = time.perf_counter() - started
+                    limit = (f"test deadline of {test_deadline.budget}s" if test_deadline.active
+                             and test_deadline.remaining() <= 0 else f"timeout {request_timeout}")
+                    raise RequestTimeoutError(f"{method} {url} timed out after {elapsed:.2f}s ({limit})") from e
+                raise
+            except BaseException:
+                breaker.release_trial()
+                raise
+            latency_recorder.record(method, self.base_url, endpoint, time.perf_counter() - started)
+            if response.status_code in RETRYABLE_STATUSES and response.status_code != expected_status:
+                breaker.record_failure()
+                if retry_policy.should_retry(method, attempt, status=response.status_code) \
+                        and retry_policy.sleep(attempt):
+                    self.logger.info(f"Retry {attempt + 1} of {method} {url} after status {response.status_code}")
+                    response.close()
+                    attempt += 1
+                    continue
+            else:
+                breaker.record_success()
+            return response
+
     # Приватный метод (начинается с _) для обновления заголовков сессии
 
     def _update_session_headers(self, session, **kwargs):
@@ -79,35 +152,16 @@ class CustomRequester:
         """
         Логгирование запросов и ответов. Настройки логгирования описаны в pytest.ini
         Преобразует вывод в curl-like (-H хэдэеры), (-d тело)
+        В lazy-режиме (--request-log-mode=lazy) запрос только сохраняется в буфер теста
+        и форматируется при падении теста или по сэмплингу.
 
         :param response: Объект response получаемый из метода "send_request"
         """
-        try:
-            request = response.request
-            headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
-            full_test_name = f"pytest {os.environ.get('PYTEST_CURRENT_TEST', '').replace(' (call)', '')}"
-
-            body = ""
-            if hasattr(request, 'body') and request.body is not None:
-                if isinstance(request.body, bytes):
-                    body = request.body.decode('utf-8')
-                elif isinstance(request.body, str):
-                    body = request.body
-                body = f"-d '{body}' \n" if body != '{}' else ''
-
-            self.logger.info(
-                f"{GREEN}{full_test_name}{RESET}\n"
-                f"curl -X {request.method} '{request.url}' \\\n"
-                f"{headers} \\\n"
-                f"{body}"
-            )
-
-            response_status = response.status_code
-            is_success = response.ok
-            response_data = response.text
-            if not is_success:
-                self.logger.info(f"\tRESPONSE:"
-                                 f"\nSTATUS_CODE: {RED}{response_status}{RESET}"
-                                 f"\nDATA: {RED}{response_data}{RESET}")
-        except Exception as e:
-            self.logger.info(f"\nLogging went wrong: {type(e)} - {e}")
+        current_test = os.environ.get('PYTEST_CURRENT_TEST', '')
+        if request_log.is_lazy:
+            sampled = request_log.should_sample()
+            if sampled:
+                request_log.write(self.logger, response, current_test, attach=True)
+            request_log.record(response, current_test, written=sampled)
+            return
+        request_log.write(self.logger, response, current_test)
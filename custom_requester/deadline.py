@@ -0,0 +1,78 @@
+import threading
+import time
+
+
+class RequestTimeoutError(TimeoutError):
+    """Запрос не уложился в таймаут или в дедлайн теста."""
+
+
+class TestDeadline(threading.local):
+    """
+    Общий дедлайн всех запросов текущего теста (включая фикстуры).
+    Запускается плагином plugins.timeouts перед setup теста и сбрасывается перед teardown.
+    Состояние своё у каждого потока: дедлайн действует только в потоке теста, а фоновые потоки
+    (пополнение пула пользователей, предзагрузка страниц) его не видят и бюджетом теста не ограничены.
+    """
+    __test__ = False  # не тестовый класс, хоть и начинается с Test
+
+    def __init__(self):
+        self.budget = None
+        self.started_at = None
+        self.expires_at = None
+
+    def start(self, seconds: float):
+        self.budget = seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + seconds
+
+    def clear(self):
+        self.budget = None
+        self.started_at = None
+        self.expires_at = None
+
+    @property
+    def active(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self):
+        """Секунды до дедлайна или None, если дедлайна нет."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at is not None else 0.0
+
+
+test_deadline = TestDeadline()
+
+
+def resolve_timeout(timeout, method: str, url: str):
+    """
+    Итоговый (connect, read) таймаут запроса с учётом дедлайна теста.
+    :param timeout: Число или кортеж (connect, read).
+    :param method: HTTP метод - для текста ошибки.
+    :param url: URL запроса - для текста ошибки.
+    :raises RequestTimeoutError: Если дедлайн теста уже истёк.
+    """
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    remaining = test_deadline.remaining()
+    if remaining is None:
+        return connect, read
+    if remaining <= 0:
+        raise RequestTimeoutError(
+            f"Test deadline of {test_deadline.budget}s exceeded before {method} {url} "
+            f"(elapsed {test_deadline.elapsed():.2f}s)"
+        )
+    return min(connect, remaining), min(read, remaining)
+
+
+def capped_by_deadline(timeout, resolved) -> bool:
+    """
+    Таймаут запроса урезан дедлайном теста: срабатывание такого таймаута - нехватка бюджета теста,
+    а не медленный хост, и сбоем для circuit breaker'а не считается.
+    :param timeout: Запрошенный таймаут - число или кортеж (connect, read).
+    :param resolved: Итоговый (connect, read) из resolve_timeout.
+    """
+    requested = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return any(limit is not None and used < limit for used, limit in zip(resolved, requested))
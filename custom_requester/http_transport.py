@@ -0,0 +1,110 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from constants.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter, который переживает закрытие отдельных сессий.
+    Session.close() закрывает все смонтированные адаптеры, поэтому close() здесь ничего не делает,
+    а реальное освобождение пулов выполняет SharedHTTPTransport.close().
+    """
+
+    def close(self):
+        pass
+
+    def release(self):
+        super().close()
+
+
+class SharedHTTPTransport:
+    """
+    Общий транспортный слой для всех requests.Session в тестовой сессии.
+    Каждая сессия хранит свои заголовки (токен пользователя) и cookies,
+    а keep-alive пулы соединений urllib3 (по одному на хост) общие.
+    """
+
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, pool_block=False):
+        """
+        :param pool_connections: Сколько пулов (хостов) держать открытыми.
+        :param pool_maxsize: Максимум соединений на один хост.
+        :param pool_block: Ждать свободное соединение вместо открытия лишнего при исчерпании пула.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.adapter = SharedHTTPAdapter(pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize,
+                                         pool_block=pool_block)
+        self._lock = threading.Lock()
+        self._closed_stats = None
+        self.sessions_created = 0
+        self.app_mounts = {}  # базовый URL -> адаптер приложения в текущем процессе (WSGIAdapter/ASGIAdapter)
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """
+        Монтирует общий адаптер в существующую сессию.
+        :param session: Объект requests.Session.
+        :return: Та же сессия.
+        """
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        # Более длинный префикс важнее: запросы на base_url уходят в приложение, остальные - в сеть
+        for base_url, adapter in self.app_mounts.items():
+            session.mount(base_url, adapter)
+        return session
+
+    def mount_app(self, base_url: str, adapter):
+        """
+        Направляет запросы на base_url во всех сессиях транспорта в приложение без сокетов.
+        :param base_url: Префикс URL, например AUTH_BASE_URL.
+        :param adapter: WSGIAdapter или ASGIAdapter из custom_requester.inprocess_adapter.
+        """
+        self.app_mounts[base_url] = adapter
+
+    def new_session(self) -> requests.Session:
+        """
+        Создаёт новую сессию со своими заголовками, но общими пулами соединений.
+        """
+        with self._lock:
+            self.sessions_created += 1
+        return self.mount(requests.Session())
+
+    def stats(self) -> dict:
+        """
+        Счётчики использования пулов по хостам.
+        pool_misses - открытые новые соединения, pool_hits - запросы, ушедшие в уже открытое соединение.
+        :return: {"scheme://host:port": {"requests", "pool_hits", "pool_misses"}, ...}
+        """
+        if self._closed_stats is not None:
+            return self._closed_stats
+        pools = self.adapter.poolmanager.pools
+        result = {}
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            entry = result.setdefault(host, {"requests": 0, "pool_hits": 0, "pool_misses": 0})
+            entry["requests"] += pool.num_requests
+            entry["pool_misses"] += pool.num_connections
+            entry["pool_hits"] += max(pool.num_requests - pool.num_connections, 0)
+        for base_url, adapter in self.app_mounts.items():
+            result[f"{base_url} (in-process)"] = {"requests": adapter.requests_handled, "pool_hits": 0,
+                                                  "pool_misses": 0}
+        return result
+
+    def totals(self) -> dict:
+        """Суммарные счётчики по всем хостам."""
+        totals = {"requests": 0, "pool_hits": 0, "pool_misses": 0}
+        for entry in self.stats().values():
+            for name in totals:
+                totals[name] += entry[name]
+        return totals
+
+    def close(self):
+        # Снимок счётчиков до очистки пулов, чтобы их можно было вывести в отчёте после закрытия
+        self._closed_stats = self.stats()
+        self.adapter.release()
@@ -0,0 +1,191 @@
+import asyncio
+import io
+from abc import ABC, abstractmethod
+import sys
+import threading
+from http.client import HTTPMessage
+from http.client import responses as HTTP_REASONS
+from urllib.parse import unquote, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+
+class _OriginalResponse:
+    """
+    Заменитель http.client.HTTPResponse для requests: из _original_response.msg
+    requests читает Set-Cookie в session.cookies (extract_cookies_to_jar).
+    """
+
+    def __init__(self, headers: list):
+        self.msg = HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+
+    def isclosed(self) -> bool:
+        return True
+
+
+class _InProcessAdapter(HTTPAdapter, ABC):
+    """
+    Общая часть адаптеров: PreparedRequest -> (status, headers, body) приложения -> requests.Response.
+    Ответ собирается тем же HTTPAdapter.build_response, что и для сети, поэтому cookies, кодировка,
+    stream=True и логирование CustomRequester работают без изменений.
+    """
+
+    def __init__(self, app):
+        super().__init__(pool_connections=1, pool_maxsize=1)
+        self.app = app
+        self.requests_handled = 0
+
+    @abstractmethod
+    def _call_app(self, request, body: bytes):
+        """Вызывает приложение и возвращает (status, [(заголовок, значение)], тело в байтах)."""
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = b"".join(body)  # генератор/итератор чанков
+        status, headers, content = self._call_app(request, body)
+        self.requests_handled += 1
+        raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=headers,
+            status=status,
+            reason=HTTP_REASONS.get(status, ""),
+            preload_content=False,
+            decode_content=False,
+            original_response=_OriginalResponse(headers),
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+    def close(self):
+        pass
+
+
+class WSGIAdapter(_InProcessAdapter):
+    """
+    Транспорт requests без сокетов: запрос передаётся прямо в WSGI-приложение в текущем процессе.
+    Монтируется на базовый URL: session.mount(base_url, WSGIAdapter(app)) или SharedHTTPTransport.mount_app.
+    """
+
+    def _call_app(self, request, body: bytes):
+        url = urlsplit(request.url)
+        environ = {
+            "REQUEST_METHOD": request.method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": unquote(url.path) or "/",
+            "QUERY_STRING": url.query,
+            "SERVER_NAME": url.hostname or "localhost",
+            "SERVER_PORT": str(url.port or (443 if url.scheme == "https" else 80)),
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": url.scheme,
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        for name, value in request.headers.items():
+            key = name.upper().replace("-", "_")
+            if key == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+            elif key != "CONTENT_LENGTH":
+                environ[f"HTTP_{key}"] = value
+
+        response_start = {}
+
+        def start_response(status, headers, exc_info=None):
+            response_start["status"] = int(status.split(" ", 1)[0])
+            response_start["headers"] = headers
+            return lambda data: chunks.append(data)
+
+        chunks = []
+        result = self.app(environ, start_response)
+        try:
+            chunks.extend(result)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        return response_start["status"], response_start["headers"], b"".join(chunks)
+
+
+class ASGIAdapter(_InProcessAdapter):
+    """
+    То же для ASGI-приложения: запросы выполняются в отдельном потоке с event loop,
+    поэтому адаптер можно использовать из синхронного кода и из нескольких потоков.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="asgi-adapter", daemon=True)
+                self._thread.start()
+            return self._loop
+
+    async def _run(self, request, body: bytes):
+        url = urlsplit(request.url)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": request.method,
+            "scheme": url.scheme,
+            "path": unquote(url.path) or "/",
+            "raw_path": (url.path or "/").encode("latin-1"),
+            "query_string": url.query.encode("latin-1"),
+            "root_path": "",
+            "headers": [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in request.headers.items()],
+            "server": (url.hostname or "localhost", url.port or (443 if url.scheme == "https" else 80)),
+            "client": ("127.0.0.1", 0),
+        }
+        received = False
+
+        async def receive():
+            nonlocal received
+            if received:
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        response = {"status": 500, "headers": [], "body": []}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                response["headers"] = [(name.decode("latin-1"), value.decode("latin-1"))
+                                       for name, value in message.get("headers", [])]
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return response["status"], response["headers"], b"".join(response["body"])
+
+    def _call_app(self, request, body: bytes):
+        return asyncio.run_coroutine_threadsafe(self._run(request, body), self._get_loop()).result()
+
+    def close(self):
+        """Останавливает event loop и дожидается его потока; следующий запрос запустит новый."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,119 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+
+class _StreamBuffer:
+    """Текстовый буфер поверх потока байт ответа, который подгружает данные по мере разбора."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def read_more(self) -> bool:
+        for chunk in self._chunks:
+            piece = self._utf8.decode(chunk)
+            if piece:
+                # Отбрасываем уже разобранную часть, чтобы память не росла вместе с ответом
+                self.text = self.text[self.pos:] + piece
+                self.pos = 0
+                return True
+        self.text += self._utf8.decode(b"", final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self) -> str:
+        """Следующий значимый символ (пропуская пробелы) или "" в конце потока."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Invalid JSON stream: expected one of {chars!r}, got {char!r} at {self.pos}")
+        self.pos += 1
+        return char
+
+    def _may_continue(self, value, end: int) -> bool:
+        tail = self.text[end:]
+        if not tail:
+            return True
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        return is_number and all(char in _NUMBER_CHARS for char in tail)
+
+    def value(self):
+        """Разбирает одно JSON-значение, догружая поток, пока значение не будет полным."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+                # Значение, упёршееся в конец буфера, может быть обрезано ("12" из "12.5", "2" из "2e3"),
+                # как и число, за которым в буфере только его незаконченный хвост ("12." или "2e-") -
+                # дочитываем, пока после значения не появится другой символ или поток не кончится
+                if self.exhausted or not self._may_continue(value, end):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            self.read_more()
+
+
+def _iter_chunks(response, chunk_size: int):
+    """
+    Куски ответа по мере поступления из сети.
+    iter_content(chunk_size) ждёт, пока наберётся весь кусок, а read1 отдаёт то, что уже пришло,
+    поэтому первый элемент доступен до окончания загрузки.
+    """
+    raw = response.raw
+    if hasattr(raw, "read1"):
+        while True:
+            chunk = raw.read1(chunk_size, decode_content=True)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from response.iter_content(chunk_size=chunk_size)
+
+
+def iter_json_array(response, key: str, chunk_size: int = 64 * 1024):
+    """
+    Потоково отдаёт элементы массива response_json[key] по одному, не загружая весь ответ в память.
+    Ответ должен быть получен с stream=True (send_request(..., stream=True)).
+    :param response: Объект requests.Response.
+    :param key: Ключ массива в корневом объекте, например "movies".
+    :param chunk_size: Размер читаемого куска ответа в байтах.
+    """
+    stream = _StreamBuffer(_iter_chunks(response, chunk_size))
+    try:
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name != key:
+                stream.value()
+            else:
+                stream.expect("[")
+                if stream.peek() == "]":
+                    return
+                while True:
+                    yield stream.value()
+                    if stream.expect(",]") == "]":
+                        return
+            if stream.expect(",}") == "}":
+                return
+    finally:
+        response.close()
@@ -0,0 +1,74 @@
+import re
+from collections import defaultdict
+from functools import lru_cache
+
+from utils.stats import percentile
+
+# Сегменты пути, которые являются идентификаторами: числа, UUID, email (UserAPI принимает id или email)
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27}|[^/]+@[^/]+)$")
+
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Приводит эндпоинт к шаблону: "/movies/42" -> "/movies/{id}", "/confirm?token=x" -> "/confirm"
+    """
+    path = endpoint.split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class LatencyRecorder:
+    """
+    Сборщик времени ответа запросов, сгруппированных по (метод, базовый URL, шаблон эндпоинта).
+    На горячем пути только добавление float в список, перцентили считаются в конце сессии.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.samples = defaultdict(list)
+
+    def record(self, method: str, base_url: str, endpoint: str, elapsed: float):
+        """
+        :param method: HTTP метод.
+        :param base_url: Базовый URL API.
+        :param endpoint: Эндпоинт как он был передан в send_request.
+        :param elapsed: Время запроса в секундах.
+        """
+        if self.enabled:
+            self.samples[(method.upper(), base_url, normalize_endpoint(endpoint))].append(elapsed)
+
+    def summary(self) -> list:
+        """
+        Гистограммы по эндпоинтам (в миллисекундах), отсортированные по убыванию p95.
+        """
+        rows = []
+        for (method, base_url, endpoint), values in list(self.samples.items()):
+            ordered = sorted(values)
+            rows.append({
+                "method": method,
+                "base_url": base_url,
+                "endpoint": endpoint,
+                "count": len(ordered),
+                "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+                "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+                "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2),
+            })
+        return sorted(rows, key=lambda row: row["p95_ms"], reverse=True)
+
+    def export(self) -> list:
+        """Сырые замеры в виде [метод, базовый URL, эндпоинт, [секунды...]] - для передачи между процессами."""
+        return [[method, base_url, endpoint, list(values)]
+                for (method, base_url, endpoint), values in list(self.samples.items())]
+
+    def merge(self, exported: list):
+        """Добавляет замеры, выгруженные export() другого процесса (воркера xdist)."""
+        for method, base_url, endpoint, values in exported:
+            self.samples[(method, base_url, endpoint)].extend(values)
+
+    def reset(self):
+        self.samples.clear()
+
+
+# Общий сборщик процесса; вывод отчёта - плагин plugins.latency
+latency_recorder = LatencyRecorder()
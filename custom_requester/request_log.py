@@ -0,0 +1,145 @@
+import random
+import threading
+from collections import deque
+
+import allure
+
+from constants.constants import GREEN, RESET, RED
+
+
+def format_curl(response, current_test: str, colored: bool = True) -> str:
+    """
+    Преобразует запрос в curl-like вид (-H хэдэры), (-d тело)
+    :param response: Объект ответа requests.Response или httpx.Response
+    :param current_test: Значение PYTEST_CURRENT_TEST на момент запроса
+    :param colored: Подсвечивать имя теста ANSI-цветом (для консоли)
+    """
+    request = response.request
+    headers = " \\\n".join([f"-H '{header}: {value}'" for header, value in request.headers.items()])
+    full_test_name = f"pytest {current_test.replace(' (call)', '')}"
+
+    body = ""
+    # requests хранит тело в request.body, httpx (AsyncCustomRequester) - в request.content
+    request_body = getattr(request, 'body', None)
+    if request_body is None:
+        request_body = getattr(request, 'content', None)
+    if request_body is not None:
+        if isinstance(request_body, bytes):
+            body = request_body.decode('utf-8')
+        elif isinstance(request_body, str):
+            body = request_body
+        body = f"-d '{body}' \n" if body not in ('{}', '') else ''
+
+    test_line = f"{GREEN}{full_test_name}{RESET}" if colored else full_test_name
+    return (
+        f"{test_line}\n"
+        f"curl -X {request.method} '{request.url}' \\\n"
+        f"{headers} \\\n"
+        f"{body}"
+    )
+
+
+def format_response(response, colored: bool = True) -> str:
+    """
+    Форматирует статус и тело неуспешного ответа
+    :param response: Объект ответа requests.Response или httpx.Response
+    :param colored: Подсвечивать статус и тело ANSI-цветом (для консоли)
+    """
+    red, reset = (RED, RESET) if colored else ("", "")
+    return (f"\tRESPONSE:"
+            f"\nSTATUS_CODE: {red}{response.status_code}{reset}"
+            f"\nDATA: {red}{response.text}{reset}")
+
+
+def test_nodeid(current_test: str) -> str:
+    """nodeid теста из PYTEST_CURRENT_TEST ("tests/x.py::test_y (call)" -> "tests/x.py::test_y")."""
+    return current_test.rsplit(" (", 1)[0]
+
+
+class RequestLogBuffer:
+    """
+    Буфер логирования запросов.
+    В режиме eager каждый запрос сразу форматируется в curl и пишется в лог (поведение по умолчанию).
+    В режиме lazy сохраняются только ссылки на ответы - в отдельном кольцевом буфере на каждый тест (nodeid),
+    а форматирование происходит при падении теста или при срабатывании сэмплинга.
+    """
+    EAGER = "eager"
+    LAZY = "lazy"
+
+    def __init__(self, mode=EAGER, capacity=50, sample_rate=0.0):
+        self._lock = threading.Lock()
+        self.configure(mode, capacity, sample_rate)
+
+    def configure(self, mode=EAGER, capacity=50, sample_rate=0.0):
+        """
+        :param mode: eager или lazy.
+        :param capacity: Сколько последних запросов теста хранить в lazy-режиме.
+        :param sample_rate: Доля запросов (0..1), которые форматируются сразу даже в lazy-режиме.
+        """
+        if mode not in (self.EAGER, self.LAZY):
+            raise ValueError(f"Unknown request log mode: {mode}")
+        self.mode = mode
+        self.capacity = capacity
+        self.sample_rate = sample_rate
+        with self._lock:
+            self.buffers = {}  # nodeid -> deque([response, current_test, уже записан в лог])
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.mode == self.LAZY
+
+    def record(self, response, current_test: str, written=False):
+        """
+        Сохраняет сырые данные запроса без форматирования в буфер теста из current_test.
+        :param written: Запрос уже записан в лог (сэмплинг) - при падении теста повторно не выводится.
+        """
+        nodeid = test_nodeid(current_test)
+        with self._lock:
+            entries = self.buffers.get(nodeid)
+            if entries is None:
+                entries = self.buffers[nodeid] = deque(maxlen=self.capacity)
+            entries.append((response, current_test, written))
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def write(self, logger, response, current_test: str, attach=False):
+        """
+        Форматирует запрос (и тело ответа, если он неуспешный), пишет в лог и при необходимости в Allure.
+        """
+        try:
+            is_success = response.status_code < 400  # то же, что response.ok, но работает и для httpx
+            logger.info(format_curl(response, current_test))
+            if not is_success:
+                logger.info(format_response(response))
+            if attach:
+                text = format_curl(response, current_test, colored=False)
+                if not is_success:
+                    text = f"{text}\n{format_response(response, colored=False)}"
+                request = response.request
+                allure.attach(text, name=f"{request.method} {request.url}",
+                              attachment_type=allure.attachment_type.TEXT)
+        except Exception as e:
+            logger.info(f"\nLogging went wrong: {type(e)} - {e}")
+
+    def reset(self, nodeid: str):
+        """Удаляет буфер теста (перед его началом и после завершения)."""
+        with self._lock:
+            self.buffers.pop(nodeid, None)
+
+    def flush(self, logger, nodeid: str, attach=True) -> int:
+        """
+        Форматирует и выводит накопленные запросы теста nodeid, очищая его буфер.
+        Запросы, уже записанные в лог по сэмплингу, пропускаются.
+        :return: Количество выведенных записей.
+        """
+        with self._lock:
+            entries = list(self.buffers.pop(nodeid, ()))
+        pending = [(response, current_test) for response, current_test, written in entries if not written]
+        for response, current_test in pending:
+            self.write(logger, response, current_test, attach=attach)
+        return len(pending)
+
+
+# Общий буфер процесса; режим настраивается плагином plugins.request_logging
+request_log = RequestLogBuffer()
@@ -0,0 +1,199 @@
+import asyncio
+import random
+import threading
+import time
+
+import httpx
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from custom_requester.deadline import test_deadline
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# Статусы "хост прилёг", при которых есть смысл повторить запрос и считать сбой для circuit breaker
+RETRYABLE_STATUSES = {502, 503, 504}
+# Сбои транспорта requests (CustomRequester) и httpx (AsyncCustomRequester): ответа нет, хост мог прилечь
+TRANSPORT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, httpx.TransportError)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Хост признан недоступным: запрос не отправляется, тест падает сразу."""
+
+
+def is_connect_error(exc: Exception) -> bool:
+    """Ошибка на этапе соединения - запрос точно не дошёл до сервера, повтор безопасен для любого метода."""
+    if isinstance(exc, (requests.exceptions.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    if isinstance(exc, requests.exceptions.ConnectionError) and exc.args:
+        return isinstance(getattr(exc.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+class RetryPolicy:
+    """
+    Повторы с экспоненциальной задержкой и полным джиттером.
+    Общий бюджет повторов на сессию не даёт лежащему хосту умножить время прогона на число повторов.
+    """
+
+    def __init__(self, retries=2, backoff_base=0.2, backoff_max=5.0, budget=50):
+        """
+        :param retries: Максимум повторов одного запроса.
+        :param backoff_base: Базовая задержка, секунды (attempt 0 -> до base, 1 -> до 2*base, ...).
+        :param backoff_max: Максимальная задержка, секунды.
+        :param budget: Максимум повторов на всю сессию.
+        """
+        self.configure(retries, backoff_base, backoff_max, budget)
+        self._lock = threading.Lock()
+
+    def configure(self, retries=2, backoff_base=0.2, backoff_max=5.0, budget=50):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget
+        self.retries_used = 0
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def should_retry(self, method: str, attempt: int, exc: Exception = None, status: int = None) -> bool:
+        """
+        :param method: HTTP метод.
+        :param attempt: Номер уже выполненного повтора (0 - первая попытка).
+        :param exc: Исключение requests или httpx, если запрос упал.
+        :param status: Статус ответа, если ответ получен.
+        """
+        if attempt >= self.retries:
+            return False
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if exc is not None:
+            retryable = is_connect_error(exc) or (idempotent and isinstance(exc, TRANSPORT_ERRORS))
+        else:
+            retryable = idempotent and status in RETRYABLE_STATUSES
+        if not retryable:
+            return False
+        with self._lock:
+            if self.retries_used >= self.budget:
+                return False
+            self.retries_used += 1
+        return True
+
+    def sleep(self, attempt: int) -> bool:
+        """
+        Ждёт перед повтором. Если до дедлайна теста не хватает времени - не ждёт.
+        :return: True, если повтор имеет смысл.
+        """
+        delay = self._delay(attempt)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    async def async_sleep(self, attempt: int) -> bool:
+        """Как sleep, но не блокирует event loop (для AsyncCustomRequester)."""
+        delay = self._delay(attempt)
+        if delay is None:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    def _delay(self, attempt: int):
+        """Задержка перед повтором или None, если до дедлайна теста она не укладывается."""
+        delay = self.backoff(attempt)
+        remaining = test_deadline.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker одного хоста.
+    После failure_threshold сбоев подряд хост считается лежащим (OPEN) и запросы падают сразу.
+    Через reset_timeout пропускается один пробный запрос (HALF_OPEN): успех закрывает цепь, сбой - снова открывает.
+    Пока пробный запрос не завершился, остальные запросы к хосту отклоняются.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold=5, reset_timeout=30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self, method: str, url: str):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                # Предыдущая проба завершилась без вердикта (release_trial) - пропускаем следующую
+                self._trial_in_flight = True
+                return
+            if self.state == self.HALF_OPEN:
+                reason = "trial request in flight"
+            else:
+                reason = f"retry in {self.reset_timeout - (time.monotonic() - self.opened_at):.1f}s"
+        raise CircuitOpenError(
+            f"Circuit for {self.host} is {self.state} after {self.failures} consecutive failures, "
+            f"{method} {url} not sent ({reason})"
+        )
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """
+        Запрос завершился, ничего не сказав о здоровье хоста (упёрся в дедлайн теста, упал на нашей стороне).
+        Состояние не меняется, но в HALF_OPEN следующий запрос снова может стать пробным.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """Circuit breaker на каждый хост."""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.configure(failure_threshold, reset_timeout)
+        self._lock = threading.Lock()
+
+    def configure(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(
+                    host, CircuitBreaker(host, self.failure_threshold, self.reset_timeout))
+        return breaker
+
+
+# Общие для процесса политика повторов и реестр circuit breaker'ов; настраиваются плагином plugins.resilience
+retry_policy = RetryPolicy()
+circuit_breakers = CircuitBreakerRegistry()
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+
+class ResponseCache:
+    """
+    LRU+TTL кэш ответов на GET-запросы, явно помеченные как кэшируемые (send_request(cacheable=True)).
+    Ключ - (URL, query-параметры, авторизационный заголовок, cookies), чтобы разные пользователи
+    не видели ответы друг друга. Изменяющие запросы сбрасывают все записи своего ресурса.
+    """
+
+    def __init__(self, maxsize=512, ttl=60.0):
+        """
+        :param maxsize: Максимум хранимых ответов.
+        :param ttl: Время жизни записи в секундах.
+        """
+        self.enabled = False
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, enabled=False, maxsize=512, ttl=60.0):
+        self.enabled = enabled
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clear()
+
+    @staticmethod
+    def make_key(url: str, params, identity, cookies=None) -> tuple:
+        """
+        :param url: Полный URL запроса.
+        :param params: Query-параметры (dict, список пар или None).
+        :param identity: Значение заголовка authorization сессии (None для анонимных запросов).
+        :param cookies: Cookies сессии (RequestsCookieJar или dict) - тоже часть личности пользователя.
+        """
+        items = params.items() if isinstance(params, dict) else (params or ())
+        frozen_params = tuple(sorted((str(k), str(v)) for k, v in items))
+        cookie_items = cookies.items() if cookies is not None else ()
+        frozen_cookies = tuple(sorted((str(k), str(v)) for k, v in cookie_items))
+        return url, frozen_params, identity, frozen_cookies
+
+    def get(self, key, expected_status=None):
+        """
+        :param key: Ключ из make_key.
+        :param expected_status: Если статус закэшированного ответа другой - считаем промахом
+                                и идём в сеть (данные могли измениться в обход клиента).
+        :return: Закэшированный requests.Response или None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is None or entry[0] < time.monotonic()
+                    or (expected_status is not None and entry[1].status_code != expected_status)):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, response):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> int:
+        """
+        Сбрасывает все записи ресурса, которого коснулся изменяющий запрос.
+        "PATCH https://host/movies/5" сбрасывает и "/movies/5", и списки "/movies?..." - у всех пользователей.
+        :param url: Полный URL изменяющего запроса.
+        :return: Количество удалённых записей.
+        """
+        parts = urlsplit(url)
+        resource = parts.path.strip("/").split("/", 1)[0]
+        prefix = f"{parts.scheme}://{parts.netloc}/{resource}"
+        with self._lock:
+            stale = [key for key in self._entries
+                     if key[0] == prefix or key[0].startswith(f"{prefix}/") or key[0].startswith(f"{prefix}?")]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Общий кэш процесса; по умолчанию выключен, включается плагином plugins.response_cache
+response_cache = ResponseCache()
@@ -0,0 +1,48 @@
+import datetime
+import json
+from enum import Enum
+
+from pydantic import BaseModel
+
+try:
+    # Необязательный быстрый бэкенд: используется, если установлен (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _default(value):
+    """Сериализация типов, которые стандартный json не знает (Roles, даты)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """
+    Сериализует данные в JSON-байты за один проход.
+    :param data: dict, list или любое другое JSON-совместимое значение.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def serialize_body(data):
+    """
+    Готовит тело запроса в виде байт, чтобы requests/httpx не сериализовали его повторно.
+    Pydantic-модели сериализуются самим pydantic (exclude_unset, как и раньше), остальное - через dumps.
+    :param data: Тело запроса: BaseModel, dict, list, bytes или None.
+    :return: bytes или None, если тела нет.
+    """
+    if data is None:
+        return None
+    if isinstance(data, BaseModel):
+        return data.model_dump_json(exclude_unset=True).encode("utf-8")
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    return dumps(data)
@@ -0,0 +1,87 @@
+from db_requester.db_helpers import BULK_BATCH_SIZE, DBHelper
+
+# Поле ответа /movies -> (колонка MovieDBModel, приведение значения перед сравнением)
+MOVIE_FIELD_MAP = {
+    "name": ("name", None),
+    "price": ("price", None),
+    "description": ("description", None),
+    "imageUrl": ("image_url", None),
+    "location": ("location", None),
+    "published": ("published", None),
+    "rating": ("rating", None),
+    "genreId": ("genre_id", str),  # в API число, в БД колонка String
+}
+
+
+class MovieMismatch:
+    """Расхождение одного поля фильма между API и БД (db_value None и field "id" - фильма нет в БД)."""
+
+    def __init__(self, movie_id, field: str, api_value, db_value):
+        self.movie_id = movie_id
+        self.field = field
+        self.api_value = api_value
+        self.db_value = db_value
+
+    def __str__(self):
+        if self.field == "id":
+            return f"movie {self.movie_id}: missing in DB"
+        return f"movie {self.movie_id}: {self.field} api={self.api_value!r} db={self.db_value!r}"
+
+
+class MovieConsistencyVerifier:
+    """
+    Сверка фильмов из ответов /movies с таблицей movies.
+    Строки БД для всех фильмов выборки берутся запросами WHERE id IN (...) по batch_size id,
+    поэтому тысячи фильмов сверяются за несколько запросов, а не по одному на фильм.
+    """
+
+    def __init__(self, db_helper: DBHelper, fields=None, batch_size=BULK_BATCH_SIZE):
+        """
+        :param db_helper: DBHelper с сессией БД.
+        :param fields: Какие поля ответа сверять (по умолчанию все из MOVIE_FIELD_MAP).
+        :param batch_size: id в одном SELECT ... IN (...).
+        """
+        self.db_helper = db_helper
+        self.fields = list(fields or MOVIE_FIELD_MAP)
+        self.batch_size = batch_size
+        self.checked = 0
+
+    def compare(self, api_movies) -> list:
+        """
+        Сравнивает фильмы из API с БД поле за полем.
+        :param api_movies: Итерируемое фильмов в формате ответа /movies (список, MoviesPageIterator).
+        :return: Список MovieMismatch (пустой - расхождений нет).
+        """
+        api_movies = list(api_movies)
+        db_movies = self.db_helper.get_movies_by_ids([movie["id"] for movie in api_movies], self.batch_size)
+        mismatches = []
+        for api_movie in api_movies:
+            db_movie = db_movies.get(int(api_movie["id"]))
+            if db_movie is None:
+                mismatches.append(MovieMismatch(api_movie["id"], "id", api_movie["id"], None))
+                continue
+            for field in self.fields:
+                column, cast = MOVIE_FIELD_MAP[field]
+                api_value, db_value = api_movie.get(field), getattr(db_movie, column)
+                if cast is not None:
+                    api_value = None if api_value is None else cast(api_value)
+                    db_value = None if db_value is None else cast(db_value)
+                if api_value != db_value:
+                    mismatches.append(MovieMismatch(api_movie["id"], field, api_value, db_value))
+        self.checked += len(api_movies)
+        return mismatches
+
+    def assert_consistent(self, api_movies):
+        """Падает с AssertionError, перечисляя все расхождения сразу, а не только первое."""
+        mismatches = self.compare(api_movies)
+        if mismatches:
+            details = "\n".join(f"  {mismatch}" for mismatch in mismatches)
+            raise AssertionError(f"{len(mismatches)} API/DB mismatches in movies:\n{details}")
+
+    def verify_catalog(self, movies_api, params=None):
+        """
+        Выгружает выборку /movies целиком (MoviesAPI.iter_movies) и сверяет её с БД.
+        :param movies_api: MoviesAPI.
+        :param params: Фильтры /movies (pageSize, minPrice, locations и т.д.).
+        """
+        self.assert_consistent(movies_api.iter_movies(params=params))
@@ -1,6 +1,9 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+from contextlib import contextmanager
 
+from sqlalchemy.orm import Session, sessionmaker
+
+from db_requester.engine_factory import EngineSettings, PoolStats, build_engine
 from resources.db_creds import DbCreds
 
 USERNAME = DbCreds.USER
@@ -8,17 +11,62 @@ PASSWORD = DbCreds.PASSWORD
 HOST = DbCreds.HOST
 PORT = DbCreds.PORT
 DATABASE_NAME = DbCreds.DBNAME
+DATABASE_URL = f"postgresql+psycopg2://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE_NAME}"
+
+# Настройки пула (меняются плагином plugins.db_pool до первого обращения к БД) и счётчики пула процесса
+engine_settings = EngineSettings()
+pool_stats = PoolStats()
+_engine = None
+_engine_lock = threading.Lock()
+
+#  создаем фабрику сессий; движок подставляется при создании сессии
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def configure_engine(settings: EngineSettings):
+    """Задаёт настройки пула. Действует, если движок ещё не создан."""
+    global engine_settings
+    engine_settings = settings
+
 
-#  движок для подключения к базе данных
-engine = create_engine(
-    f"postgresql+psycopg2://{USERNAME}:{PASSWORD}@{HOST}:{PORT}/{DATABASE_NAME}",
-    echo=False  # Установить True для отладки SQL запросов
-)
+def get_engine():
+    """Движок процесса; создаётся при первом обращении"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = build_engine(DATABASE_URL, engine_settings, pool_stats)
+    return _engine
 
-#  создаем фабрику сессий
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def engine_created() -> bool:
+    return _engine is not None
+
+
+def dispose_engine():
+    """Закрывает соединения пула (в конце прогона)"""
+    if _engine is not None:
+        _engine.dispose()
 
 
 def get_db_session():
     """Создает новую сессию БД"""
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal(bind=get_engine())
+
+
+@contextmanager
+def isolated_db_session():
+    """
+    Сессия внутри внешней транзакции, которая откатывается при выходе.
+    commit() в такой сессии только освобождает SAVEPOINT, поэтому тест видит свои данные,
+    но в базе после него ничего не остаётся. Данные не видны другим соединениям (в т.ч. API сервиса).
+    """
+    connection = get_engine().connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
@@ -1,7 +1,14 @@
+import csv
+import io
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, text
 from sqlalchemy.orm import Session
 from db_models.user import UserDBModel
 from db_models.movie import MovieDBModel
 
+BULK_BATCH_SIZE = 1000  # строк в одном INSERT ... VALUES (...), (...) / DELETE ... IN (...)
+
 
 class DBHelper:
     def __init__(self, db_session: Session):
@@ -49,6 +56,22 @@ class DBHelper:
         """Получает фильм по ID"""
         return self.db_session.query(MovieDBModel).filter(MovieDBModel.id == movie_id).first()
 
+    def get_movies_by_ids(self, movie_ids: list, batch_size=BULK_BATCH_SIZE) -> dict:
+        """
+        Получает фильмы по списку ID запросами SELECT ... WHERE id IN (...)
+        :param movie_ids: Список id
+        :param batch_size: id в одном запросе
+        :return: Словарь id -> MovieDBModel (отсутствующих в БД id в нём нет)
+        """
+        ids = list(dict.fromkeys(int(movie_id) for movie_id in movie_ids))
+        movies = {}
+        for start in range(0, len(ids), batch_size):
+            # populate_existing: уже загруженные сессией фильмы перечитываются из БД, а не берутся из identity map
+            for movie in self.db_session.query(MovieDBModel).execution_options(populate_existing=True).filter(
+                    MovieDBModel.id.in_(ids[start:start + batch_size])):
+                movies[movie.id] = movie
+        return movies
+
     def create_movie_in_db(self, movie_data: dict):
         """ Создание фильма в БД """
         movie = MovieDBModel(**movie_data)
@@ -61,6 +84,102 @@ class DBHelper:
         self.db_session.delete(movie)
         self.db_session.commit()
 
+    def bulk_create_users(self, users_data: list, use_copy=False, batch_size=BULK_BATCH_SIZE) -> list:
+        """
+        Массовое создание пользователей одной транзакцией
+        :param users_data: Список словарей как у DataGenerator.generate_user_data (id генерируется, если его нет)
+        :param use_copy: Загрузить через PostgreSQL COPY вместо многострочных INSERT
+        :param batch_size: Строк в одном INSERT
+        :return: Список id в порядке users_data
+        """
+        rows = [{**user_data, "id": user_data.get("id") or str(uuid4())} for user_data in users_data]
+        if use_copy:
+            self._copy_rows(UserDBModel, rows)
+            self.db_session.commit()
+            return [row["id"] for row in rows]
+        return self._bulk_insert(UserDBModel, rows, batch_size)
+
+    def bulk_create_movies(self, movies_data: list, use_copy=False, batch_size=BULK_BATCH_SIZE) -> list:
+        """
+        Массовое создание фильмов одной транзакцией
+        :param movies_data: Список словарей как у фикстуры movie_data_db
+        :param use_copy: Загрузить через PostgreSQL COPY вместо многострочных INSERT
+        :param batch_size: Строк в одном INSERT
+        :return: Список сгенерированных id в порядке movies_data
+        """
+        if not use_copy:
+            return self._bulk_insert(MovieDBModel, movies_data, batch_size)
+        # COPY не умеет RETURNING - заранее берём id из последовательности одним запросом
+        ids = list(self.db_session.scalars(
+            text("SELECT nextval(pg_get_serial_sequence('movies', 'id')) FROM generate_series(1, :count)"),
+            {"count": len(movies_data)},
+        ))
+        rows = [{**movie_data, "id": movie_id} for movie_data, movie_id in zip(movies_data, ids)]
+        self._copy_rows(MovieDBModel, rows)
+        self.db_session.commit()
+        return ids
+
+    def bulk_delete(self, model, ids: list, batch_size=BULK_BATCH_SIZE, commit=True) -> int:
+        """
+        Удаление записей по списку id (DELETE ... WHERE id IN (...)) одной транзакцией
+        :param model: UserDBModel, MovieDBModel и т.д.
+        :param ids: Список id
+        :param batch_size: id в одном DELETE
+        :param commit: False - оставить транзакцию открытой, чтобы закоммитить вместе с удалениями из других таблиц
+        :return: Количество удалённых строк
+        """
+        deleted = 0
+        for start in range(0, len(ids), batch_size):
+            result = self.db_session.execute(
+                delete(model).where(model.id.in_(ids[start:start + batch_size])),
+                execution_options={"synchronize_session": False},
+            )
+            deleted += result.rowcount
+        if commit:
+            self.db_session.commit()
+        return deleted
+
+    def delete_users_by_email_prefix(self, email_prefix: str, commit=True) -> int:
+        """
+        Удаление пользователей, чей email начинается с email_prefix (пространство имён воркера)
+        :param commit: False - оставить транзакцию открытой (см. bulk_delete)
+        :return: Количество удалённых строк
+        """
+        result = self.db_session.execute(
+            delete(UserDBModel).where(UserDBModel.email.startswith(email_prefix, autoescape=True)),
+            execution_options={"synchronize_session": False},
+        )
+        if commit:
+            self.db_session.commit()
+        return result.rowcount
+
+    def _bulk_insert(self, model, rows: list, batch_size: int) -> list:
+        """INSERT ... VALUES (...), (...) RETURNING id пачками по batch_size строк."""
+        statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+        ids = []
+        for start in range(0, len(rows), batch_size):
+            ids.extend(self.db_session.scalars(statement, rows[start:start + batch_size]))
+        self.db_session.commit()
+        return ids
+
+    def _copy_rows(self, model, rows: list):
+        """COPY ... FROM STDIN в текущей транзакции сессии (psycopg2)."""
+        if not rows:
+            return
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([r"\N" if row.get(column) is None else row.get(column) for column in columns])
+        buffer.seek(0)
+        column_list = ", ".join(f'"{model.__table__.columns[column].name}"' for column in columns)
+        cursor = self.db_session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {model.__tablename__} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
+        finally:
+            cursor.close()
+
 '''
 Пример хелпера для movies
 def get_movie_by_id(self, movie_id: str):
@@ -0,0 +1,162 @@
+import threading
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from utils.stats import percentile
+
+
+class EngineSettings:
+    """Настройки движка и пула соединений."""
+
+    def __init__(self, pool_size=5, max_overflow=10, pool_timeout=30.0, pool_recycle=1800, pre_ping=True,
+                 statement_timeout_ms=None, echo=False):
+        """
+        :param pool_size: Сколько соединений пул держит открытыми.
+        :param max_overflow: Сколько соединений можно открыть сверх pool_size при пиковой нагрузке.
+        :param pool_timeout: Сколько секунд ждать свободное соединение, прежде чем упасть с TimeoutError.
+        :param pool_recycle: Через сколько секунд переоткрывать соединение (-1 - никогда).
+        :param pre_ping: Проверять соединение перед выдачей (отсекает оборванные сервером).
+        :param statement_timeout_ms: statement_timeout PostgreSQL для сессий пула, миллисекунды (None - без лимита).
+        :param echo: Логировать SQL-запросы.
+        """
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pre_ping = pre_ping
+        self.statement_timeout_ms = statement_timeout_ms
+        self.echo = echo
+
+
+class PoolStats:
+    """
+    Счётчики пула соединений за прогон: выдачи, ожидание свободного соединения,
+    открытие/закрытие соединений (churn) и пиковое число одновременно занятых.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkins = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidated = 0
+        self.timeouts = 0
+        self.waits = []  # время получения соединения из пула, секунды
+        self._lock = threading.Lock()
+
+    def record_wait(self, elapsed: float, timed_out=False):
+        with self._lock:
+            self.waits.append(elapsed)
+            if timed_out:
+                self.timeouts += 1
+
+    def on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connections_opened += 1
+
+    def on_close(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connections_closed += 1
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidated += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.waits)
+        return {
+            "checkouts": self.checkouts,
+            "peak_checked_out": self.peak_checked_out,
+            "connections_opened": self.connections_opened,
+            "connections_closed": self.connections_closed,
+            "invalidated": self.invalidated,
+            "timeouts": self.timeouts,
+            "wait_total_ms": round(sum(ordered) * 1000, 2),
+            "wait_p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "wait_max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool, замеряющий время получения соединения (_do_get): ожидание свободного соединения
+    при исчерпанном пуле плюс открытие нового, если пул растёт. Счётчики пишутся в self.stats.
+    """
+    stats: PoolStats = None
+    _local = threading.local()
+
+    def _do_get(self):
+        # QueuePool._do_get может вызывать себя рекурсивно - замеряем только внешний вызов
+        if getattr(self._local, "measuring", False):
+            return super()._do_get()
+        self._local.measuring = True
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            # Пул исчерпан и свободное соединение не дождались за pool_timeout
+            self._record_wait(started, timed_out=True)
+            raise
+        finally:
+            self._local.measuring = False
+        # Прочие ошибки (БД недоступна, неверный пароль) пробрасываются без записи - это не ожидание пула
+        self._record_wait(started)
+        return connection
+
+    def _record_wait(self, started: float, timed_out=False):
+        if self.stats is not None:
+            self.stats.record_wait(time.perf_counter() - started, timed_out)
+
+    def recreate(self):
+        # engine.dispose() пересоздаёт пул - счётчики переходят в новый
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def build_engine(url: str, settings: EngineSettings = None, stats: PoolStats = None) -> Engine:
+    """
+    Создаёт движок с пулом InstrumentedQueuePool и подписывает stats на события пула.
+    :param url: URL подключения SQLAlchemy.
+    :param settings: EngineSettings; по умолчанию - значения EngineSettings().
+    :param stats: PoolStats для счётчиков; по умолчанию создаётся новый (доступен как engine.pool.stats).
+    """
+    settings = settings or EngineSettings()
+    connect_args = {}
+    if settings.statement_timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={int(settings.statement_timeout_ms)}"
+    engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pre_ping,
+        connect_args=connect_args,
+        echo=settings.echo,
+    )
+    stats = stats or PoolStats()
+    engine.pool.stats = stats
+    event.listen(engine, "connect", stats.on_connect)
+    event.listen(engine, "close", stats.on_close)
+    event.listen(engine, "invalidate", stats.on_invalidate)
+    event.listen(engine, "checkout", stats.on_checkout)
+    event.listen(engine, "checkin", stats.on_checkin)
+    return engine
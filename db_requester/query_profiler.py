@@ -0,0 +1,131 @@
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+# Имена SAVEPOINT содержат счётчик - без нормализации каждый попадал бы в отчёт отдельным запросом
+_SAVEPOINT_NAME = re.compile(r"\bsa_savepoint_\d+\b")
+
+
+class QueryCounter:
+    """Запросы, выполненные текущим потоком внутри блока QueryProfiler.count_queries."""
+
+    def __init__(self):
+        self.statements = []
+        self.thread_id = threading.get_ident()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+class StatementStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.tests = set()
+
+
+class QueryProfiler:
+    """
+    Профилировщик SQL на событиях before/after_cursor_execute всех движков SQLAlchemy.
+    Для каждого запроса пишет шаблон (SQL с плейсхолдерами), время и число строк,
+    с привязкой к текущему тесту (включая его фикстуры). Отчёт - топ запросов и тестов в конце сессии.
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.current_test = None
+        self.statements = defaultdict(StatementStats)  # шаблон SQL -> статистика
+        self.tests = defaultdict(lambda: {"queries": 0, "time": 0.0})  # nodeid -> запросы теста
+        self._counters = []
+        self._installed = False
+        self._lock = threading.Lock()
+
+    def install(self):
+        """Подписывается на события всех движков (в т.ч. созданных позже)."""
+        if self._installed:
+            return
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        self._installed = True
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        template = _SAVEPOINT_NAME.sub("sa_savepoint_N", _WHITESPACE.sub(" ", statement).strip())
+        if self._counters:
+            thread_id = threading.get_ident()
+            for counter in list(self._counters):
+                if counter.thread_id == thread_id:
+                    counter.statements.append(template)
+        if not self.enabled:
+            return
+        rows = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+        with self._lock:
+            stats = self.statements[template]
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            stats.rows += rows
+            if self.current_test is not None:
+                stats.tests.add(self.current_test)
+                test = self.tests[self.current_test]
+                test["queries"] += 1
+                test["time"] += elapsed
+
+    @contextmanager
+    def count_queries(self):
+        """Считает запросы текущего потока внутри блока: with profiler.count_queries() as counter: ..."""
+        self.install()
+        counter = QueryCounter()
+        self._counters.append(counter)
+        try:
+            yield counter
+        finally:
+            self._counters.remove(counter)
+
+    @contextmanager
+    def assert_max_queries(self, limit: int):
+        """
+        Падает, если блок выполнил больше limit SQL-запросов (ловит N+1 в хелперах).
+        :param limit: Максимально допустимое число запросов.
+        """
+        with self.count_queries() as counter:
+            yield counter
+        if counter.count > limit:
+            statements = "\n".join(f"  {index}. {statement}" for index, statement in enumerate(counter.statements, 1))
+            raise AssertionError(f"Expected at most {limit} SQL queries, got {counter.count}:\n{statements}")
+
+    def top_statements(self, limit=10) -> list:
+        """Запросы с наибольшим суммарным временем."""
+        rows = [{
+            "statement": template,
+            "count": stats.count,
+            "total_ms": round(stats.total * 1000, 2),
+            "avg_ms": round(stats.total / stats.count * 1000, 2),
+            "max_ms": round(stats.max * 1000, 2),
+            "rows": stats.rows,
+            "tests": len(stats.tests),
+        } for template, stats in list(self.statements.items())]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)[:limit]
+
+    def top_tests(self, limit=10) -> list:
+        """Тесты с наибольшим числом SQL-запросов."""
+        rows = [{"test": nodeid, "queries": data["queries"], "total_ms": round(data["time"] * 1000, 2)}
+                for nodeid, data in list(self.tests.items())]
+        return sorted(rows, key=lambda row: (row["queries"], row["total_ms"]), reverse=True)[:limit]
+
+
+# Общий профилировщик процесса; подключается плагином plugins.sql_profiler
+query_profiler = QueryProfiler()
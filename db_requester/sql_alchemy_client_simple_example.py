@@ -1,19 +1,10 @@
-from sqlalchemy import create_engine, Column, String, Boolean, DateTime, text
+from sqlalchemy import Column, String, Boolean, DateTime, text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from resources.db_creds import DbCreds
+from db_requester.db_client import get_engine
 
-# Подключение к базе данных
-host = DbCreds.HOST
-port = DbCreds.PORT
-database_name = DbCreds.DBNAME
-username = DbCreds.USER
-password = DbCreds.PASSWORD
-
-#формируем урл для подключения к базе
-connection_string = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database_name}"
-#обьект для подключения к базе данных
-engine = create_engine(connection_string)
+#обьект для подключения к базе данных - общий движок проекта (URL и настройки пула в db_client)
+engine = get_engine()
 
 
 def sdl_alchemy_SQL():
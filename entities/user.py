@@ -10,4 +10,24 @@ class User:
     @property
     def creds(self):
         """Возвращает кортеж (email, password)"""
-        return self.email, self.password
\ No newline at end of file
+        return self.email, self.password
+
+    @property
+    def id(self):
+        """id пользователя из ответа логина (доступен после authenticate)"""
+        return self.api.auth_api.user_id
+
+    @property
+    def profile(self) -> dict:
+        """Профиль пользователя из ответа логина"""
+        return self.api.auth_api.user_profile
+
+    @property
+    def claims(self) -> dict:
+        """Claims access-токена без проверки подписи (id, roles, exp)"""
+        return self.api.auth_api.token_claims
+
+    @property
+    def token_expires_at(self):
+        """Время истечения access-токена, unix timestamp"""
+        return self.api.auth_api.token_expires_at
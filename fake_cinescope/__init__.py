@@ -0,0 +1,2 @@
+from fake_cinescope.app import FakeCinescope, HTTPError, decode_jwt, encode_jwt
+from fake_cinescope.server import FakeCinescopeServer
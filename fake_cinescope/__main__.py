@@ -0,0 +1,40 @@
+"""
+Локальный fake-стенд Cinescope (auth + movies на одном порту).
+
+Запуск из корня проекта:
+    python -m fake_cinescope --port 8765 --latency 0.05 --fault-rate 0.01
+Тесты против него:
+    CINESCOPE_STAND=fake CINESCOPE_FAKE_PORT=8765 pytest --fake-external
+"""
+import argparse
+
+from constants.constants import FAKE_STAND_HOST, FAKE_STAND_PORT
+from fake_cinescope.app import FakeCinescope
+from fake_cinescope.server import FakeCinescopeServer
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fake_cinescope", description="Локальный fake-стенд Cinescope")
+    parser.add_argument("--host", default=FAKE_STAND_HOST)
+    parser.add_argument("--port", type=int, default=FAKE_STAND_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа, секунды")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Случайная добавка к задержке, секунды")
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Доля запросов, на которые отвечать 503")
+    parser.add_argument("--seed-movies", type=int, default=50, help="Сколько фильмов создать при старте")
+    args = parser.parse_args(argv)
+
+    app = FakeCinescope(FAKE_SUPER_ADMIN_CREDS, latency=args.latency, jitter=args.jitter,
+                        fault_rate=args.fault_rate, seed_movies=args.seed_movies)
+    server = FakeCinescopeServer(app, args.host, args.port)
+    print(f"Fake Cinescope on {server.base_url} (super admin: {FAKE_SUPER_ADMIN_CREDS[0]})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+import base64
+import hashlib
+import hmac
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.client import responses as HTTP_REASONS
+from urllib.parse import parse_qs
+
+from faker import Faker
+
+from constants.roles import Roles
+
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+LOCATIONS = ("MSK", "SPB")
+GENRES = {1: "Драма", 2: "Комедия", 3: "Фантастика", 4: "Криминал", 5: "Триллер",
+          6: "Аниме", 7: "Мюзикл", 8: "Фэнтези", 9: "Анимация", 10: "Документальный"}
+REFRESH_COOKIE = "refresh_token"
+# Секрет подписи общий для всех экземпляров: токен, полученный одним воркером, принимается любым fake-стендом
+JWT_SECRET = b"fake-cinescope-secret"
+
+
+class HTTPError(Exception):
+    """Ответ с ошибкой в формате сервиса: {"message", "error", "statusCode"}."""
+
+    def __init__(self, status: int, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def encode_jwt(payload: dict) -> str:
+    header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    body = _b64(json.dumps(payload).encode())
+    signature = hmac.new(JWT_SECRET, f"{header}.{body}".encode(), hashlib.sha256).digest()
+    return f"{header}.{body}.{_b64(signature)}"
+
+
+def decode_jwt(token: str):
+    """Payload токена с проверкой подписи и срока действия; None - если токен невалиден."""
+    try:
+        header, body, signature = token.split(".")
+        expected = _b64(hmac.new(JWT_SECRET, f"{header}.{body}".encode(), hashlib.sha256).digest())
+        if not hmac.compare_digest(signature, expected):
+            return None
+        payload = json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+    except (ValueError, AttributeError):
+        return None
+    return payload if payload.get("exp", 0) > time.time() else None
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakeCinescope:
+    """
+    WSGI-приложение, заменяющее auth- и movies-сервисы Cinescope для офлайн-прогонов.
+    Реализует эндпоинты, которые используют AuthAPI, UserAPI и MoviesAPI, с проверкой ролей
+    и теми же текстами ошибок, на которые опираются тесты. Состояние хранится в памяти процесса.
+    Права: фильмы создают и меняют ADMIN и SUPER_ADMIN, удаляет только SUPER_ADMIN;
+    пользователей через /user ведут ADMIN и SUPER_ADMIN, удаляет только SUPER_ADMIN.
+    """
+
+    def __init__(self, super_admin_creds: tuple, latency=0.0, jitter=0.0, fault_rate=0.0, fault_status=503,
+                 seed_movies=50, access_token_ttl=15 * 60, refresh_token_ttl=24 * 60 * 60, seed=None):
+        """
+        :param super_admin_creds: (email, password) пользователя SUPER_ADMIN, который создаётся при старте.
+        :param latency: Задержка каждого ответа, секунды.
+        :param jitter: Случайная добавка к задержке от 0 до jitter секунд.
+        :param fault_rate: Доля запросов (0..1), на которые отвечаем fault_status без обработки.
+        :param fault_status: Статус внедряемого сбоя.
+        :param seed_movies: Сколько фильмов создать при старте (для фильтров и пагинации).
+        :param access_token_ttl: Время жизни access-токена, секунды.
+        :param refresh_token_ttl: Время жизни refresh-токена, секунды.
+        :param seed: Seed генератора данных стенда. Генератор свой, а не DataGenerator тестов,
+                     поэтому данные стенда не сдвигают тестовые данные воркера.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.fault_rate = fault_rate
+        self.fault_status = fault_status
+        self.access_token_ttl = access_token_ttl
+        self.refresh_token_ttl = refresh_token_ttl
+        self._random = random.Random(seed)
+        self._faker = Faker()
+        self._faker.seed_instance(seed)
+        self.users = {}  # id -> пользователь (с паролем)
+        self.movies = {}  # id -> фильм
+        self.requests_served = 0
+        self.faults_injected = 0
+        self._next_movie_id = 1
+        self._lock = threading.RLock()
+        self._routes = [
+            ("POST", re.compile(r"^/register$"), self.register),
+            ("POST", re.compile(r"^/login$"), self.login),
+            ("GET", re.compile(r"^/logout$"), self.logout),
+            ("GET", re.compile(r"^/refresh-tokens$"), self.refresh_tokens),
+            ("GET", re.compile(r"^/confirm$"), self.confirm),
+            ("POST", re.compile(r"^/user$"), self.create_user),
+            ("GET", re.compile(r"^/user/(?P<locator>[^/]+)$"), self.get_user),
+            ("PATCH", re.compile(r"^/user/(?P<locator>[^/]+)$"), self.edit_user),
+            ("DELETE", re.compile(r"^/user/(?P<locator>[^/]+)$"), self.delete_user),
+            ("GET", re.compile(r"^/movies$"), self.list_movies),
+            ("POST", re.compile(r"^/movies$"), self.create_movie),
+            ("GET", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), self.get_movie),
+            ("PATCH", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), self.update_movie),
+            ("DELETE", re.compile(r"^/movies/(?P<movie_id>[^/]+)$"), self.delete_movie),
+        ]
+        email, password = super_admin_creds
+        # id SUPER_ADMIN детерминирован, чтобы токен из общего хранилища воркеров был валиден для любого стенда
+        self._add_user(email, "Super Admin", password, [Roles.SUPER_ADMIN.value], verified=True,
+                       user_id=str(uuid.uuid5(uuid.NAMESPACE_URL, email)))
+        for _ in range(seed_movies):
+            self._add_movie(self._random_movie())
+
+    # ------------------------------------------------------------------ WSGI
+
+    def __call__(self, environ, start_response):
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        with self._lock:
+            self.requests_served += 1
+        cookies = []
+        if self.fault_rate and self._random.random() < self.fault_rate:
+            with self._lock:
+                self.faults_injected += 1
+            status, body = self.fault_status, self._error_body(self.fault_status, "Injected fault")
+        else:
+            try:
+                status, body = self._dispatch(environ, cookies)
+            except HTTPError as e:
+                status, body = e.status, self._error_body(e.status, e.message)
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        headers = [("Content-Type", "application/json; charset=utf-8"), ("Content-Length", str(len(payload)))]
+        headers.extend(("Set-Cookie", cookie) for cookie in cookies)
+        start_response(f"{status} {HTTP_REASONS.get(status, '')}", headers)
+        return [payload]
+
+    @staticmethod
+    def _error_body(status: int, message) -> dict:
+        return {"message": message, "error": HTTP_REASONS.get(status, ""), "statusCode": status}
+
+    def _dispatch(self, environ, cookies: list):
+        method = environ["REQUEST_METHOD"].upper()
+        path = environ.get("PATH_INFO", "") or "/"
+        path_matched = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method == method:
+                request = _Request(environ, cookies)
+                with self._lock:
+                    return handler(request, **match.groupdict())
+        if path_matched:
+            raise HTTPError(405, "Method Not Allowed")
+        raise HTTPError(404, f"Cannot {method} {path}")
+
+    # ------------------------------------------------------------------ auth helpers
+
+    def _current_user(self, request, roles=None) -> dict:
+        """Пользователь из Bearer-токена; 401 без токена, 403 - если роли не подходят."""
+        authorization = request.headers.get("authorization", "")
+        payload = decode_jwt(authorization[7:]) if authorization.lower().startswith("bearer ") else None
+        user = self.users.get(payload["id"]) if payload and payload.get("type") == "access" else None
+        if user is None:
+            raise HTTPError(401, "Unauthorized")
+        if roles and not set(user["roles"]) & set(roles):
+            raise HTTPError(403, "Forbidden resource")
+        return user
+
+    def _issue_tokens(self, request, user: dict) -> dict:
+        now = int(time.time())
+        claims = {"id": user["id"], "email": user["email"], "roles": user["roles"], "iat": now}
+        access = encode_jwt({**claims, "type": "access", "exp": now + self.access_token_ttl,
+                             "jti": uuid.uuid4().hex})
+        refresh = encode_jwt({**claims, "type": "refresh", "exp": now + self.refresh_token_ttl,
+                              "jti": uuid.uuid4().hex})
+        request.set_cookie(REFRESH_COOKIE, refresh, self.refresh_token_ttl)
+        return {"user": self._public_user(user), "accessToken": access, "refreshToken": refresh,
+                "expiresIn": (now + self.access_token_ttl) * 1000}
+
+    @staticmethod
+    def _public_user(user: dict) -> dict:
+        return {key: value for key, value in user.items() if key != "password"}
+
+    def _add_user(self, email, full_name, password, roles, verified=False, banned=False, user_id=None) -> dict:
+        user = {
+            "id": user_id or str(uuid.uuid4()),
+            "email": email,
+            "fullName": full_name,
+            "password": password,
+            "verified": verified,
+            "banned": banned,
+            "roles": roles,
+            "createdAt": _now_iso(),
+        }
+        self.users[user["id"]] = user
+        return user
+
+    def _find_user(self, locator: str):
+        user = self.users.get(locator)
+        if user is None:
+            user = next((each for each in self.users.values() if each["email"] == locator), None)
+        return user
+
+    @staticmethod
+    def _validate_registration(data) -> list:
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Некорректное тело запроса")
+        errors = []
+        email = data.get("email")
+        if not isinstance(email, str) or not EMAIL_PATTERN.match(email):
+            # Сервис отдаёт "й" в разложенном виде (и + U+0306) - тесты сравнивают строку побайтно
+            errors.append("Некорректны\u0438\u0306 email")
+        full_name = data.get("fullName")
+        if not isinstance(full_name, str) or not full_name.strip():
+            errors.append("Имя пользователя не может быть пустым")
+        password = data.get("password")
+        if (not isinstance(password, str) or not 8 <= len(password) <= 20
+                or not re.search(r"[A-Z]", password) or not re.search(r"\d", password)):
+            errors.append("Пароль должен содержать от 8 до 20 символов, заглавную букву и цифру")
+        if "passwordRepeat" not in data:
+            errors.append("Поле passwordRepeat обязательно")
+        elif data.get("passwordRepeat") != password:
+            errors.append("Пароли не совпадают")
+        return errors
+
+    # ------------------------------------------------------------------ auth endpoints
+
+    def register(self, request):
+        data = request.json()
+        errors = self._validate_registration(data)
+        if errors:
+            raise HTTPError(400, errors[0] if len(errors) == 1 else errors)
+        if self._find_user(data["email"]) is not None:
+            raise HTTPError(409, "Пользователь с таким email уже зарегистрирован")
+        user = self._add_user(data["email"], data["fullName"], data["password"], [Roles.USER.value])
+        return 201, self._public_user(user)
+
+    def login(self, request):
+        data = request.json()
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Некорректное тело запроса")
+        user = self._find_user(str(data.get("email", "")))
+        if user is None or user["password"] != data.get("password"):
+            raise HTTPError(401, "Неверный логин или пароль")
+        if user["banned"]:
+            raise HTTPError(403, "Пользователь заблокирован")
+        return 200, self._issue_tokens(request, user)
+
+    def logout(self, request):
+        request.set_cookie(REFRESH_COOKIE, "", 0)
+        return 200, {"message": "OK"}
+
+    def refresh_tokens(self, request):
+        payload = decode_jwt(request.cookies.get(REFRESH_COOKIE, ""))
+        user = self.users.get(payload["id"]) if payload and payload.get("type") == "refresh" else None
+        if user is None:
+            raise HTTPError(401, "Unauthorized")
+        return 200, self._issue_tokens(request, user)
+
+    def confirm(self, request):
+        payload = decode_jwt(request.query_value("token") or "")
+        user = self.users.get(payload["id"]) if payload else None
+        if user is None:
+            raise HTTPError(400, "Некорректный токен подтверждения")
+        user["verified"] = True
+        return 200, {"message": "Email подтверждён"}
+
+    # ------------------------------------------------------------------ /user
+
+    def create_user(self, request):
+        self._current_user(request, roles=(Roles.ADMIN.value, Roles.SUPER_ADMIN.value))
+        data = request.json()
+        if isinstance(data, dict) and "passwordRepeat" not in data:
+            data = {**data, "passwordRepeat": data.get("password")}
+        errors = self._validate_registration(data)
+        if errors:
+            raise HTTPError(400, errors[0] if len(errors) == 1 else errors)
+        if self._find_user(data["email"]) is not None:
+            raise HTTPError(409, "Пользователь с таким email уже зарегистрирован")
+        user = self._add_user(data["email"], data["fullName"], data["password"],
+                              list(data.get("roles") or [Roles.USER.value]),
+                              verified=bool(data.get("verified")), banned=bool(data.get("banned")))
+        return 201, self._public_user(user)
+
+    def get_user(self, request, locator):
+        self._current_user(request, roles=(Roles.ADMIN.value, Roles.SUPER_ADMIN.value))
+        user = self._find_user(locator)
+        if user is None:
+            raise HTTPError(404, "Пользователь не найден")
+        return 200, self._public_user(user)
+
+    def edit_user(self, request, locator):
+        self._current_user(request, roles=(Roles.ADMIN.value, Roles.SUPER_ADMIN.value))
+        user = self._find_user(locator)
+        if user is None:
+            raise HTTPError(404, "Пользователь не найден")
+        data = request.json()
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Некорректное тело запроса")
+        for field in ("roles", "verified", "banned", "fullName"):
+            if field in data:
+                user[field] = data[field]
+        return 200, self._public_user(user)
+
+    def delete_user(self, request, locator):
+        self._current_user(request, roles=(Roles.SUPER_ADMIN.value,))
+        user = self._find_user(locator)
+        if user is None:
+            raise HTTPError(404, "Пользователь не найден")
+        del self.users[user["id"]]
+        return 200, self._public_user(user)
+
+    # ------------------------------------------------------------------ /movies
+
+    def _random_movie(self) -> dict:
+        return {
+            # id следующего фильма в названии - названия фильмов у сервиса уникальны
+            "name": f'{self._faker.sentence(nb_words=3).rstrip(".")} fake{self._next_movie_id}',
+            "imageUrl": self._faker.image_url(),
+            "price": self._random.randint(1, 1000),
+            "description": self._faker.paragraph(nb_sentences=3),
+            "location": self._random.choice(LOCATIONS),
+            "published": self._random.random() < 0.8,
+            "genreId": self._random.randint(1, 5),
+            "rating": self._random.randint(0, 5),
+        }
+
+    def _add_movie(self, data: dict) -> dict:
+        movie = {
+            "id": self._next_movie_id,
+            "name": data["name"],
+            "price": data["price"],
+            "description": data.get("description", ""),
+            "imageUrl": data.get("imageUrl"),
+            "location": data["location"],
+            "published": data["published"],
+            "genreId": data["genreId"],
+            "genre": {"name": GENRES.get(data["genreId"], "")},
+            "rating": data.get("rating", 0),
+            "createdAt": _now_iso(),
+        }
+        self._next_movie_id += 1
+        self.movies[movie["id"]] = movie
+        return movie
+
+    @staticmethod
+    def _validate_movie(data, partial=False) -> list:
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Некорректное тело запроса")
+        errors = []
+        if "name" in data or not partial:
+            if not data.get("name"):
+                errors.append("name should not be empty")
+            if not isinstance(data.get("name"), str):
+                errors.append("name must be a string")
+        if "price" in data or not partial:
+            if isinstance(data.get("price"), bool) or not isinstance(data.get("price"), (int, float)):
+                errors.append("Поле price должно быть числом")
+        if "description" in data or not partial:
+            if not isinstance(data.get("description"), str):
+                errors.append("description must be a string")
+        if "location" in data or not partial:
+            if data.get("location") not in LOCATIONS:
+                errors.append(f"location must be one of the following values: {', '.join(LOCATIONS)}")
+        if "published" in data or not partial:
+            if not isinstance(data.get("published"), bool):
+                errors.append("published must be a boolean value")
+        if "genreId" in data or not partial:
+            if isinstance(data.get("genreId"), bool) or not isinstance(data.get("genreId"), int):
+                errors.append("genreId must be a number")
+        return errors
+
+    def _get_movie_or_404(self, movie_id) -> dict:
+        movie = self.movies.get(int(movie_id)) if str(movie_id).isdigit() else None
+        if movie is None:
+            raise HTTPError(404, "Фильм не найден")
+        return movie
+
+    def list_movies(self, request):
+        page_size = request.query_int("pageSize", 10)
+        page = request.query_int("page", 1)
+        min_price = request.query_int("minPrice", 1)
+        max_price = request.query_int("maxPrice", 1000)
+        if not 1 <= page_size <= 20 or page < 1 or min_price < 0 or max_price < min_price:
+            raise HTTPError(400, "Некорректные параметры запроса")
+        locations = [location for value in request.query.get("locations", [])
+                     for location in value.split(",") if location]
+        published = request.query_value("published")
+        genre_id = request.query_value("genreId")
+        name = request.query_value("name")
+
+        movies = [movie for movie in self.movies.values()
+                  if min_price <= movie["price"] <= max_price
+                  and (not locations or movie["location"] in locations)
+                  and (published is None or movie["published"] == (published.lower() == "true"))
+                  and (genre_id is None or str(movie["genreId"]) == genre_id)
+                  and (name is None or name.lower() in movie["name"].lower())]
+        movies.sort(key=lambda movie: movie["id"], reverse=request.query_value("createdAt", "desc") != "asc")
+        count = len(movies)
+        return 200, {
+            "movies": movies[(page - 1) * page_size:page * page_size],
+            "count": count,
+            "page": page,
+            "pageSize": page_size,
+            "pageCount": max((count + page_size - 1) // page_size, 1),
+        }
+
+    def create_movie(self, request):
+        self._current_user(request, roles=(Roles.ADMIN.value, Roles.SUPER_ADMIN.value))
+        data = request.json()
+        errors = self._validate_movie(data)
+        if errors:
+            raise HTTPError(400, errors)
+        if any(movie["name"] == data["name"] for movie in self.movies.values()):
+            raise HTTPError(409, "Фильм с таким названием уже существует")
+        return 201, self._add_movie(data)
+
+    def get_movie(self, request, movie_id):
+        return 200, {**self._get_movie_or_404(movie_id), "reviews": []}
+
+    def update_movie(self, request, movie_id):
+        self._current_user(request, roles=(Roles.ADMIN.value, Roles.SUPER_ADMIN.value))
+        movie = self._get_movie_or_404(movie_id)
+        data = request.json()
+        errors = self._validate_movie(data, partial=True)
+        if errors:
+            raise HTTPError(400, errors)
+        for field in ("name", "price", "description", "imageUrl", "location", "published", "genreId", "rating"):
+            if field in data:
+                movie[field] = data[field]
+        movie["genre"] = {"name": GENRES.get(movie["genreId"], "")}
+        return 200, movie
+
+    def delete_movie(self, request, movie_id):
+        self._current_user(request, roles=(Roles.SUPER_ADMIN.value,))
+        movie = self._get_movie_or_404(movie_id)
+        del self.movies[movie["id"]]
+        return 200, movie
+
+
+class _Request:
+    """Разобранный WSGI-запрос."""
+
+    def __init__(self, environ, cookies: list):
+        self.environ = environ
+        self.query = parse_qs(environ.get("QUERY_STRING", ""))
+        self.headers = {key[5:].replace("_", "-").lower(): value
+                        for key, value in environ.items() if key.startswith("HTTP_")}
+        self.cookies = {}
+        for part in environ.get("HTTP_COOKIE", "").split(";"):
+            if "=" in part:
+                key, value = part.strip().split("=", 1)
+                self.cookies[key] = value
+        self._set_cookies = cookies
+
+    def json(self):
+        length = int(self.environ.get("CONTENT_LENGTH") or 0)
+        raw = self.environ["wsgi.input"].read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            return json.loads(raw)
+        except ValueError:
+            raise HTTPError(400, "Некорректное тело запроса")
+
+    def query_value(self, name, default=None):
+        values = self.query.get(name)
+        return values[-1] if values else default
+
+    def query_int(self, name, default: int) -> int:
+        value = self.query_value(name)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise HTTPError(400, f"{name} must be a number")
+
+    def set_cookie(self, name, value, max_age: int):
+        self._set_cookies.append(f"{name}={value}; Max-Age={max_age}; Path=/; HttpOnly")
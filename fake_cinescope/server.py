@@ -0,0 +1,44 @@
+import threading
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeCinescopeServer:
+    """HTTP-сервер fake-стенда в фоновом потоке текущего процесса."""
+
+    def __init__(self, app, host="127.0.0.1", port=0):
+        """
+        :param app: WSGI-приложение (FakeCinescope).
+        :param host: Адрес для прослушивания.
+        :param port: Порт; 0 - любой свободный.
+        """
+        self.app = app
+        self._server = make_server(host, port, app, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def serve_forever(self):
+        """Обслуживает запросы в текущем потоке (для запуска стенда отдельным процессом)."""
+        self._server.serve_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-cinescope", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
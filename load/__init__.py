@@ -0,0 +1,2 @@
+from load.runner import Journey, LoadRunner, RatePacer, StepStats, StopJourney, VirtualUser
+from load.scenarios import JOURNEYS
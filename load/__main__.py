@@ -0,0 +1,66 @@
+"""
+Нагрузочный прогон сценариев на тех же API-клиентах, что и функциональные тесты.
+
+Запуск из корня проекта:
+    python -m load browse_movies --users 20 --ramp-up 10 --duration 60 --rps 50
+    python -m load admin_movie_lifecycle --users 5 --duration 30 --json load_report.json
+Стенд задаётся так же, как для тестов (constants.constants).
+"""
+import argparse
+import json
+
+from api_clients.token_cache import token_cache
+from custom_requester.latency import latency_recorder
+from custom_requester.request_log import request_log
+from custom_requester.resilience import circuit_breakers, retry_policy
+from load.runner import LoadRunner
+from load.scenarios import JOURNEYS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m load", description="Нагрузочный прогон сценариев Cinescope")
+    parser.add_argument("journey", choices=sorted(JOURNEYS), help="Сценарий")
+    parser.add_argument("--users", type=int, default=10, help="Число виртуальных пользователей")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="За сколько секунд запустить всех пользователей")
+    parser.add_argument("--duration", type=float, default=60.0, help="Длительность прогона, секунды")
+    parser.add_argument("--rps", type=float, default=None, help="Целевое число шагов в секунду (по умолчанию без ограничения)")
+    parser.add_argument("--json", default=None, help="Путь для JSON-отчёта")
+    return parser.parse_args(argv)
+
+
+def configure_requester():
+    """Настройки CustomRequester под нагрузку: без curl-логов, повторов, circuit breaker'а и кэша токенов."""
+    # Ошибки должны попадать в статистику как есть, а не скрываться повторами или быстрым отказом
+    retry_policy.configure(retries=0)
+    circuit_breakers.configure(failure_threshold=float("inf"))
+    request_log.configure(mode=request_log.LAZY, capacity=1)
+    latency_recorder.enabled = False
+    # Шаг "login" должен мерить настоящий логин, а не попадание в кэш токенов
+    token_cache.enabled = False
+
+
+def print_report(report: dict):
+    print(f"\nJourney: {report['journey']}, users: {report['users']}, elapsed: {report['elapsed_s']}s")
+    print(f"{'STEP':<24} {'COUNT':>7} {'RPS':>8} {'ERR%':>6} {'P50':>9} {'P95':>9} {'P99':>9} {'MAX':>9}")
+    rows = list(report["steps"].items()) + [("TOTAL", report["total"])]
+    for name, row in rows:
+        print(f"{name:<24} {row['count']:>7} {row['rps']:>8} {row['error_rate'] * 100:>6.2f} "
+              f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} {row['max_ms']:>9}")
+    for error, count in report["total"]["top_errors"].items():
+        print(f"  {count} x {error}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_requester()
+    runner = LoadRunner(JOURNEYS[args.journey](), users=args.users, ramp_up=args.ramp_up,
+                        duration=args.duration, rps=args.rps)
+    report = runner.run()
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
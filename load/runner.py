@@ -0,0 +1,222 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+
+from api_clients.api_manager import ApiManager
+from custom_requester.http_transport import SharedHTTPTransport
+from utils.stats import percentile
+
+
+class RatePacer:
+    """
+    Общий для всех виртуальных пользователей ограничитель скорости: не больше rps шагов в секунду.
+    Каждый шаг получает свой слот времени, поэтому нагрузка идёт равномерно, а не пачками.
+    """
+
+    def __init__(self, rps: float = None):
+        """
+        :param rps: Целевое число шагов в секунду на весь прогон; None - без ограничения.
+        """
+        self.interval = 1.0 / rps if rps else 0.0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self, stop_at: float) -> bool:
+        """
+        Ждёт слота для следующего шага.
+        :return: False, если слот наступает после окончания прогона.
+        """
+        if not self.interval:
+            return time.monotonic() < stop_at
+        with self._lock:
+            slot = max(self._next_slot, time.monotonic())
+            self._next_slot = slot + self.interval
+        if slot >= stop_at:
+            return False
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+
+class StepStats:
+    """Время и ошибки одного шага сценария."""
+
+    def __init__(self):
+        self.durations = []
+        self.errors = defaultdict(int)  # "ValueError: Unexpected status code: 500..." -> количество
+
+    @property
+    def count(self) -> int:
+        return len(self.durations)
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def summary(self, elapsed: float) -> dict:
+        ordered = sorted(self.durations)
+        return {
+            "count": self.count,
+            "errors": self.error_count,
+            "error_rate": round(self.error_count / self.count, 4) if self.count else 0.0,
+            "rps": round(self.count / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            "top_errors": dict(sorted(self.errors.items(), key=lambda item: item[1], reverse=True)[:5]),
+        }
+
+
+class StopJourney(Exception):
+    """Прогон закончился (или шаг упал) - текущая итерация сценария прерывается."""
+
+
+class VirtualUser:
+    """
+    Виртуальный пользователь: своя сессия (ApiManager) и счётчики шагов.
+    Передаётся в сценарий, который вызывает методы API-клиентов внутри vu.step(...).
+    """
+
+    def __init__(self, number: int, api: ApiManager, runner):
+        self.number = number
+        self.api = api
+        self.data = {}  # состояние сценария между шагами (id созданного фильма и т.п.)
+        self._runner = runner
+
+    @contextmanager
+    def step(self, name: str, paced=True):
+        """
+        Замеряет шаг сценария. Шаг ждёт слота RatePacer; ошибка шага записывается и прерывает итерацию.
+        :param paced: False - шаг выполняется сразу, без слота RatePacer и проверки конца прогона
+                      (уборка за сценарием, которая должна пройти даже после stop_at).
+        """
+        runner = self._runner
+        if paced and not runner.pacer.wait(runner.stop_at):
+            raise StopJourney()
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except StopJourney:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)[:120]}"
+        runner.record(name, time.perf_counter() - started, error)
+        if error is not None:
+            raise StopJourney()
+
+
+class Journey(ABC):
+    """
+    Сценарий пользователя. on_start выполняется один раз для виртуального пользователя
+    (например, логин), run - в цикле до окончания прогона.
+    """
+    name = "journey"
+
+    def on_start(self, vu: VirtualUser):
+        pass
+
+    @abstractmethod
+    def run(self, vu: VirtualUser):
+        """Одна итерация сценария: вызовы API-клиентов внутри vu.step(...)."""
+
+    def on_stop(self, vu: VirtualUser):
+        pass
+
+
+class LoadRunner:
+    """
+    Запускает сценарий как users виртуальных пользователей (по потоку на каждого).
+    Пользователи стартуют равномерно за ramp_up секунд, общий темп ограничен rps шагами в секунду,
+    прогон длится duration секунд с момента старта первого пользователя.
+    """
+
+    def __init__(self, journey: Journey, users=10, ramp_up=0.0, duration=60.0, rps=None, transport=None):
+        """
+        :param journey: Экземпляр Journey.
+        :param users: Число виртуальных пользователей.
+        :param ramp_up: За сколько секунд запустить всех пользователей.
+        :param duration: Длительность прогона, секунды.
+        :param rps: Целевое число шагов в секунду на весь прогон; None - без ограничения.
+        :param transport: SharedHTTPTransport; по умолчанию создаётся с пулом на users соединений.
+        """
+        self.journey = journey
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.pacer = RatePacer(rps)
+        self.transport = transport or SharedHTTPTransport(pool_maxsize=max(users, 1))
+        self.stats = defaultdict(StepStats)
+        self.active_users = 0
+        self.started_at = None
+        self.stop_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def record(self, step: str, elapsed: float, error: str = None):
+        with self._lock:
+            stats = self.stats[step]
+            stats.durations.append(elapsed)
+            if error is not None:
+                stats.errors[error] += 1
+
+    def _run_user(self, number: int, start_delay: float):
+        time.sleep(start_delay)
+        if time.monotonic() >= self.stop_at:
+            return
+        vu = VirtualUser(number, ApiManager(self.transport.new_session()), self)
+        with self._lock:
+            self.active_users += 1
+        try:
+            try:
+                self.journey.on_start(vu)
+            except StopJourney:
+                return
+            while time.monotonic() < self.stop_at:
+                try:
+                    self.journey.run(vu)
+                except StopJourney:
+                    pass
+            self.journey.on_stop(vu)
+        finally:
+            vu.api.close_session()
+            with self._lock:
+                self.active_users -= 1
+
+    def run(self) -> dict:
+        """Выполняет прогон и возвращает отчёт (см. report)."""
+        self.started_at = time.monotonic()
+        self.stop_at = self.started_at + self.duration
+        step = self.ramp_up / self.users if self.users else 0
+        threads = [
+            threading.Thread(target=self._run_user, args=(number, number * step), name=f"vu-{number}", daemon=True)
+            for number in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.finished_at = time.monotonic()
+        self.transport.close()
+        return self.report()
+
+    def report(self) -> dict:
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        total = StepStats()
+        steps = {}
+        for name, stats in sorted(self.stats.items()):
+            steps[name] = stats.summary(elapsed)
+            total.durations.extend(stats.durations)
+            for error, count in stats.errors.items():
+                total.errors[error] += count
+        return {
+            "journey": self.journey.name,
+            "users": self.users,
+            "elapsed_s": round(elapsed, 2),
+            "steps": steps,
+            "total": total.summary(elapsed),
+        }
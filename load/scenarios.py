@@ -0,0 +1,50 @@
+import random
+
+from load.runner import Journey, VirtualUser
+from resources.user_creds import SuperAdminCreds
+from utils.data_generator import DataGenerator
+
+
+class BrowseMovies(Journey):
+    """Аноним листает афишу: страница списка фильмов и карточка случайного фильма с неё."""
+    name = "browse_movies"
+
+    def run(self, vu: VirtualUser):
+        with vu.step("GET /movies"):
+            movies = vu.api.movies_api.get_movies(params={"pageSize": 10}).json()["movies"]
+        if movies:
+            with vu.step("GET /movies/{id}"):
+                vu.api.movies_api.get_movie_by_id(random.choice(movies)["id"])
+
+
+class AdminMovieLifecycle(Journey):
+    """SUPER_ADMIN создаёт фильм, читает его и удаляет."""
+    name = "admin_movie_lifecycle"
+
+    def on_start(self, vu: VirtualUser):
+        with vu.step("login"):
+            vu.api.auth_api.authenticate((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+
+    def run(self, vu: VirtualUser):
+        movie_data = {
+            "name": DataGenerator.generate_movie_name(),
+            "imageUrl": DataGenerator.generate_movie_image_url(),
+            "price": DataGenerator.generate_movie_price(),
+            "description": DataGenerator.generate_movie_description(),
+            "location": DataGenerator.generate_movie_location(),
+            "published": DataGenerator.generate_movie_published(),
+            "genreId": DataGenerator.generate_movie_genre_id(),
+            "rating": 1,
+        }
+        with vu.step("POST /movies"):
+            movie_id = vu.api.movies_api.create_movie(movie_data).json()["id"]
+        try:
+            with vu.step("GET /movies/{id}"):
+                vu.api.movies_api.get_movie_by_id(movie_id)
+        finally:
+            # Удаление не ждёт слота и конца прогона - иначе последний фильм каждого VU остался бы на стенде
+            with vu.step("DELETE /movies/{id}", paced=False):
+                vu.api.movies_api.delete_movie(movie_id)
+
+
+JOURNEYS = {journey.name: journey for journey in (BrowseMovies, AdminMovieLifecycle)}
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from api_clients.token_cache import token_cache
+from api_clients.token_store import FileTokenStore
+
+# Приватный каталог (0700) с хранилищем токенов, который контроллер xdist создал для воркеров
+token_store_dir_key = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("auth-tokens", "Кэш токенов авторизации")
+    group.addoption("--no-token-cache", action="store_true", default=False,
+                    help="Логиниться заново при каждом AuthAPI.authenticate")
+    group.addoption("--token-refresh-margin", type=float, default=60.0,
+                    help="За сколько секунд до истечения обновлять токен через /refresh-tokens")
+    group.addoption("--token-store", default=None,
+                    help="Файл общего для процессов хранилища токенов "
+                         "(под xdist по умолчанию - файл во временном каталоге прогона; удаляется в конце прогона)")
+
+
+def pytest_configure(config):
+    token_cache.enabled = not config.getoption("--no-token-cache")
+    token_cache.refresh_margin = config.getoption("--token-refresh-margin")
+    store_path = config.getoption("--token-store")
+    if store_path is None and hasattr(config, "workerinput"):
+        # Воркер xdist: файл общий для всех воркеров одного прогона, каталог создал контроллер
+        store_path = config.workerinput.get("token_store_path")
+    if store_path:
+        token_cache.store = FileTokenStore(store_path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Хук xdist на контроллере: передаёт воркеру путь к хранилищу в приватном каталоге прогона."""
+    config = node.config
+    if config.getoption("--token-store") is not None:
+        return
+    if token_store_dir_key not in config.stash:
+        config.stash[token_store_dir_key] = tempfile.mkdtemp(prefix="cinescope_tokens_")
+    node.workerinput["token_store_path"] = os.path.join(config.stash[token_store_dir_key], "tokens.json")
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        return
+    # Контроллер (или прогон без xdist): токены и блокировки не должны пережить прогон
+    store_path = config.getoption("--token-store")
+    if store_path:
+        FileTokenStore(store_path).remove()
+    store_dir = config.stash.get(token_store_dir_key, None)
+    if store_dir:
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not token_cache.enabled or not (token_cache.logins or token_cache.hits):
+        return
+    terminalreporter.section("Auth token cache")
+    terminalreporter.write_line(
+        f"logins={token_cache.logins} cache hits={token_cache.hits} refreshes={token_cache.refreshes}"
+    )
@@ -0,0 +1,60 @@
+import pytest
+
+from api_clients.api_manager import ApiManager
+from constants.constants import CINESCOPE_STAND
+from db_requester.db_client import get_db_session
+from resources.user_creds import SuperAdminCreds
+from utils.cleanup_registry import CleanupRegistry
+from utils.data_generator import data_namespace
+
+cleanup_registry_key = pytest.StashKey[CleanupRegistry]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("cleanup", "Отложенная очистка тестовых данных")
+    group.addoption("--cleanup-backend", choices=("auto", "db", "api"), default="auto",
+                    help="Чем удалять созданные сущности в конце сессии: auto - БД с откатом на API")
+    group.addoption("--cleanup-workers", type=int, default=8,
+                    help="Сколько запросов удаления через API выполнять параллельно")
+    group.addoption("--cleanup-sweep-namespace", action="store_true", default=False,
+                    help="При очистке через БД удалить и незарегистрированных пользователей с email "
+                         "пространства имён прогона (осторожно: БД стенда общая)")
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(request, http_transport):
+    """
+    Сессионный реестр созданных сущностей: фикстуры регистрируют id, удаление выполняется в конце прогона.
+    """
+    def admin_api_factory():
+        # Логин SUPER_ADMIN нужен только при очистке через API, DB-тесты его не требуют
+        api = ApiManager(http_transport.new_session())
+        api.auth_api.authenticate((SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD))
+        return api
+
+    backend = request.config.getoption("--cleanup-backend")
+    if backend == "auto" and CINESCOPE_STAND == "fake":
+        # У fake-стенда нет БД - сущности живут только в его памяти
+        backend = "api"
+    registry = CleanupRegistry(
+        admin_api_factory,
+        db_session_factory=get_db_session,
+        backend=backend,
+        workers=request.config.getoption("--cleanup-workers"),
+        sweep_email_prefix=(data_namespace.email_prefix
+                            if request.config.getoption("--cleanup-sweep-namespace") else None),
+    )
+    request.config.stash[cleanup_registry_key] = registry
+    yield registry
+    registry.run()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    registry = config.stash.get(cleanup_registry_key, None)
+    if registry is None:
+        return
+    terminalreporter.section("Test data cleanup")
+    for kind in (registry.MOVIES, registry.USERS):
+        terminalreporter.write_line(f"{kind}: deleted={registry.deleted[kind]} failed={len(registry.failed[kind])}")
+        for entity_id, reason in sorted(registry.failed[kind].items()):
+            terminalreporter.write_line(f"  {kind} {entity_id} not removed: {reason}", yellow=True)
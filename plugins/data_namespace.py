@@ -0,0 +1,29 @@
+import pytest
+
+from utils.data_generator import DataNamespace, data_namespace as current_namespace
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("data-namespace", "Тестовые данные воркеров xdist")
+    group.addoption("--data-seed", default=None,
+                    help="Базовый seed генерации данных (seed воркера выводится из него); "
+                         "по умолчанию - id прогона")
+
+
+def pytest_configure(config):
+    seed = config.getoption("--data-seed")
+    if hasattr(config, "workerinput"):
+        current_namespace.configure(config.workerinput["workerid"], config.workerinput["testrunuid"], seed)
+    elif seed is not None:
+        current_namespace.configure(current_namespace.worker, current_namespace.run_uid, seed)
+
+
+def pytest_report_header(config):
+    return (f"data namespace: {current_namespace.prefix} "
+            f"(seed {current_namespace.base_seed}, worker seed {current_namespace.seed})")
+
+
+@pytest.fixture(scope="session")
+def data_namespace() -> DataNamespace:
+    """Пространство имён тестовых данных этого воркера (префиксы email, seed)."""
+    return current_namespace
@@ -0,0 +1,80 @@
+import json
+import os
+
+from db_requester import db_client
+from db_requester.engine_factory import EngineSettings
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("db-pool", "Пул соединений с БД")
+    group.addoption("--db-pool-size", type=int, default=5,
+                    help="Сколько соединений с БД держать открытыми в каждом процессе (воркере)")
+    group.addoption("--db-max-overflow", type=int, default=10,
+                    help="Сколько соединений можно открыть сверх --db-pool-size")
+    group.addoption("--db-pool-timeout", type=float, default=30.0,
+                    help="Сколько секунд ждать свободное соединение")
+    group.addoption("--db-pool-recycle", type=int, default=1800,
+                    help="Через сколько секунд переоткрывать соединение (-1 - никогда)")
+    group.addoption("--db-no-pre-ping", action="store_true", default=False,
+                    help="Не проверять соединение перед выдачей из пула")
+    group.addoption("--db-statement-timeout", type=int, default=None,
+                    help="statement_timeout для запросов тестов, миллисекунды")
+    group.addoption("--db-pool-report", default="db_pool_report.json",
+                    help="Путь к JSON-отчёту по пулу соединений")
+
+
+def pytest_configure(config):
+    db_client.configure_engine(EngineSettings(
+        pool_size=config.getoption("--db-pool-size"),
+        max_overflow=config.getoption("--db-max-overflow"),
+        pool_timeout=config.getoption("--db-pool-timeout"),
+        pool_recycle=config.getoption("--db-pool-recycle"),
+        pre_ping=not config.getoption("--db-no-pre-ping"),
+        statement_timeout_ms=config.getoption("--db-statement-timeout"),
+    ))
+
+
+def _report_path(config) -> str:
+    path = config.getoption("--db-pool-report")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        # Под xdist каждый воркер держит свой пул - и пишет свой файл
+        root, ext = os.path.splitext(path)
+        path = f"{root}_{worker}{ext}"
+    return path
+
+
+def pytest_sessionfinish(session):
+    if not db_client.engine_created():
+        return
+    db_client.dispose_engine()
+    settings = db_client.engine_settings
+    report = {
+        "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        **db_client.pool_stats.summary(),
+    }
+    with open(_report_path(session.config), "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, ensure_ascii=False, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not db_client.engine_created():
+        return
+    summary = db_client.pool_stats.summary()
+    settings = db_client.engine_settings
+    terminalreporter.section("DB connection pool")
+    terminalreporter.write_line(
+        f"pool_size={settings.pool_size} max_overflow={settings.max_overflow} "
+        f"peak checked out={summary['peak_checked_out']} checkouts={summary['checkouts']}"
+    )
+    terminalreporter.write_line(
+        f"connections opened={summary['connections_opened']} closed={summary['connections_closed']} "
+        f"invalidated={summary['invalidated']} timeouts={summary['timeouts']}"
+    )
+    terminalreporter.write_line(
+        f"checkout wait total={summary['wait_total_ms']}ms p95={summary['wait_p95_ms']}ms "
+        f"max={summary['wait_max_ms']}ms"
+    )
+    terminalreporter.write_line(f"JSON: {_report_path(config)}")
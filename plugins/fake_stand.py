@@ -0,0 +1,84 @@
+import pytest
+
+from constants.constants import AUTH_BASE_URL, CINESCOPE_STAND, FAKE_STAND_HOST, FAKE_STAND_PORT, MOVIES_BASE_URL
+from custom_requester.inprocess_adapter import WSGIAdapter
+from fake_cinescope.app import FakeCinescope
+from fake_cinescope.server import FakeCinescopeServer
+from plugins.http_transport import http_transport_mounts_key
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+fake_app_key = pytest.StashKey[FakeCinescope]()
+fake_server_key = pytest.StashKey[FakeCinescopeServer]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fake-stand", "Локальный fake-стенд (CINESCOPE_STAND=fake)")
+    group.addoption("--fake-transport", choices=("socket", "inprocess"), default="socket",
+                    help="socket - HTTP-сервер на CINESCOPE_FAKE_PORT, "
+                         "inprocess - запросы уходят в приложение без сокетов (свой стенд в каждом процессе)")
+    group.addoption("--fake-external", action="store_true", default=False,
+                    help="Не запускать стенд, а использовать уже запущенный на CINESCOPE_FAKE_PORT "
+                         "(python -m fake_cinescope)")
+    group.addoption("--fake-latency", type=float, default=0.0,
+                    help="Задержка каждого ответа fake-стенда, секунды")
+    group.addoption("--fake-jitter", type=float, default=0.0,
+                    help="Случайная добавка к задержке, секунды")
+    group.addoption("--fake-fault-rate", type=float, default=0.0,
+                    help="Доля запросов, на которые fake-стенд отвечает 503")
+    group.addoption("--fake-seed-movies", type=int, default=50,
+                    help="Сколько фильмов создать на fake-стенде при старте")
+
+
+def _create_app(config) -> FakeCinescope:
+    return FakeCinescope(
+        FAKE_SUPER_ADMIN_CREDS,
+        latency=config.getoption("--fake-latency"),
+        jitter=config.getoption("--fake-jitter"),
+        fault_rate=config.getoption("--fake-fault-rate"),
+        seed_movies=config.getoption("--fake-seed-movies"),
+    )
+
+
+def pytest_configure(config):
+    if CINESCOPE_STAND != "fake":
+        return
+    if config.getoption("--fake-transport") == "inprocess":
+        app = _create_app(config)
+        adapter = WSGIAdapter(app)
+        mounts = config.stash.setdefault(http_transport_mounts_key, {})
+        for base_url in {AUTH_BASE_URL, MOVIES_BASE_URL}:
+            mounts[base_url] = adapter
+        config.stash[fake_app_key] = app
+        return
+    if hasattr(config, "workerinput") or config.getoption("--fake-external"):
+        # Воркеры xdist ходят в стенд, запущенный главным процессом; --fake-external - в запущенный отдельно
+        return
+    app = _create_app(config)
+    try:
+        server = FakeCinescopeServer(app, FAKE_STAND_HOST, FAKE_STAND_PORT)
+    except OSError as e:
+        # Молча идти в то, что слушает порт, нельзя - тесты проверяли бы неизвестно что
+        raise pytest.UsageError(
+            f"Cannot start fake Cinescope stand on {FAKE_STAND_HOST}:{FAKE_STAND_PORT}: {e}. "
+            f"Free the port, set another CINESCOPE_FAKE_PORT, or pass --fake-external "
+            f"to use a stand started with python -m fake_cinescope"
+        ) from e
+    config.stash[fake_app_key] = app
+    config.stash[fake_server_key] = server.start()
+
+
+def pytest_unconfigure(config):
+    server = config.stash.get(fake_server_key, None)
+    if server is not None:
+        server.stop()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    app = config.stash.get(fake_app_key, None)
+    if app is None:
+        return
+    terminalreporter.section("Fake Cinescope stand")
+    terminalreporter.write_line(
+        f"{config.getoption('--fake-transport')} {AUTH_BASE_URL}: "
+        f"requests={app.requests_served} faults injected={app.faults_injected}"
+    )
@@ -0,0 +1,47 @@
+import pytest
+
+from constants.constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+from custom_requester.http_transport import SharedHTTPTransport
+
+http_transport_key = pytest.StashKey[SharedHTTPTransport]()
+# Базовый URL -> адаптер приложения в процессе; заполняется другими плагинами в pytest_configure
+http_transport_mounts_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("http-transport", "Общий пул HTTP-соединений")
+    group.addoption("--http-pool-connections", type=int, default=HTTP_POOL_CONNECTIONS,
+                    help="Сколько пулов (хостов) держать открытыми")
+    group.addoption("--http-pool-maxsize", type=int, default=HTTP_POOL_MAXSIZE,
+                    help="Максимум keep-alive соединений на один хост")
+
+
+@pytest.fixture(scope="session")
+def http_transport(request):
+    """
+    Сессионный транспорт: пулы соединений общие для всех requests.Session в прогоне.
+    """
+    transport = SharedHTTPTransport(
+        pool_connections=request.config.getoption("--http-pool-connections"),
+        pool_maxsize=request.config.getoption("--http-pool-maxsize"),
+    )
+    for base_url, adapter in request.config.stash.get(http_transport_mounts_key, {}).items():
+        transport.mount_app(base_url, adapter)
+    request.config.stash[http_transport_key] = transport
+    yield transport
+    transport.close()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    transport = config.stash.get(http_transport_key, None)
+    if transport is None:
+        return
+    stats = transport.stats()
+    if not stats:
+        return
+    terminalreporter.section("HTTP connection pool")
+    terminalreporter.write_line(f"sessions: {transport.sessions_created}")
+    for host, entry in sorted(stats.items()):
+        terminalreporter.write_line(
+            f"{host}: requests={entry['requests']} hits={entry['pool_hits']} misses={entry['pool_misses']}"
+        )
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from custom_requester.latency import latency_recorder
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency", "Время ответа эндпоинтов")
+    group.addoption("--no-latency", action="store_true", default=False,
+                    help="Не собирать время ответа запросов")
+    group.addoption("--latency-report", default=None,
+                    help="Путь к JSON-отчёту с перцентилями по эндпоинтам (по умолчанию отчёт не пишется)")
+
+
+def pytest_configure(config):
+    latency_recorder.enabled = not config.getoption("--no-latency")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Хук xdist на контроллере: забирает замеры завершившегося воркера в общий отчёт."""
+    latency_recorder.merge(getattr(node, "workeroutput", {}).get("latency_samples", []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        # Воркер xdist: замеры уходят контроллеру, отчёт и сводку строит он
+        config.workeroutput["latency_samples"] = latency_recorder.export()
+        return
+    path = config.getoption("--latency-report")
+    if not path or not latency_recorder.enabled or not latency_recorder.samples:
+        return
+    with open(path, "w", encoding="utf-8") as report:
+        json.dump(latency_recorder.summary(), report, ensure_ascii=False, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not latency_recorder.enabled or not latency_recorder.samples:
+        return
+    terminalreporter.section("Endpoint latency (ms)")
+    terminalreporter.write_line(
+        f"{'METHOD':<7} {'ENDPOINT':<60} {'COUNT':>6} {'P50':>9} {'P95':>9} {'P99':>9} {'MAX':>9}"
+    )
+    for row in latency_recorder.summary():
+        terminalreporter.write_line(
+            f"{row['method']:<7} {row['base_url'] + row['endpoint']:<60} {row['count']:>6} "
+            f"{row['p50_ms']:>9} {row['p95_ms']:>9} {row['p99_ms']:>9} {row['max_ms']:>9}"
+        )
+    path = config.getoption("--latency-report")
+    if path:
+        terminalreporter.write_line(f"JSON: {path}")
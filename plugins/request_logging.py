@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+from custom_requester.request_log import RequestLogBuffer, request_log
+
+logger = logging.getLogger("custom_requester.custom_requester")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("request-logging", "Логирование HTTP-запросов")
+    group.addoption("--request-log-mode", choices=[RequestLogBuffer.EAGER, RequestLogBuffer.LAZY],
+                    default=RequestLogBuffer.EAGER,
+                    help="eager - curl каждого запроса сразу; lazy - только для упавших тестов и по сэмплингу")
+    group.addoption("--request-log-buffer", type=int, default=50,
+                    help="Сколько последних запросов теста хранить в lazy-режиме")
+    group.addoption("--request-log-sample-rate", type=float, default=0.0,
+                    help="Доля запросов (0..1), которые логируются сразу даже в lazy-режиме")
+
+
+def pytest_configure(config):
+    request_log.configure(
+        mode=config.getoption("--request-log-mode"),
+        capacity=config.getoption("--request-log-buffer"),
+        sample_rate=config.getoption("--request-log-sample-rate"),
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    request_log.reset(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if request_log.is_lazy and report.failed:
+        request_log.flush(logger, item.nodeid)
+
+
+def pytest_runtest_logfinish(nodeid):
+    request_log.reset(nodeid)
@@ -0,0 +1,37 @@
+from custom_requester.resilience import circuit_breakers, retry_policy
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("resilience", "Повторы запросов и circuit breaker")
+    group.addoption("--http-retries", type=int, default=2,
+                    help="Максимум повторов одного запроса (идемпотентные методы и ошибки соединения)")
+    group.addoption("--http-retry-budget", type=int, default=50,
+                    help="Максимум повторов на всю сессию")
+    group.addoption("--http-backoff-base", type=float, default=0.2,
+                    help="Базовая задержка экспоненциального backoff, секунды")
+    group.addoption("--circuit-failure-threshold", type=int, default=5,
+                    help="Сбоев подряд, после которых хост считается недоступным")
+    group.addoption("--circuit-reset-timeout", type=float, default=30.0,
+                    help="Через сколько секунд пропустить пробный запрос к недоступному хосту")
+
+
+def pytest_configure(config):
+    retry_policy.configure(
+        retries=config.getoption("--http-retries"),
+        backoff_base=config.getoption("--http-backoff-base"),
+        budget=config.getoption("--http-retry-budget"),
+    )
+    circuit_breakers.configure(
+        failure_threshold=config.getoption("--circuit-failure-threshold"),
+        reset_timeout=config.getoption("--circuit-reset-timeout"),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    opened = {host: breaker for host, breaker in circuit_breakers.breakers.items() if breaker.times_opened}
+    if not retry_policy.retries_used and not opened:
+        return
+    terminalreporter.section("HTTP retries")
+    terminalreporter.write_line(f"retries used: {retry_policy.retries_used}/{retry_policy.budget}")
+    for host, breaker in sorted(opened.items()):
+        terminalreporter.write_line(f"circuit {host}: opened {breaker.times_opened} time(s), now {breaker.state}")
@@ -0,0 +1,29 @@
+from custom_requester.response_cache import response_cache
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("response-cache", "Кэш GET-ответов")
+    group.addoption("--response-cache", action="store_true", default=False,
+                    help="Кэшировать ответы на GET-запросы (сбрасывается изменяющими запросами)")
+    group.addoption("--response-cache-size", type=int, default=512,
+                    help="Максимум ответов в кэше")
+    group.addoption("--response-cache-ttl", type=float, default=60.0,
+                    help="Время жизни ответа в кэше, секунды")
+
+
+def pytest_configure(config):
+    response_cache.configure(
+        enabled=config.getoption("--response-cache"),
+        maxsize=config.getoption("--response-cache-size"),
+        ttl=config.getoption("--response-cache-ttl"),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not response_cache.enabled:
+        return
+    terminalreporter.section("GET response cache")
+    terminalreporter.write_line(
+        f"hits={response_cache.hits} misses={response_cache.misses} "
+        f"invalidated={response_cache.invalidations} (saved round trips: {response_cache.hits})"
+    )
@@ -0,0 +1,52 @@
+import pytest
+
+from db_requester.query_profiler import query_profiler
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sql-profiler", "Профилирование SQL-запросов")
+    group.addoption("--no-sql-profile", action="store_true", default=False,
+                    help="Не собирать статистику SQL-запросов по тестам")
+    group.addoption("--sql-profile-top", type=int, default=10,
+                    help="Сколько самых дорогих запросов и тестов показать в отчёте")
+
+
+def pytest_configure(config):
+    query_profiler.enabled = not config.getoption("--no-sql-profile")
+    query_profiler.install()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Запросы фикстур (setup/teardown) относятся к тесту, который их вызвал
+    query_profiler.current_test = item.nodeid
+    yield
+    query_profiler.current_test = None
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Проверка числа SQL-запросов в блоке:
+        with assert_max_queries(2):
+            db_helper.get_user_by_id(user_id)
+    """
+    return query_profiler.assert_max_queries
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not query_profiler.enabled or not query_profiler.statements:
+        return
+    top = config.getoption("--sql-profile-top")
+    terminalreporter.section("SQL queries")
+    terminalreporter.write_line(f"{'COUNT':>6} {'TOTAL':>10} {'AVG':>8} {'MAX':>8} {'ROWS':>7} {'TESTS':>5}  STATEMENT")
+    for row in query_profiler.top_statements(top):
+        statement = row["statement"] if len(row["statement"]) <= 120 else row["statement"][:117] + "..."
+        terminalreporter.write_line(
+            f"{row['count']:>6} {row['total_ms']:>10} {row['avg_ms']:>8} {row['max_ms']:>8} "
+            f"{row['rows']:>7} {row['tests']:>5}  {statement}"
+        )
+    terminalreporter.write_line("")
+    terminalreporter.write_line(f"{'QUERIES':>7} {'TOTAL':>10}  TEST")
+    for row in query_profiler.top_tests(top):
+        terminalreporter.write_line(f"{row['queries']:>7} {row['total_ms']:>10}  {row['test']}")
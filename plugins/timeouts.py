@@ -0,0 +1,37 @@
+import pytest
+
+from constants.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.deadline import test_deadline
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timeouts", "Таймауты HTTP-запросов")
+    group.addoption("--http-connect-timeout", type=float, default=DEFAULT_CONNECT_TIMEOUT,
+                    help="Таймаут установки соединения по умолчанию, секунды")
+    group.addoption("--http-read-timeout", type=float, default=DEFAULT_READ_TIMEOUT,
+                    help="Таймаут ожидания ответа по умолчанию, секунды")
+    group.addoption("--test-deadline", type=float, default=None,
+                    help="Общий бюджет времени на все запросы одного теста (setup + call), секунды")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "deadline(seconds): общий бюджет времени на запросы теста")
+    CustomRequester.default_timeout = (config.getoption("--http-connect-timeout"),
+                                       config.getoption("--http-read-timeout"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    marker = item.get_closest_marker("deadline")
+    seconds = marker.args[0] if marker else item.config.getoption("--test-deadline")
+    if seconds:
+        test_deadline.start(seconds)
+    else:
+        test_deadline.clear()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    # Очистка данных в teardown не должна падать из-за того, что тест исчерпал свой бюджет
+    test_deadline.clear()
@@ -1,8 +1,14 @@
 import os
 from dotenv import load_dotenv
 
+from constants.constants import CINESCOPE_STAND
+
 load_dotenv()
 
+# SUPER_ADMIN, которого fake-стенд создаёт при старте (если учётка не задана в окружении)
+FAKE_SUPER_ADMIN_CREDS = (os.getenv('SUPER_ADMIN_USERNAME') or 'super.admin@fake-cinescope.local',
+                          os.getenv('SUPER_ADMIN_PASSWORD') or 'FakeAdmin123')
+
 class SuperAdminCreds:
-    USERNAME = os.getenv('SUPER_ADMIN_USERNAME')
-    PASSWORD = os.getenv('SUPER_ADMIN_PASSWORD')
+    USERNAME = os.getenv('SUPER_ADMIN_USERNAME') or (FAKE_SUPER_ADMIN_CREDS[0] if CINESCOPE_STAND == 'fake' else None)
+    PASSWORD = os.getenv('SUPER_ADMIN_PASSWORD') or (FAKE_SUPER_ADMIN_CREDS[1] if CINESCOPE_STAND == 'fake' else None)
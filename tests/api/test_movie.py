@@ -4,6 +4,7 @@ import requests
 from conftest import api_manager, super_admin, common_user
 from utils.data_generator import DataGenerator
 from constants.constants import MOVIES_ENDPOINT
+from constants.roles import Roles
 
 @pytest.mark.api
 class TestMoviesAPIPositive:
@@ -19,13 +20,13 @@ class TestMoviesAPIPositive:
 
     @pytest.mark.slow
     @pytest.mark.regression
-    @pytest.mark.parametrize("role_name", ["super_admin", "common_user"])
-    def test_get_movie_by_id(self, role_name, request, created_movie):
-        """ Получаем данные о фильме под super_admin """
-        role = request.getfixturevalue(role_name)
+    @pytest.mark.parametrize("role", [Roles.SUPER_ADMIN, Roles.USER], ids=lambda role: role.value)
+    def test_get_movie_by_id(self, role, role_registry, created_movie):
+        """ Получаем данные о фильме под разными ролями """
+        user = role_registry.get(role)
         movie_id, created_data, _ = created_movie
 
-        response = role.api.movies_api.get_movie_by_id(movie_id, expected_status=200)
+        response = user.api.movies_api.get_movie_by_id(movie_id, expected_status=200)
         data = response.json()
 
         assert data["id"] == movie_id
@@ -63,3 +63,17 @@ class TestMoviesFilters:
             assert movie["location"] == location
             assert movie["published"] == published
             assert movie["genreId"] == genre_id
+
+    @pytest.mark.slow
+    @pytest.mark.regression
+    def test_iter_movies_walks_all_pages(self, super_admin):
+        """ Обход всех страниц каталога с предзагрузкой """
+        params = {"pageSize": 20, "minPrice": 1, "maxPrice": 100}
+        total = super_admin.api.movies_api.get_movies(params=params).json()["count"]
+
+        movies_iterator = super_admin.api.movies_api.iter_movies(params=params, prefetch=4)
+        movie_ids = [movie["id"] for movie in movies_iterator]
+
+        assert len(movie_ids) == total
+        assert len(set(movie_ids)) == total
+        assert movies_iterator.max_pages_in_flight <= 4
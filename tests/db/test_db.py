@@ -1,6 +1,9 @@
 # Можете сделать рандомный тестовый файл для проверки работы фикстуры
 # Так сказать - поиграться
 import pytest
+from sqlalchemy import text
+
+from db_requester.consistency import MovieConsistencyVerifier
 from tests.api.test_movie import TestMoviesAPIPositive
 
 
@@ -10,6 +13,35 @@ class TestDB:
         assert created_test_user == db_helper.get_user_by_id(created_test_user.id)
         assert db_helper.user_exists_by_email("api1@gmail.com")
 
+    def test_get_user_by_id_single_query(self, db_helper, created_test_user, assert_max_queries):
+        user_id = created_test_user.id
+        with assert_max_queries(1):
+            user = db_helper.get_user_by_id(user_id)
+        assert user.id == user_id
+
+    def test_movies_api_matches_db(self, super_admin, db_helper, created_movie, assert_max_queries):
+        movies = super_admin.api.movies_api.get_movies(params={"pageSize": 20, "createdAt": "desc"}).json()["movies"]
+        assert created_movie[0] in [movie["id"] for movie in movies]
+        verifier = MovieConsistencyVerifier(db_helper)
+        with assert_max_queries(1):
+            verifier.assert_consistent(movies)
+        assert verifier.checked == len(movies)
+
+    def test_get_movies_by_ids_reads_fresh_rows(self, db_helper, movie_data_db):
+        movie = db_helper.create_movie_in_db(movie_data_db)
+        try:
+            assert db_helper.get_movies_by_ids([movie.id])[movie.id].price == movie_data_db["price"]
+            # Строка меняется в обход ORM - объект в identity map сессии устарел
+            db_helper.db_session.execute(text("UPDATE movies SET price = price + 1 WHERE id = :id"), {"id": movie.id})
+
+            assert db_helper.get_movies_by_ids([movie.id])[movie.id].price == movie_data_db["price"] + 1
+            api_movie = {**movie.to_dict(), "genreId": movie.genre_id, "price": movie_data_db["price"]}
+            with pytest.raises(AssertionError, match="price"):
+                MovieConsistencyVerifier(db_helper, fields=["price"]).assert_consistent([api_movie])
+        finally:
+            db_helper.db_session.rollback()
+            db_helper.delete_movie_from_db(db_helper.get_movie_by_id(movie.id))
+
     #TODO Сделать тест на создание фильма в БД, удаление через АПИ и проверка на удаление в БД
     def test_create_movie_db(self, super_admin,db_helper, movie_data_db):
         movie = db_helper.create_movie_in_db(movie_data_db)
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+
+from db_models.movie import MovieDBModel
+from db_models.user import UserDBModel
+from utils.data_generator import DataGenerator
+
+
+def movie_rows(count: int) -> list:
+    """Строки movies как у фикстуры movie_data_db."""
+    return [{
+        "name": DataGenerator.generate_movie_name(),
+        "image_url": DataGenerator.generate_movie_image_url(),
+        "price": DataGenerator.generate_movie_price(),
+        "description": DataGenerator.generate_movie_description(),
+        "location": DataGenerator.generate_movie_location(),
+        "published": DataGenerator.generate_movie_published(),
+        "genre_id": DataGenerator.generate_movie_genre_id(),
+        "rating": 1,
+        "created_at": datetime.now(),
+    } for _ in range(count)]
+
+
+@pytest.mark.db
+@pytest.mark.db_isolated
+class TestBulkSeeding:
+    """Массовое создание в транзакции теста: всё, что создано, откатывается после теста."""
+
+    def test_bulk_users_insert_returning(self, db_helper, assert_max_queries):
+        users = [DataGenerator.generate_user_data() for _ in range(7)]
+        # SAVEPOINT, ceil(7 / 3) многострочных INSERT ... RETURNING и RELEASE SAVEPOINT вместо commit
+        with assert_max_queries(5):
+            ids = db_helper.bulk_create_users(users, batch_size=3)
+
+        assert ids == [user["id"] for user in users]
+        assert db_helper.get_user_by_id(ids[-1]).email == users[-1]["email"]
+
+    def test_bulk_users_generates_missing_ids(self, db_helper):
+        users = [{**DataGenerator.generate_user_data(), "id": None} for _ in range(2)]
+
+        ids = db_helper.bulk_create_users(users)
+
+        assert len(set(ids)) == 2 and None not in ids
+        assert [db_helper.get_user_by_id(user_id).email for user_id in ids] == [user["email"] for user in users]
+
+    def test_bulk_movies_ids_follow_input_order(self, db_helper):
+        movies = movie_rows(5)
+
+        ids = db_helper.bulk_create_movies(movies, batch_size=2)
+
+        by_id = db_helper.get_movies_by_ids(ids)
+        assert [by_id[movie_id].name for movie_id in ids] == [movie["name"] for movie in movies]
+
+    def test_bulk_users_copy(self, db_helper):
+        users = [DataGenerator.generate_user_data() for _ in range(4)]
+        users[0]["full_name"] = 'Quote "and", comma'  # CSV-экранирование
+
+        ids = db_helper.bulk_create_users(users, use_copy=True)
+
+        assert ids == [user["id"] for user in users]
+        assert db_helper.get_user_by_id(ids[0]).full_name == users[0]["full_name"]
+
+    def test_bulk_movies_copy_with_nulls(self, db_helper):
+        movies = movie_rows(3)
+        movies[1]["image_url"] = None
+
+        ids = db_helper.bulk_create_movies(movies, use_copy=True)
+
+        assert ids == sorted(ids) and len(ids) == 3
+        by_id = db_helper.get_movies_by_ids(ids)
+        assert by_id[ids[1]].image_url is None, r"\N в COPY не превратился в NULL"
+        assert [by_id[movie_id].name for movie_id in ids] == [movie["name"] for movie in movies]
+
+    def test_bulk_delete_in_batches(self, db_helper):
+        ids = db_helper.bulk_create_movies(movie_rows(5))
+
+        assert db_helper.bulk_delete(MovieDBModel, ids + [-1], batch_size=2) == 5
+        assert db_helper.get_movies_by_ids(ids) == {}
+
+    def test_empty_input(self, db_helper):
+        assert db_helper.bulk_create_users([]) == []
+        assert db_helper.bulk_create_users([], use_copy=True) == []
+        assert db_helper.bulk_delete(UserDBModel, []) == 0
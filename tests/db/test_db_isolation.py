@@ -0,0 +1,53 @@
+import pytest
+
+from db_models.user import UserDBModel
+from db_requester.db_client import get_db_session, isolated_db_session
+from db_requester.db_helpers import DBHelper
+from utils.data_generator import DataGenerator
+
+
+def user_exists_outside(user_id) -> bool:
+    """Есть ли пользователь в БД для другого соединения (как для API сервиса)."""
+    session = get_db_session()
+    try:
+        return DBHelper(session).get_user_by_id(user_id) is not None
+    finally:
+        session.close()
+
+
+@pytest.mark.db
+class TestIsolatedDbSession:
+
+    def test_commit_is_rolled_back_on_exit(self):
+        with isolated_db_session() as session:
+            helper = DBHelper(session)
+            user = helper.create_test_user(DataGenerator.generate_user_data())
+            user_id = user.id
+
+            assert helper.get_user_by_id(user_id) is not None, "Тест не видит свои данные после commit"
+            assert not user_exists_outside(user_id), "Данные теста видны другим соединениям до отката"
+
+        assert not user_exists_outside(user_id), "Данные остались в БД после выхода из isolated_db_session"
+
+    def test_rollback_returns_to_last_savepoint(self):
+        with isolated_db_session() as session:
+            helper = DBHelper(session)
+            kept = helper.create_test_user(DataGenerator.generate_user_data())
+            dropped_data = DataGenerator.generate_user_data()
+            session.add(UserDBModel(**dropped_data))
+            session.flush()
+
+            session.rollback()
+
+            assert helper.get_user_by_id(kept.id) is not None, "rollback откатил уже закоммиченный SAVEPOINT"
+            assert helper.get_user_by_email(dropped_data["email"]) is None
+
+    @pytest.mark.db_isolated
+    def test_isolated_helper_skips_module_session(self, request, db_helper):
+        assert "isolated_session" in request.fixturenames
+        assert "db_session" not in request.fixturenames, "В изолированном режиме создана модульная db_session"
+
+    def test_plain_helper_uses_module_session(self, request, db_helper):
+        if request.config.getoption("--db-isolation"):
+            pytest.skip("Прогон с --db-isolation")
+        assert db_helper.db_session is request.getfixturevalue("db_session")
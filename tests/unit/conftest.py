@@ -0,0 +1,24 @@
+import pytest
+
+from constants.constants import AUTH_BASE_URL, MOVIES_BASE_URL
+from custom_requester.http_transport import SharedHTTPTransport
+from custom_requester.inprocess_adapter import WSGIAdapter
+from fake_cinescope.app import FakeCinescope
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+
+@pytest.fixture
+def fake_app():
+    """Свой fake-стенд на тест: состояние не пересекается с другими тестами."""
+    return FakeCinescope(FAKE_SUPER_ADMIN_CREDS, seed_movies=5)
+
+
+@pytest.fixture
+def fake_transport(fake_app):
+    """SharedHTTPTransport, чьи сессии ходят в fake_app без сокетов по адресам стенда из constants."""
+    transport = SharedHTTPTransport()
+    adapter = WSGIAdapter(fake_app)
+    for base_url in {AUTH_BASE_URL, MOVIES_BASE_URL}:
+        transport.mount_app(base_url, adapter)
+    yield transport
+    transport.close()
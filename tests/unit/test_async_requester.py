@@ -0,0 +1,105 @@
+import asyncio
+import socket
+
+import httpx
+import pytest
+
+from api_clients.async_api_manager import AsyncApiManager
+from custom_requester import async_custom_requester as async_module
+from custom_requester.latency import LatencyRecorder
+from custom_requester.resilience import CircuitBreakerRegistry, CircuitOpenError, RetryPolicy
+from fake_cinescope.server import FakeCinescopeServer
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+
+@pytest.fixture
+def fake_server(fake_app):
+    """fake_app на сокете: httpx.AsyncClient ходит в него настоящим HTTP."""
+    server = FakeCinescopeServer(fake_app).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def resilience(monkeypatch):
+    """Свои политика повторов (без задержек), реестр circuit breaker'ов и сборщик latency."""
+    state = {
+        "retry_policy": RetryPolicy(retries=2, backoff_base=0),
+        "circuit_breakers": CircuitBreakerRegistry(failure_threshold=3),
+        "latency_recorder": LatencyRecorder(),
+    }
+    for name, value in state.items():
+        monkeypatch.setattr(async_module, name, value)
+    return state
+
+
+def run_against(base_url, scenario):
+    """Выполняет scenario(api) на AsyncApiManager, все API-классы которого смотрят в base_url."""
+    async def main():
+        async with AsyncApiManager(concurrency=5) as api:
+            for client in (api.auth_api, api.user_api, api.movies_api):
+                client.base_url = base_url
+            return await scenario(api)
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+class TestAsyncRequester:
+
+    def test_crud_against_fake_stand(self, fake_server, resilience, movie_data):
+        async def scenario(api):
+            await api.auth_api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+            movie_id = (await api.movies_api.create_movie(movie_data)).json()["id"]
+            responses = await api.gather(*(api.movies_api.get_movie_by_id(movie_id) for _ in range(10)))
+            return movie_id, responses
+
+        movie_id, responses = run_against(fake_server.base_url, scenario)
+
+        assert {response.json()["name"] for response in responses} == {movie_data["name"]}
+        samples = resilience["latency_recorder"].samples
+        assert len(samples[("GET", fake_server.base_url, "/movies/{id}")]) == 10, "Замеры latency не записаны"
+        assert len(samples[("POST", fake_server.base_url, "/movies")]) == 1
+
+    def test_retries_idempotent_request_on_503(self, fake_app, fake_server, resilience):
+        fake_app.fault_rate = 1.0
+
+        with pytest.raises(ValueError, match="503"):
+            run_against(fake_server.base_url, lambda api: api.movies_api.get_movies())
+
+        assert fake_app.requests_served == 3, "GET не повторён retries раз"
+        assert resilience["retry_policy"].retries_used == 2
+
+    def test_does_not_retry_post_on_503(self, fake_app, fake_server, resilience, movie_data):
+        fake_app.fault_rate = 1.0
+
+        with pytest.raises(ValueError, match="503"):
+            run_against(fake_server.base_url, lambda api: api.movies_api.create_movie(movie_data))
+
+        assert fake_app.requests_served == 1
+        assert resilience["retry_policy"].retries_used == 0
+
+    def test_circuit_opens_after_failures(self, fake_app, fake_server, resilience):
+        fake_app.fault_rate = 1.0
+
+        async def scenario(api):
+            with pytest.raises(ValueError):
+                await api.movies_api.get_movies()
+            with pytest.raises(CircuitOpenError):
+                await api.movies_api.get_movies()
+
+        run_against(fake_server.base_url, scenario)
+
+        assert fake_app.requests_served == 3, "Запрос ушёл на хост с открытой цепью"
+        breaker = resilience["circuit_breakers"].get(f"{fake_server.host}:{fake_server.port}")
+        assert breaker.state == breaker.OPEN
+
+    def test_retries_connect_error_for_any_method(self, resilience, movie_data):
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            port = listener.getsockname()[1]
+        # Порт освобождён и никто его не слушает
+
+        with pytest.raises(httpx.ConnectError):
+            run_against(f"http://127.0.0.1:{port}", lambda api: api.movies_api.create_movie(movie_data))
+
+        assert resilience["retry_policy"].retries_used == 2, "Запрос не дошёл до сервера - повтор безопасен и для POST"
@@ -0,0 +1,153 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api_clients.api_manager import ApiManager
+from db_models.movie import Base as MovieBase, MovieDBModel
+from db_models.user import Base as UserBase, UserDBModel
+from db_requester.db_helpers import DBHelper
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+from utils.cleanup_registry import CleanupRegistry
+
+
+def no_api():
+    raise AssertionError("API не должен вызываться")
+
+
+@pytest.fixture
+def sqlite_session_factory():
+    """Фабрика сессий in-memory SQLite с таблицами movies и users."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    MovieBase.metadata.create_all(engine)
+    UserBase.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    factory.connections = 0
+
+    @event.listens_for(engine, "checkout")
+    def count_checkout(*args):
+        factory.connections += 1
+
+    yield factory
+    engine.dispose()
+
+
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([MovieDBModel(id=movie_id, name=f"m{movie_id}") for movie_id in (1, 2, 3)])
+        session.add_all([UserDBModel(id=user_id, email=f"{user_id}@x.test") for user_id in ("u1", "u2", "other")])
+        session.commit()
+
+
+def remaining(session_factory):
+    with session_factory() as session:
+        return (sorted(movie.id for movie in session.query(MovieDBModel)),
+                sorted(user.id for user in session.query(UserDBModel)))
+
+
+@pytest.mark.unit
+class TestCleanupRegistryDB:
+
+    def test_deletes_only_registered_ids(self, sqlite_session_factory):
+        seed(sqlite_session_factory)
+        registry = CleanupRegistry(no_api, sqlite_session_factory, backend="db")
+        registry.register_movie(1)
+        registry.register_movie(99)  # уже удалён тестом
+        registry.register_user("u1")
+
+        registry.run()
+
+        assert remaining(sqlite_session_factory) == ([2, 3], ["other", "u2"])
+        assert registry.deleted == {"movies": 1, "users": 1}
+        assert registry.failed == {"movies": {}, "users": {}}
+
+    def test_sweep_by_prefix_only_when_enabled(self, sqlite_session_factory):
+        seed(sqlite_session_factory)
+        CleanupRegistry(no_api, sqlite_session_factory, backend="db").run()
+        assert remaining(sqlite_session_factory)[1] == ["other", "u1", "u2"]
+
+        CleanupRegistry(no_api, sqlite_session_factory, backend="db", sweep_email_prefix="u").run()
+        assert remaining(sqlite_session_factory)[1] == ["other"]
+
+    def test_nothing_registered_does_not_connect(self, sqlite_session_factory):
+        CleanupRegistry(no_api, sqlite_session_factory, backend="db").run()
+
+        assert sqlite_session_factory.connections == 0
+
+    def test_failure_rolls_back_all_tables(self, sqlite_session_factory, monkeypatch):
+        seed(sqlite_session_factory)
+        registry = CleanupRegistry(no_api, sqlite_session_factory, backend="db")
+        registry.register_movie(1)
+        registry.register_user("u1")
+        original = DBHelper.bulk_delete
+
+        def failing_bulk_delete(self, model, ids, *args, **kwargs):
+            if model is UserDBModel:
+                raise RuntimeError("FK violation")
+            return original(self, model, ids, *args, **kwargs)
+
+        monkeypatch.setattr(DBHelper, "bulk_delete", failing_bulk_delete)
+        registry.run()
+
+        assert remaining(sqlite_session_factory) == ([1, 2, 3], ["other", "u1", "u2"])
+        assert set(registry.failed["movies"]) == {1}
+        assert set(registry.failed["users"]) == {"u1"}
+        assert registry.deleted == {"movies": 0, "users": 0}
+
+
+@pytest.mark.unit
+class TestCleanupRegistryAPI:
+
+    @pytest.fixture
+    def admin_api_factory(self, fake_transport):
+        sessions = []
+
+        def factory():
+            api = ApiManager(fake_transport.new_session())
+            api.auth_api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+            sessions.append(api)
+            return api
+
+        factory.sessions = sessions
+        return factory
+
+    def test_deletes_via_api_and_ignores_already_deleted(self, fake_app, admin_api_factory):
+        movie_ids = sorted(fake_app.movies)[:2]
+        registry = CleanupRegistry(admin_api_factory, backend="api", workers=2)
+        for movie_id in movie_ids:
+            registry.register_movie(movie_id)
+        registry.register_movie(999999)  # тест удалил сам - 404 не считается ошибкой
+
+        registry.run()
+
+        assert not set(movie_ids) & set(fake_app.movies)
+        assert registry.deleted["movies"] == 2
+        assert registry.failed == {"movies": {}, "users": {}}
+
+    def test_auto_falls_back_to_api_when_db_fails(self, fake_app, admin_api_factory):
+        movie_id = sorted(fake_app.movies)[0]
+
+        def broken_db():
+            raise ConnectionError("db down")
+
+        registry = CleanupRegistry(admin_api_factory, broken_db, backend="auto")
+        registry.register_movie(movie_id)
+        registry.run()
+
+        assert movie_id not in fake_app.movies
+        assert registry.deleted["movies"] == 1
+
+    def test_login_failure_marks_everything_failed(self):
+        def failing_login():
+            raise ValueError("Unexpected status code: 401")
+
+        registry = CleanupRegistry(failing_login, backend="api")
+        registry.register_movie(1)
+        registry.register_user("u1")
+        registry.run()
+
+        assert registry.failed["movies"][1].startswith("ValueError")
+        assert registry.failed["users"]["u1"].startswith("ValueError")
+
+    def test_nothing_registered_does_not_login(self):
+        CleanupRegistry(no_api, backend="api").run()
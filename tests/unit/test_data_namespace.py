@@ -0,0 +1,62 @@
+import pytest
+
+from fake_cinescope.app import FakeCinescope
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+from utils import data_generator
+from utils.data_generator import DataGenerator, DataNamespace
+
+WORKERS = ["main"] + [f"gw{number}" for number in range(120)]
+
+
+@pytest.mark.unit
+class TestDataNamespace:
+
+    def test_prefixes_unique_across_workers(self):
+        prefixes = [DataNamespace(worker, run_uid="0123456789abcdef").email_prefix for worker in WORKERS]
+
+        assert len(set(prefixes)) == len(prefixes)
+        # Ни один префикс не начало другого (gw1 и gw10) - очистка по префиксу не заденет чужого воркера
+        assert not [(a, b) for a in prefixes for b in prefixes if a != b and b.startswith(a)]
+
+    def test_ids_unique_across_workers_and_runs(self):
+        namespaces = [DataNamespace(worker, run_uid=run) for run in ("aaaaaaaaaaa1", "aaaaaaaaaaa2")
+                      for worker in ("gw1", "gw11")]
+        ids = [namespace.next_id() for namespace in namespaces for _ in range(50)]
+
+        assert len(set(ids)) == len(ids)
+
+    def test_run_uid_is_long_enough(self):
+        assert len(DataNamespace().run_uid) == data_generator.RUN_UID_LENGTH >= 12
+
+    def test_seed_is_reproducible_per_worker(self):
+        first, again, other = (DataNamespace(worker, run_uid="r" * 12, seed="42") for worker in ("gw0", "gw0", "gw1"))
+
+        draws = [[namespace.random.random(), namespace.faker.first_name()] for namespace in (first, again, other)]
+        assert draws[0] == draws[1]
+        assert draws[0] != draws[2]
+
+
+@pytest.mark.unit
+def test_fake_stand_does_not_shift_test_data():
+    namespace = data_generator.data_namespace
+    state = (namespace.worker, namespace.run_uid, namespace.base_seed)
+    try:
+        namespace.configure(namespace.worker, namespace.run_uid, "fixed-seed")
+        expected = [DataGenerator.generate_random_email(), DataGenerator.generate_movie_price(),
+                    DataGenerator.generate_movie_description()]
+
+        namespace.configure(namespace.worker, namespace.run_uid, "fixed-seed")
+        FakeCinescope(FAKE_SUPER_ADMIN_CREDS, seed_movies=20)
+        actual = [DataGenerator.generate_random_email(), DataGenerator.generate_movie_price(),
+                  DataGenerator.generate_movie_description()]
+    finally:
+        namespace.configure(*state)
+
+    assert actual == expected
+
+
+@pytest.mark.unit
+def test_fake_stand_seed_is_reproducible():
+    first, second = (FakeCinescope(FAKE_SUPER_ADMIN_CREDS, seed_movies=3, seed=7) for _ in range(2))
+
+    assert [movie["name"] for movie in first.movies.values()] == [movie["name"] for movie in second.movies.values()]
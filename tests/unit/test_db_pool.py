@@ -0,0 +1,142 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import exc, text
+
+from db_requester import db_client
+from db_requester.engine_factory import EngineSettings, PoolStats, build_engine
+from plugins import db_pool
+from utils.stats import percentile
+
+
+class FakeConfig:
+    def __init__(self, **options):
+        self.options = options
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+class FakeTerminalReporter:
+    def __init__(self):
+        self.lines = []
+
+    def section(self, title):
+        self.lines.append(f"== {title}")
+
+    def write_line(self, line):
+        self.lines.append(line)
+
+
+@pytest.fixture
+def tiny_engine(tmp_path):
+    """Движок на файловой SQLite с пулом из одного соединения и коротким pool_timeout."""
+    settings = EngineSettings(pool_size=1, max_overflow=0, pool_timeout=0.05)
+    engine = build_engine(f"sqlite:///{tmp_path / 'pool.db'}", settings)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestPoolStats:
+
+    def test_counts_checkouts_and_peak(self, tiny_engine):
+        for _ in range(3):
+            with tiny_engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        summary = tiny_engine.pool.stats.summary()
+
+        assert summary["checkouts"] == 3
+        assert summary["peak_checked_out"] == 1
+        assert summary["connections_opened"] == 1, "Пул переоткрывал соединение вместо повторного использования"
+        assert summary["timeouts"] == 0
+
+    def test_exhausted_pool_counts_timeout(self, tiny_engine):
+        with tiny_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                tiny_engine.connect()
+        stats = tiny_engine.pool.stats
+
+        assert stats.timeouts == 1
+        assert len(stats.waits) == 2, "Ожидание пула записывается и для упавшей выдачи"
+        assert max(stats.waits) >= 0.05
+
+    def test_connect_error_is_not_pool_wait(self, tmp_path):
+        engine = build_engine(f"sqlite:///{tmp_path / 'missing' / 'pool.db'}", EngineSettings(pre_ping=False))
+
+        with pytest.raises(exc.OperationalError):
+            engine.connect()
+        assert engine.pool.stats.waits == [] and engine.pool.stats.timeouts == 0
+
+    def test_dispose_keeps_stats(self, tiny_engine):
+        stats = tiny_engine.pool.stats
+        tiny_engine.dispose()
+        with tiny_engine.connect():
+            pass
+
+        assert tiny_engine.pool.stats is stats
+        assert stats.checkouts == 1
+
+    def test_summary_of_empty_stats(self):
+        summary = PoolStats().summary()
+
+        assert summary["wait_p95_ms"] == 0.0 and summary["wait_max_ms"] == 0.0
+
+
+@pytest.mark.unit
+def test_percentile_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.unit
+class TestDbPoolPlugin:
+
+    @pytest.fixture
+    def process_engine(self, tiny_engine, monkeypatch):
+        """Подменяет движок процесса db_client на tiny_engine."""
+        monkeypatch.setattr(db_client, "_engine", tiny_engine)
+        monkeypatch.setattr(db_client, "pool_stats", tiny_engine.pool.stats)
+        monkeypatch.setattr(db_client, "engine_settings", EngineSettings(pool_size=1, max_overflow=0))
+        with tiny_engine.connect():
+            pass
+        return tiny_engine
+
+    def test_writes_report_per_worker(self, process_engine, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        config = FakeConfig(**{"--db-pool-report": str(tmp_path / "pool.json")})
+
+        db_pool.pytest_sessionfinish(SimpleNamespace(config=config))
+        report = json.loads((tmp_path / "pool_gw3.json").read_text(encoding="utf-8"))
+
+        assert report["worker"] == "gw3"
+        assert report["pool_size"] == 1 and report["max_overflow"] == 0
+        assert report["checkouts"] == 1
+
+    def test_terminal_summary(self, process_engine, tmp_path, monkeypatch):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        config = FakeConfig(**{"--db-pool-report": str(tmp_path / "pool.json")})
+        reporter = FakeTerminalReporter()
+
+        db_pool.pytest_terminal_summary(reporter, config)
+
+        assert reporter.lines[0] == "== DB connection pool"
+        assert "checkouts=1" in reporter.lines[1]
+        assert "timeouts=0" in reporter.lines[2]
+        assert reporter.lines[-1] == f"JSON: {tmp_path / 'pool.json'}"
+
+    def test_no_engine_no_report(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(db_client, "_engine", None)
+        config = FakeConfig(**{"--db-pool-report": str(tmp_path / "pool.json")})
+        reporter = FakeTerminalReporter()
+
+        db_pool.pytest_sessionfinish(SimpleNamespace(config=config))
+        db_pool.pytest_terminal_summary(reporter, config)
+
+        assert not (tmp_path / "pool.json").exists()
+        assert reporter.lines == []
@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+from custom_requester.deadline import RequestTimeoutError, resolve_timeout, test_deadline
+
+
+def _in_thread(func):
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=func()))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+@pytest.mark.unit
+class TestTestDeadline:
+
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        yield
+        test_deadline.clear()
+
+    def test_caps_timeout_in_test_thread(self):
+        test_deadline.start(2)
+
+        connect, read = resolve_timeout((5, 30), "GET", "http://stand/movies")
+        assert connect <= 2 and read <= 2, "Таймаут не урезан дедлайном теста"
+
+    def test_background_thread_not_capped(self):
+        test_deadline.start(2)
+
+        assert _in_thread(test_deadline.remaining) is None, "Дедлайн теста виден фоновому потоку"
+        assert _in_thread(lambda: resolve_timeout((5, 30), "GET", "http://stand/movies")) == (5, 30)
+
+    def test_expired_deadline_only_fails_test_thread(self):
+        test_deadline.start(0)
+
+        with pytest.raises(RequestTimeoutError):
+            resolve_timeout(5, "GET", "http://stand/movies")
+        assert _in_thread(lambda: resolve_timeout(5, "GET", "http://stand/movies")) == (5, 5)
+
+    def test_background_start_does_not_leak_into_test_thread(self):
+        _in_thread(lambda: test_deadline.start(0))
+
+        assert not test_deadline.active
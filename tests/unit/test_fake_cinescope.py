@@ -0,0 +1,238 @@
+import time
+
+import pytest
+
+from constants.constants import (AUTH_BASE_URL, CONFIRM_EMAIL_ENDPOINT, LOGIN_ENDPOINT, LOGOUT_ENDPOINT,
+                                 MOVIES_BASE_URL, MOVIES_ENDPOINT, REFRESH_TOKENS_ENDPOINT, REGISTER_ENDPOINT)
+from constants.roles import Roles
+from fake_cinescope.app import REFRESH_COOKIE, decode_jwt, encode_jwt
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+PASSWORD = "Passw0rdOk"
+
+
+def user_payload(email, **extra):
+    return {"email": email, "fullName": "Test User", "password": PASSWORD, "passwordRepeat": PASSWORD, **extra}
+
+
+def movie_payload(name, **extra):
+    return {"name": name, "price": 100, "description": "d", "location": "MSK", "published": True, "genreId": 1,
+            **extra}
+
+
+class Client:
+    """Сессия fake_transport с токеном пользователя (или без него)."""
+
+    def __init__(self, transport, creds=None):
+        self.session = transport.new_session()
+        if creds is not None:
+            response = self.post(AUTH_BASE_URL, LOGIN_ENDPOINT, {"email": creds[0], "password": creds[1]})
+            assert response.status_code == 200, response.text
+            self.session.headers["authorization"] = f"Bearer {response.json()['accessToken']}"
+
+    def request(self, method, base_url, endpoint, json=None, **kwargs):
+        return self.session.request(method, f"{base_url}{endpoint}", json=json, **kwargs)
+
+    def get(self, base_url, endpoint, **kwargs):
+        return self.request("GET", base_url, endpoint, **kwargs)
+
+    def post(self, base_url, endpoint, json=None):
+        return self.request("POST", base_url, endpoint, json)
+
+
+@pytest.fixture
+def super_admin(fake_transport):
+    return Client(fake_transport, FAKE_SUPER_ADMIN_CREDS)
+
+
+@pytest.fixture
+def client_with_role(fake_transport, super_admin):
+    """Фабрика клиентов, залогиненных пользователем с заданной ролью."""
+    def factory(role: Roles):
+        email = f"{role.value.lower()}@fake.test"
+        response = super_admin.post(AUTH_BASE_URL, "/user", user_payload(email, roles=[role.value], verified=True))
+        assert response.status_code == 201, response.text
+        return Client(fake_transport, (email, PASSWORD))
+    return factory
+
+
+@pytest.mark.unit
+class TestRouting:
+
+    def test_unknown_path_404(self, fake_transport):
+        response = Client(fake_transport).get(AUTH_BASE_URL, "/nope")
+
+        assert response.status_code == 404
+        assert response.json() == {"message": "Cannot GET /nope", "error": "Not Found", "statusCode": 404}
+
+    def test_wrong_method_405(self, fake_transport):
+        assert Client(fake_transport).request("PUT", AUTH_BASE_URL, LOGIN_ENDPOINT).status_code == 405
+
+    def test_injected_fault(self, fake_app, fake_transport):
+        fake_app.fault_rate = 1.0
+
+        response = Client(fake_transport).get(MOVIES_BASE_URL, MOVIES_ENDPOINT)
+
+        assert response.status_code == 503
+        assert fake_app.faults_injected == 1
+
+
+@pytest.mark.unit
+class TestAuth:
+
+    def test_register_and_login(self, fake_transport):
+        client = Client(fake_transport)
+
+        registered = client.post(AUTH_BASE_URL, REGISTER_ENDPOINT, user_payload("new@fake.test"))
+        assert registered.status_code == 201
+        assert "password" not in registered.json()
+        assert registered.json()["roles"] == [Roles.USER.value]
+
+        login = client.post(AUTH_BASE_URL, LOGIN_ENDPOINT, {"email": "new@fake.test", "password": PASSWORD})
+        assert login.status_code == 200
+        claims = decode_jwt(login.json()["accessToken"])
+        assert (claims["type"], claims["email"]) == ("access", "new@fake.test")
+
+    @pytest.mark.parametrize("change, message", [
+        ({"email": "not-an-email"}, "email"),
+        ({"password": "short", "passwordRepeat": "short"}, "Пароль"),
+        ({"passwordRepeat": "Other0ne1"}, "Пароли не совпадают"),
+    ])
+    def test_register_validation(self, fake_transport, change, message):
+        response = Client(fake_transport).post(AUTH_BASE_URL, REGISTER_ENDPOINT,
+                                               {**user_payload("bad@fake.test"), **change})
+
+        assert response.status_code == 400
+        assert message in response.json()["message"]
+
+    def test_register_duplicate_409(self, fake_transport):
+        client = Client(fake_transport)
+        client.post(AUTH_BASE_URL, REGISTER_ENDPOINT, user_payload("dup@fake.test"))
+
+        assert client.post(AUTH_BASE_URL, REGISTER_ENDPOINT, user_payload("dup@fake.test")).status_code == 409
+
+    def test_login_wrong_password_401(self, fake_transport):
+        response = Client(fake_transport).post(AUTH_BASE_URL, LOGIN_ENDPOINT,
+                                               {"email": FAKE_SUPER_ADMIN_CREDS[0], "password": "Wrong0ne"})
+
+        assert response.status_code == 401
+
+    def test_banned_user_cannot_login(self, fake_transport, super_admin):
+        super_admin.post(AUTH_BASE_URL, "/user", user_payload("banned@fake.test", banned=True))
+
+        response = Client(fake_transport).post(AUTH_BASE_URL, LOGIN_ENDPOINT,
+                                               {"email": "banned@fake.test", "password": PASSWORD})
+        assert response.status_code == 403
+
+    def test_refresh_by_cookie_and_logout(self, fake_transport, super_admin):
+        assert REFRESH_COOKIE in super_admin.session.cookies
+
+        refreshed = super_admin.get(AUTH_BASE_URL, REFRESH_TOKENS_ENDPOINT)
+        assert refreshed.status_code == 200
+        assert decode_jwt(refreshed.json()["accessToken"])["type"] == "access"
+
+        assert super_admin.get(AUTH_BASE_URL, LOGOUT_ENDPOINT).status_code == 200
+        assert super_admin.get(AUTH_BASE_URL, REFRESH_TOKENS_ENDPOINT).status_code == 401
+
+    def test_confirm_email(self, fake_app, fake_transport):
+        client = Client(fake_transport)
+        user_id = client.post(AUTH_BASE_URL, REGISTER_ENDPOINT, user_payload("confirm@fake.test")).json()["id"]
+
+        response = client.get(AUTH_BASE_URL, CONFIRM_EMAIL_ENDPOINT, params={"token": encode_jwt({"id": user_id, "exp": time.time() + 60})})
+
+        assert response.status_code == 200
+        assert fake_app.users[user_id]["verified"] is True
+
+    @pytest.mark.parametrize("token", [
+        "garbage",
+        "a.b.c",
+        encode_jwt({"id": "missing-user", "type": "access", "exp": time.time() + 60}),
+    ])
+    def test_invalid_access_token_401(self, fake_transport, token):
+        client = Client(fake_transport)
+        client.session.headers["authorization"] = f"Bearer {token}"
+
+        assert client.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Token")).status_code == 401
+
+    def test_expired_access_token_401(self, fake_app, fake_transport):
+        fake_app.access_token_ttl = -1
+
+        assert Client(fake_transport, FAKE_SUPER_ADMIN_CREDS).get(
+            AUTH_BASE_URL, f"/user/{FAKE_SUPER_ADMIN_CREDS[0]}").status_code == 401
+
+    def test_refresh_token_is_not_access_token(self, fake_transport):
+        client = Client(fake_transport)
+        login = client.post(AUTH_BASE_URL, LOGIN_ENDPOINT,
+                            {"email": FAKE_SUPER_ADMIN_CREDS[0], "password": FAKE_SUPER_ADMIN_CREDS[1]})
+        client.session.headers["authorization"] = f"Bearer {login.json()['refreshToken']}"
+
+        assert client.get(AUTH_BASE_URL, f"/user/{FAKE_SUPER_ADMIN_CREDS[0]}").status_code == 401
+
+
+@pytest.mark.unit
+class TestRoles:
+
+    def test_anonymous_cannot_create_movie(self, fake_transport):
+        assert Client(fake_transport).post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Anon")).status_code == 401
+
+    def test_user_cannot_manage_movies_or_users(self, client_with_role):
+        user = client_with_role(Roles.USER)
+
+        assert user.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("User")).status_code == 403
+        assert user.get(AUTH_BASE_URL, f"/user/{FAKE_SUPER_ADMIN_CREDS[0]}").status_code == 403
+
+    def test_admin_creates_but_cannot_delete(self, client_with_role):
+        admin = client_with_role(Roles.ADMIN)
+
+        created = admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Admin movie"))
+        assert created.status_code == 201
+        movie_id = created.json()["id"]
+        assert admin.request("DELETE", MOVIES_BASE_URL, f"{MOVIES_ENDPOINT}/{movie_id}").status_code == 403
+        assert admin.request("DELETE", AUTH_BASE_URL, f"/user/{FAKE_SUPER_ADMIN_CREDS[0]}").status_code == 403
+
+    def test_super_admin_deletes_movie(self, super_admin):
+        movie_id = super_admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Doomed")).json()["id"]
+
+        deleted = super_admin.request("DELETE", MOVIES_BASE_URL, f"{MOVIES_ENDPOINT}/{movie_id}")
+
+        assert deleted.status_code == 200
+        assert super_admin.get(MOVIES_BASE_URL, f"{MOVIES_ENDPOINT}/{movie_id}").status_code == 404
+
+
+@pytest.mark.unit
+class TestMovies:
+
+    def test_duplicate_name_409(self, super_admin):
+        super_admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Twice"))
+
+        assert super_admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Twice")).status_code == 409
+
+    def test_validation_lists_all_errors(self, super_admin):
+        response = super_admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT,
+                                    movie_payload("Bad", price="free", location="NYC"))
+
+        assert response.status_code == 400
+        assert len(response.json()["message"]) == 2
+
+    def test_partial_update(self, super_admin):
+        movie_id = super_admin.post(MOVIES_BASE_URL, MOVIES_ENDPOINT, movie_payload("Patched")).json()["id"]
+
+        response = super_admin.request("PATCH", MOVIES_BASE_URL, f"{MOVIES_ENDPOINT}/{movie_id}", {"genreId": 3})
+
+        assert response.status_code == 200
+        assert (response.json()["price"], response.json()["genre"]["name"]) == (100, "Фантастика")
+
+    def test_list_pagination_and_filters(self, fake_app, fake_transport):
+        client = Client(fake_transport)
+
+        page = client.get(MOVIES_BASE_URL, MOVIES_ENDPOINT, params={"pageSize": 2, "page": 2}).json()
+        assert (page["count"], page["pageCount"], len(page["movies"])) == (len(fake_app.movies), 3, 2)
+
+        filtered = client.get(MOVIES_BASE_URL, MOVIES_ENDPOINT, params={"locations": "SPB", "pageSize": 20}).json()
+        expected = sorted((movie["id"] for movie in fake_app.movies.values() if movie["location"] == "SPB"),
+                          reverse=True)
+        assert [movie["id"] for movie in filtered["movies"]] == expected
+
+    @pytest.mark.parametrize("params", [{"pageSize": 0}, {"pageSize": 21}, {"minPrice": 500, "maxPrice": 100}])
+    def test_list_bad_params_400(self, fake_transport, params):
+        assert Client(fake_transport).get(MOVIES_BASE_URL, MOVIES_ENDPOINT, params=params).status_code == 400
@@ -0,0 +1,76 @@
+import pytest
+
+from constants.constants import AUTH_BASE_URL, MOVIES_BASE_URL, MOVIES_ENDPOINT
+from custom_requester.http_transport import SharedHTTPAdapter, SharedHTTPTransport
+from custom_requester.inprocess_adapter import WSGIAdapter
+from fake_cinescope.server import FakeCinescopeServer
+
+
+@pytest.fixture
+def transport():
+    transport = SharedHTTPTransport(pool_connections=3, pool_maxsize=7, pool_block=True)
+    yield transport
+    transport.close()
+
+
+@pytest.fixture
+def fake_server(fake_app):
+    server = FakeCinescopeServer(fake_app).start()
+    yield server
+    server.stop()
+
+
+@pytest.mark.unit
+class TestSharedHTTPTransport:
+
+    def test_pool_settings(self, transport):
+        adapter = transport.adapter
+
+        assert isinstance(adapter, SharedHTTPAdapter)
+        assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (3, 7, True)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 7
+        assert adapter.poolmanager.pools._maxsize == 3
+
+    def test_sessions_share_adapter(self, transport):
+        first, second = transport.new_session(), transport.new_session()
+
+        for session in (first, second):
+            assert session.get_adapter("https://example.test/x") is transport.adapter
+            assert session.get_adapter("http://example.test/x") is transport.adapter
+        assert transport.sessions_created == 2
+
+    def test_sessions_keep_own_headers(self, transport):
+        first, second = transport.new_session(), transport.new_session()
+        first.headers["authorization"] = "Bearer first"
+
+        assert "authorization" not in second.headers
+
+    def test_app_mount_wins_over_network(self, fake_app, transport):
+        app_adapter = WSGIAdapter(fake_app)
+        transport.mount_app(AUTH_BASE_URL, app_adapter)
+
+        session = transport.new_session()
+
+        assert session.get_adapter(f"{AUTH_BASE_URL}/login") is app_adapter
+        assert session.get_adapter("http://other.test/login") is transport.adapter
+
+    def test_connections_reused_across_sessions(self, transport, fake_server):
+        sessions = [transport.new_session() for _ in range(2)]
+        for session in sessions + sessions[:1]:
+            assert session.get(f"{fake_server.base_url}{MOVIES_ENDPOINT}").status_code == 200
+            session.close()  # закрытие сессии не закрывает общий пул
+
+        stats = transport.stats()[f"http://{fake_server.host}:{fake_server.port}"]
+        assert stats == {"requests": 3, "pool_hits": 2, "pool_misses": 1}
+
+    def test_stats_survive_close(self, fake_app, fake_server):
+        transport = SharedHTTPTransport()
+        transport.mount_app(MOVIES_BASE_URL, WSGIAdapter(fake_app))
+        transport.new_session().get(f"{fake_server.base_url}{MOVIES_ENDPOINT}")
+        transport.new_session().get(f"{MOVIES_BASE_URL}{MOVIES_ENDPOINT}")
+
+        transport.close()
+
+        assert len(transport.adapter.poolmanager.pools) == 0, "Пулы не освобождены"
+        assert transport.stats()[f"{MOVIES_BASE_URL} (in-process)"]["requests"] == 1
+        assert transport.totals()["requests"] == 2
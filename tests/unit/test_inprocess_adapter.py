@@ -0,0 +1,122 @@
+import json
+
+import pytest
+import requests
+
+from custom_requester.inprocess_adapter import ASGIAdapter, WSGIAdapter
+
+BASE_URL = "http://app.test"
+
+
+class RecordingWSGIApp:
+    """WSGI-приложение, запоминающее environ и отдающее ответ кусками."""
+
+    def __init__(self, status="201 Created", headers=None, chunks=(b'{"ok": ', b"true}"), error=None):
+        self.status = status
+        self.headers = headers or [("Content-Type", "application/json"), ("X-Trace", "abc")]
+        self.chunks = chunks
+        self.error = error
+        self.environ = None
+        self.body = None
+        self.closed = False
+
+    def __call__(self, environ, start_response):
+        self.environ = environ
+        self.body = environ["wsgi.input"].read(int(environ["CONTENT_LENGTH"]))
+        if self.error is not None:
+            raise self.error
+        start_response(self.status, self.headers)
+        return self
+
+    def __iter__(self):
+        yield from self.chunks
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.mark.unit
+class TestWSGIAdapter:
+
+    def test_status_headers_and_body(self, session):
+        app = RecordingWSGIApp()
+        adapter = WSGIAdapter(app)
+        session.mount(BASE_URL, adapter)
+
+        response = session.post(f"{BASE_URL}/movies%20x?page=2", json={"name": "Фильм"},
+                                headers={"Authorization": "Bearer t"})
+
+        assert (response.status_code, response.reason) == (201, "Created")
+        assert response.headers["X-Trace"] == "abc"
+        assert response.json() == {"ok": True}
+        assert app.closed, "WSGI-итератор должен закрываться"
+        assert adapter.requests_handled == 1
+        environ = app.environ
+        assert (environ["REQUEST_METHOD"], environ["PATH_INFO"], environ["QUERY_STRING"]) == \
+               ("POST", "/movies x", "page=2")
+        assert environ["HTTP_AUTHORIZATION"] == "Bearer t"
+        assert environ["CONTENT_TYPE"] == "application/json"
+        assert json.loads(app.body) == {"name": "Фильм"}
+
+    def test_streamed_body(self, session):
+        chunks = [b'{"movies": [', b"1, ", b"2]}"]
+        session.mount(BASE_URL, WSGIAdapter(RecordingWSGIApp(status="200 OK", chunks=chunks)))
+
+        response = session.get(f"{BASE_URL}/movies", stream=True)
+
+        assert b"".join(response.iter_content(chunk_size=4)) == b"".join(chunks)
+
+    def test_set_cookie_goes_to_session(self, session):
+        headers = [("Content-Type", "application/json"), ("Set-Cookie", "refresh_token=r1; Path=/")]
+        session.mount(BASE_URL, WSGIAdapter(RecordingWSGIApp(status="200 OK", headers=headers)))
+
+        session.get(f"{BASE_URL}/login")
+
+        assert session.cookies.get("refresh_token") == "r1"
+
+    def test_app_exception_propagates(self, session):
+        session.mount(BASE_URL, WSGIAdapter(RecordingWSGIApp(error=RuntimeError("boom"))))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            session.get(f"{BASE_URL}/movies")
+
+
+async def asgi_app(scope, receive, send):
+    message = await receive()
+    body = json.dumps({"path": scope["path"], "body": message["body"].decode()}).encode()
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+@pytest.mark.unit
+class TestASGIAdapter:
+
+    def test_request_roundtrip(self, session):
+        adapter = ASGIAdapter(asgi_app)
+        session.mount(BASE_URL, adapter)
+        try:
+            response = session.post(f"{BASE_URL}/movies", data="payload")
+            assert response.json() == {"path": "/movies", "body": "payload"}
+        finally:
+            adapter.close()
+
+    def test_close_stops_loop_thread(self, session):
+        adapter = ASGIAdapter(asgi_app)
+        session.mount(BASE_URL, adapter)
+        session.get(f"{BASE_URL}/a")
+        thread, loop = adapter._thread, adapter._loop
+
+        adapter.close()
+
+        assert not thread.is_alive()
+        assert loop.is_closed()
+        assert session.get(f"{BASE_URL}/b").json()["path"] == "/b", "после close loop поднимается заново"
+        adapter.close()
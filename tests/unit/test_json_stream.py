@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from custom_requester.json_stream import iter_json_array
+
+DOCUMENTS = [
+    '{"avg":12.5,"movies":[1.25,2e3,3]}',
+    '{"count": 2, "movies": [{"id": 1, "name": "Фильм", "price": 10.0}, {"id": 22, "tags": [true, null]}], '
+    '"page": 1}',
+    '{"movies":[],"pageCount":0}',
+    '{"movies":[-1E-2,"a\\"b",false]}',
+]
+
+
+class ChunkedResponse:
+    """Ответ, отдающий тело заданными кусками байт (как iter_content при stream=True)."""
+
+    def __init__(self, chunks):
+        self.raw = object()  # без read1 - iter_json_array читает через iter_content
+        self._chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        yield from self._chunks
+
+    def close(self):
+        self.closed = True
+
+
+def split(document: str, *offsets):
+    data = document.encode("utf-8")
+    bounds = [0, *offsets, len(data)]
+    return [data[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+@pytest.mark.unit
+class TestIterJsonArray:
+
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_any_single_split_matches_json_loads(self, document):
+        expected = json.loads(document)["movies"]
+        for offset in range(len(document.encode("utf-8")) + 1):
+            response = ChunkedResponse(split(document, offset))
+            assert list(iter_json_array(response, "movies")) == expected, f"split at {offset}"
+            assert response.closed
+
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_byte_by_byte_matches_json_loads(self, document):
+        data = document.encode("utf-8")
+        chunks = [data[index:index + 1] for index in range(len(data))]
+        assert list(iter_json_array(ChunkedResponse(chunks), "movies")) == json.loads(document)["movies"]
+
+    def test_missing_key_yields_nothing(self):
+        assert list(iter_json_array(ChunkedResponse(split('{"page": 1.5}')), "movies")) == []
+
+    def test_broken_document_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(ChunkedResponse(split('{"movies": [1, 2')), "movies"))
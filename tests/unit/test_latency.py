@@ -0,0 +1,118 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from custom_requester.latency import LatencyRecorder, normalize_endpoint
+from plugins import latency as latency_plugin
+
+BASE_URL = "https://api.dev-cinescope.coconutqa.ru"
+
+
+class FakeConfig:
+    def __init__(self, workerinput=None, **options):
+        self.options = options
+        if workerinput is not None:
+            self.workerinput = workerinput
+            self.workeroutput = {}
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+class FakeTerminalReporter:
+    def __init__(self):
+        self.lines = []
+
+    def section(self, title):
+        self.lines.append(f"== {title}")
+
+    def write_line(self, line):
+        self.lines.append(line)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Свой LatencyRecorder вместо общего сборщика процесса."""
+    recorder = LatencyRecorder()
+    monkeypatch.setattr(latency_plugin, "latency_recorder", recorder)
+    return recorder
+
+
+@pytest.mark.unit
+class TestLatencyRecorder:
+
+    def test_groups_by_endpoint_template(self, recorder):
+        recorder.record("get", BASE_URL, "/movies/42", 0.010)
+        recorder.record("GET", BASE_URL, "/movies/7?x=1", 0.030)
+
+        (row,) = recorder.summary()
+        assert (row["method"], row["endpoint"], row["count"]) == ("GET", "/movies/{id}", 2)
+        assert row["max_ms"] == 30.0
+
+    def test_normalize_endpoint(self):
+        assert normalize_endpoint("/user/a@b.ru") == "/user/{id}"
+        assert normalize_endpoint("/confirm?token=x") == "/confirm"
+
+    def test_export_merge_roundtrip(self, recorder):
+        worker = LatencyRecorder()
+        worker.record("GET", BASE_URL, "/movies", 0.2)
+        recorder.record("GET", BASE_URL, "/movies", 0.1)
+
+        recorder.merge(json.loads(json.dumps(worker.export())))
+
+        assert recorder.samples[("GET", BASE_URL, "/movies")] == [0.1, 0.2]
+
+
+@pytest.mark.unit
+class TestLatencyPlugin:
+
+    def test_no_report_file_by_default(self, recorder, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        recorder.record("GET", BASE_URL, "/movies", 0.1)
+        config = FakeConfig(**{"--latency-report": None})
+        reporter = FakeTerminalReporter()
+
+        latency_plugin.pytest_sessionfinish(SimpleNamespace(config=config))
+        latency_plugin.pytest_terminal_summary(reporter, config)
+
+        assert list(tmp_path.iterdir()) == [], "Отчёт записан без --latency-report"
+        assert reporter.lines[0] == "== Endpoint latency (ms)"
+        assert not [line for line in reporter.lines if line.startswith("JSON:")]
+
+    def test_writes_report_when_requested(self, recorder, tmp_path):
+        recorder.record("POST", BASE_URL, "/movies", 0.05)
+        path = tmp_path / "latency.json"
+        config = FakeConfig(**{"--latency-report": str(path)})
+        reporter = FakeTerminalReporter()
+
+        latency_plugin.pytest_sessionfinish(SimpleNamespace(config=config))
+        latency_plugin.pytest_terminal_summary(reporter, config)
+
+        (row,) = json.loads(path.read_text(encoding="utf-8"))
+        assert (row["method"], row["count"], row["p95_ms"]) == ("POST", 1, 50.0)
+        assert reporter.lines[-1] == f"JSON: {path}"
+
+    def test_worker_hands_samples_to_controller(self, recorder, tmp_path):
+        path = tmp_path / "latency.json"
+        worker_samples = []
+        for worker, elapsed in (("gw0", 0.1), ("gw1", 0.3)):
+            recorder.reset()
+            recorder.record("GET", BASE_URL, "/movies", elapsed)
+            config = FakeConfig(workerinput={"workerid": worker}, **{"--latency-report": str(path)})
+            latency_plugin.pytest_sessionfinish(SimpleNamespace(config=config))
+            worker_samples.append(config.workeroutput)
+        assert not path.exists(), "Воркер сам пишет отчёт"
+
+        recorder.reset()
+        for workeroutput in worker_samples:
+            latency_plugin.pytest_testnodedown(SimpleNamespace(workeroutput=workeroutput), None)
+        latency_plugin.pytest_sessionfinish(SimpleNamespace(config=FakeConfig(**{"--latency-report": str(path)})))
+
+        (row,) = json.loads(path.read_text(encoding="utf-8"))
+        assert row["count"] == 2 and row["max_ms"] == 300.0
+
+    def test_crashed_worker_without_output(self, recorder):
+        latency_plugin.pytest_testnodedown(SimpleNamespace(), "worker crashed")
+
+        assert recorder.samples == {}
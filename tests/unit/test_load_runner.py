@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+
+from load import runner as runner_module
+from load.__main__ import print_report
+from load import scenarios
+from load.runner import Journey, LoadRunner, RatePacer, StepStats
+from load.scenarios import AdminMovieLifecycle, BrowseMovies
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(runner_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(runner_module.time, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.mark.unit
+class TestRatePacer:
+
+    def test_spaces_steps_evenly(self, clock):
+        pacer = RatePacer(rps=4)
+
+        assert [pacer.wait(stop_at=200.0) for _ in range(4)] == [True] * 4
+        assert clock.slept == [0.25, 0.25, 0.25]
+        assert clock.now == pytest.approx(100.75)
+
+    def test_does_not_catch_up_after_idle(self, clock):
+        pacer = RatePacer(rps=10)
+        pacer.wait(stop_at=200.0)
+        clock.now += 5  # пользователь долго ждал ответа - слоты за это время не копятся
+        pacer.wait(stop_at=200.0)
+        pacer.wait(stop_at=200.0)
+
+        assert clock.slept == [0.1]
+
+    def test_rejects_slot_after_stop(self, clock):
+        pacer = RatePacer(rps=2)
+
+        assert pacer.wait(stop_at=100.6) is True
+        assert pacer.wait(stop_at=100.6) is True
+        assert pacer.wait(stop_at=100.6) is False
+
+    def test_unlimited_only_checks_stop(self, clock):
+        pacer = RatePacer()
+
+        assert pacer.wait(stop_at=100.1) is True
+        clock.now = 100.1
+        assert pacer.wait(stop_at=100.1) is False
+        assert clock.slept == []
+
+
+@pytest.mark.unit
+def test_step_stats_summary():
+    stats = StepStats()
+    stats.durations = [i / 1000 for i in range(1, 101)]
+    stats.errors["ValueError: 500"] = 5
+
+    summary = stats.summary(elapsed=10.0)
+
+    assert (summary["count"], summary["errors"], summary["error_rate"], summary["rps"]) == (100, 5, 0.05, 10.0)
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"], summary["max_ms"]) == (50.0, 95.0, 99.0, 100.0)
+    assert summary["top_errors"] == {"ValueError: 500": 5}
+
+
+@pytest.mark.unit
+def test_journey_requires_run():
+    with pytest.raises(TypeError):
+        Journey()
+
+
+@pytest.mark.unit
+class TestLoadRunner:
+
+    def test_browse_journey_report(self, fake_transport):
+        runner = LoadRunner(BrowseMovies(), users=3, duration=0.3, rps=50, transport=fake_transport)
+
+        report = runner.run()
+
+        steps = report["steps"]
+        assert set(steps) == {"GET /movies", "GET /movies/{id}"}
+        assert steps["GET /movies"]["count"] >= 3
+        assert report["total"]["count"] == sum(step["count"] for step in steps.values())
+        assert report["total"]["errors"] == 0
+        assert report["total"]["count"] <= 0.3 * 50 + 1, "темп ограничен RatePacer"
+        assert runner.active_users == 0
+
+    def test_failed_step_is_recorded_and_iteration_stops(self, fake_transport):
+        class Failing(Journey):
+            name = "failing"
+            after_failure = threading.Event()
+
+            def run(self, vu):
+                with vu.step("GET /movies/{id}"):
+                    vu.api.movies_api.get_movie_by_id(999999)
+                self.after_failure.set()
+
+        journey = Failing()
+        report = LoadRunner(journey, users=1, duration=0.1, rps=50, transport=fake_transport).run()
+
+        step = report["steps"]["GET /movies/{id}"]
+        assert step["errors"] == step["count"] > 0
+        assert "ValueError" in next(iter(step["top_errors"]))
+        assert not journey.after_failure.is_set()
+
+    def test_admin_lifecycle_leaves_no_movies(self, fake_app, fake_transport, monkeypatch):
+        monkeypatch.setattr(scenarios.SuperAdminCreds, "USERNAME", FAKE_SUPER_ADMIN_CREDS[0])
+        monkeypatch.setattr(scenarios.SuperAdminCreds, "PASSWORD", FAKE_SUPER_ADMIN_CREDS[1])
+        movies_before = len(fake_app.movies)
+
+        report = LoadRunner(AdminMovieLifecycle(), users=2, duration=0.3, rps=30, transport=fake_transport).run()
+
+        assert report["steps"]["POST /movies"]["count"] == report["steps"]["DELETE /movies/{id}"]["count"] > 0
+        assert len(fake_app.movies) == movies_before
+
+
+@pytest.mark.unit
+def test_print_report(capsys):
+    stats = StepStats()
+    stats.durations = [0.01, 0.02]
+    stats.errors["ValueError: 500"] = 1
+    summary = stats.summary(elapsed=1.0)
+
+    print_report({"journey": "browse_movies", "users": 2, "elapsed_s": 1.0,
+                  "steps": {"GET /movies": summary}, "total": summary})
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "Journey: browse_movies, users: 2, elapsed: 1.0s" in lines
+    assert lines[3].split() == ["GET", "/movies", "2", "2.0", "50.00", "10.0", "20.0", "20.0", "20.0"]
+    assert lines[4].split()[0] == "TOTAL"
+    assert lines[-1].strip() == "1 x ValueError: 500"
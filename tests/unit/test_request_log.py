@@ -0,0 +1,53 @@
+import pytest
+import requests
+
+from custom_requester import request_log as request_log_module
+from custom_requester.request_log import RequestLogBuffer
+
+
+class ListLogger:
+    def __init__(self):
+        self.lines = []
+
+    def info(self, message):
+        self.lines.append(message)
+
+
+def make_response(url):
+    response = requests.Response()
+    response.status_code = 200
+    response.request = requests.Request("GET", url).prepare()
+    return response
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    monkeypatch.setattr(request_log_module.allure, "attach", lambda *args, **kwargs: None)
+    return RequestLogBuffer(mode=RequestLogBuffer.LAZY, capacity=10)
+
+
+@pytest.mark.unit
+class TestRequestLogBuffer:
+
+    def test_flush_outputs_only_requests_of_failed_test(self, buffer):
+        buffer.record(make_response("http://log.test/a"), "tests/test_x.py::test_a (call)")
+        buffer.record(make_response("http://log.test/b"), "tests/test_x.py::test_b (setup)")
+        logger = ListLogger()
+
+        assert buffer.flush(logger, "tests/test_x.py::test_a") == 1
+        assert "http://log.test/a" in logger.lines[0]
+        assert list(buffer.buffers) == ["tests/test_x.py::test_b"]
+
+    def test_sampled_requests_are_not_dumped_twice(self, buffer):
+        buffer.record(make_response("http://log.test/sampled"), "tests/test_x.py::test_a (call)", written=True)
+        buffer.record(make_response("http://log.test/pending"), "tests/test_x.py::test_a (call)")
+        logger = ListLogger()
+
+        assert buffer.flush(logger, "tests/test_x.py::test_a") == 1
+        assert "http://log.test/pending" in logger.lines[0]
+
+    def test_reset_drops_buffer_of_test(self, buffer):
+        buffer.record(make_response("http://log.test/a"), "tests/test_x.py::test_a (call)")
+        buffer.reset("tests/test_x.py::test_a")
+
+        assert buffer.flush(ListLogger(), "tests/test_x.py::test_a") == 0
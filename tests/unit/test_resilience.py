@@ -0,0 +1,168 @@
+import pytest
+import requests
+
+from custom_requester import deadline as deadline_module
+from custom_requester import resilience as resilience_module
+from custom_requester.deadline import TestDeadline, capped_by_deadline
+from custom_requester.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+URL = "http://breaker.test/movies"
+
+
+class FakeClock:
+    """Подменяет time.monotonic и time.sleep: время идёт только когда его двигает тест или sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(resilience_module.time, "sleep", fake.sleep)
+    return fake
+
+
+@pytest.fixture
+def deadline(monkeypatch, clock):
+    test_deadline = TestDeadline()
+    monkeypatch.setattr(resilience_module, "test_deadline", test_deadline)
+    return test_deadline
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("breaker.test", failure_threshold=3, reset_timeout=30.0)
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request("GET", URL)
+        breaker.record_failure()
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+
+    @pytest.mark.parametrize("method, expected", [("GET", True), ("DELETE", True), ("POST", False)])
+    def test_retries_only_idempotent_methods_on_5xx(self, method, expected):
+        assert RetryPolicy().should_retry(method, 0, status=503) is expected
+
+    def test_does_not_retry_client_errors(self):
+        assert RetryPolicy().should_retry("GET", 0, status=404) is False
+
+    def test_retries_post_only_on_connect_errors(self):
+        policy = RetryPolicy()
+        assert policy.should_retry("POST", 0, exc=requests.exceptions.ConnectTimeout()) is True
+        assert policy.should_retry("POST", 0, exc=requests.exceptions.ReadTimeout()) is False
+        assert policy.should_retry("GET", 0, exc=requests.exceptions.ReadTimeout()) is True
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(retries=2)
+        assert [policy.should_retry("GET", attempt, status=502) for attempt in range(3)] == [True, True, False]
+
+    def test_session_budget_is_shared(self):
+        policy = RetryPolicy(retries=5, budget=2)
+        assert [policy.should_retry("GET", 0, status=503) for _ in range(3)] == [True, True, False]
+        assert policy.retries_used == 2
+
+    def test_backoff_is_capped(self, monkeypatch):
+        monkeypatch.setattr(resilience_module.random, "uniform", lambda low, high: high)
+        policy = RetryPolicy(backoff_base=0.2, backoff_max=1.0)
+        assert [policy.backoff(attempt) for attempt in range(4)] == [0.2, 0.4, 0.8, 1.0]
+
+    def test_sleep_waits_backoff(self, clock, deadline, monkeypatch):
+        monkeypatch.setattr(resilience_module.random, "uniform", lambda low, high: high)
+        assert RetryPolicy(backoff_base=0.5).sleep(1) is True
+        assert clock.slept == [1.0]
+
+    def test_sleep_skips_retry_past_test_deadline(self, clock, deadline, monkeypatch):
+        monkeypatch.setattr(resilience_module.random, "uniform", lambda low, high: high)
+        monkeypatch.setattr(deadline_module.time, "monotonic", clock.monotonic)
+        deadline.start(0.5)
+        assert RetryPolicy(backoff_base=1.0).sleep(0) is False
+        assert clock.slept == []
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold_consecutive_failures(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        open_breaker(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 1
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("GET", URL)
+
+    def test_half_open_lets_single_trial_through(self, breaker, clock):
+        open_breaker(breaker)
+        clock.now += 29.9
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("GET", URL)
+
+        clock.now += 0.1
+        breaker.before_request("GET", URL)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError, match="trial request in flight"):
+            breaker.before_request("GET", URL)
+
+    def test_successful_trial_closes_circuit(self, breaker, clock):
+        open_breaker(breaker)
+        clock.now += 30
+        breaker.before_request("GET", URL)
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failures == 0
+        breaker.before_request("GET", URL)
+        breaker.before_request("GET", URL)
+
+    def test_failed_trial_reopens_circuit(self, breaker, clock):
+        open_breaker(breaker)
+        clock.now += 30
+        breaker.before_request("GET", URL)
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("GET", URL)
+        clock.now += 30
+        breaker.before_request("GET", URL)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_released_trial_allows_next_trial(self, breaker, clock):
+        open_breaker(breaker)
+        clock.now += 30
+        breaker.before_request("GET", URL)
+        breaker.release_trial()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_request("GET", URL)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("GET", URL)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("timeout, resolved, expected", [
+    ((3.05, 10.0), (3.05, 10.0), False),
+    ((3.05, 10.0), (3.05, 0.5), True),
+    (5.0, (0.5, 0.5), True),
+    ((3.05, None), (3.05, None), False),
+])
+def test_capped_by_deadline(timeout, resolved, expected):
+    assert capped_by_deadline(timeout, resolved) is expected
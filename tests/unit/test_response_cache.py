@@ -0,0 +1,151 @@
+import json
+
+import pytest
+import requests
+
+from custom_requester import response_cache as response_cache_module
+from custom_requester.custom_requester import CustomRequester
+from custom_requester.inprocess_adapter import WSGIAdapter
+from custom_requester.response_cache import ResponseCache, response_cache
+
+BASE_URL = "http://cache.test"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_response(status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def cache(clock):
+    cache = ResponseCache(maxsize=2, ttl=10.0)
+    cache.enabled = True
+    return cache
+
+
+@pytest.mark.unit
+class TestResponseCache:
+
+    def test_hit_after_put(self, cache):
+        key = cache.make_key(f"{BASE_URL}/movies", {"page": 1}, "Bearer a")
+        response = make_response()
+        cache.put(key, response)
+
+        assert cache.get(key) is response
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_miss_for_unknown_key_and_other_status(self, cache):
+        key = cache.make_key(f"{BASE_URL}/movies", None, None)
+        assert cache.get(key) is None
+        cache.put(key, make_response(200))
+
+        assert cache.get(key, expected_status=404) is None
+        assert cache.get(key) is None, "запись с неожиданным статусом должна удаляться"
+        assert cache.misses == 3
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        key = cache.make_key(f"{BASE_URL}/movies/1", None, None)
+        cache.put(key, make_response())
+
+        clock.now += 9.9
+        assert cache.get(key) is not None
+        clock.now += 0.2
+        assert cache.get(key) is None
+
+    def test_lru_evicts_least_recently_used(self, cache):
+        first, second, third = (cache.make_key(f"{BASE_URL}/movies/{n}", None, None) for n in (1, 2, 3))
+        cache.put(first, make_response())
+        cache.put(second, make_response())
+        cache.get(first)  # first становится самым свежим
+        cache.put(third, make_response())
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+
+    def test_invalidate_drops_resource_and_its_lists(self, clock):
+        cache = ResponseCache(maxsize=10, ttl=10.0)
+        keys = [cache.make_key(url, None, identity) for url, identity in [
+            (f"{BASE_URL}/movies", "Bearer a"),
+            (f"{BASE_URL}/movies/5", "Bearer b"),
+            (f"{BASE_URL}/movies?page=2", None),
+            (f"{BASE_URL}/user/5", "Bearer a"),
+            (f"{BASE_URL}/moviesarchive", None),
+        ]]
+        for key in keys:
+            cache.put(key, make_response())
+
+        assert cache.invalidate(f"{BASE_URL}/movies/5") == 3
+        assert [cache.get(key) is not None for key in keys] == [False, False, False, True, True]
+
+    def test_key_depends_on_params_identity_and_cookies(self):
+        url = f"{BASE_URL}/movies"
+        base = ResponseCache.make_key(url, {"page": 1, "pageSize": 10}, "Bearer a", {"refresh_token": "x"})
+
+        assert base == ResponseCache.make_key(url, [("pageSize", 10), ("page", "1")], "Bearer a",
+                                              {"refresh_token": "x"})
+        assert base != ResponseCache.make_key(url, {"page": 2, "pageSize": 10}, "Bearer a", {"refresh_token": "x"})
+        assert base != ResponseCache.make_key(url, {"page": 1, "pageSize": 10}, "Bearer b", {"refresh_token": "x"})
+        assert base != ResponseCache.make_key(url, {"page": 1, "pageSize": 10}, "Bearer a", {"refresh_token": "y"})
+
+
+@pytest.mark.unit
+class TestCustomRequesterCaching:
+    """Кэшируются только GET, помеченные cacheable=True; auth-эндпоинты всегда идут в сеть."""
+
+    @pytest.fixture
+    def requester(self):
+        calls = []
+
+        def app(environ, start_response):
+            calls.append(environ["PATH_INFO"])
+            start_response("200 OK", [("Content-Type", "application/json")])
+            return [json.dumps({"call": len(calls)}).encode()]
+
+        session = requests.Session()
+        session.mount(BASE_URL, WSGIAdapter(app))
+        response_cache.configure(enabled=True, maxsize=16, ttl=60.0)
+        requester = CustomRequester(session, BASE_URL)
+        yield requester, calls
+        response_cache.configure(enabled=False)
+        session.close()
+
+    def test_cacheable_get_is_served_from_cache(self, requester):
+        requester, calls = requester
+        first = requester.send_request("GET", "/movies", need_logging=False, cacheable=True)
+        second = requester.send_request("GET", "/movies", need_logging=False, cacheable=True)
+
+        assert first is second
+        assert calls == ["/movies"]
+
+    def test_auth_get_is_never_cached(self, requester):
+        requester, calls = requester
+        for _ in range(2):
+            requester.send_request("GET", "/refresh-tokens", need_logging=False)
+
+        assert calls == ["/refresh-tokens", "/refresh-tokens"]
+
+    def test_cookies_separate_identities(self, requester):
+        requester, calls = requester
+        requester.session.cookies.set("refresh_token", "first")
+        requester.send_request("GET", "/user/1", need_logging=False, cacheable=True)
+        requester.session.cookies.set("refresh_token", "second")
+        requester.send_request("GET", "/user/1", need_logging=False, cacheable=True)
+
+        assert calls == ["/user/1", "/user/1"]
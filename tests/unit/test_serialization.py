@@ -0,0 +1,69 @@
+import datetime
+import json
+
+import pytest
+
+from constants.roles import Roles
+from custom_requester import serialization
+from custom_requester.serialization import dumps, serialize_body
+from models.base_models import TestUser as UserModel  # псевдоним: pytest не собирает его как тестовый класс
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Оба бэкенда dumps: orjson (если установлен) и стандартный json."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson не установлен")
+    return request.param
+
+
+@pytest.mark.unit
+class TestDumps:
+
+    def test_enum_and_dates(self, backend):
+        data = {"roles": [Roles.ADMIN], "at": datetime.datetime(2024, 1, 2, 3, 4, 5), "day": datetime.date(2024, 1, 2)}
+
+        assert json.loads(dumps(data)) == {"roles": ["ADMIN"], "at": "2024-01-02T03:04:05", "day": "2024-01-02"}
+
+    def test_non_ascii_is_utf8_not_escaped(self, backend):
+        body = dumps({"name": "Фильм"})
+
+        assert "Фильм".encode("utf-8") in body
+        assert b"\\u" not in body
+
+    def test_unsupported_type(self, backend):
+        with pytest.raises(TypeError):
+            dumps({"value": object()})
+
+
+@pytest.mark.unit
+class TestSerializeBody:
+
+    def test_none_has_no_body(self):
+        assert serialize_body(None) is None
+
+    @pytest.mark.parametrize("data", [b'{"raw": 1}', bytearray(b'{"raw": 1}')])
+    def test_bytes_pass_through(self, data):
+        body = serialize_body(data)
+
+        assert body == b'{"raw": 1}' and type(body) is bytes
+
+    def test_pydantic_model_excludes_unset(self):
+        user = UserModel(email="a@b.ru", fullName="Имя", password="Passw0rd", passwordRepeat="Passw0rd",
+                        verified=True)
+
+        body = json.loads(serialize_body(user))
+
+        assert body == {"email": "a@b.ru", "fullName": "Имя", "password": "Passw0rd", "passwordRepeat": "Passw0rd",
+                        "verified": True}
+
+    def test_pydantic_enum_as_value(self):
+        user = UserModel(email="a@b.ru", fullName="Имя", password="Passw0rd", passwordRepeat="Passw0rd",
+                        roles=[Roles.SUPER_ADMIN])
+
+        assert json.loads(serialize_body(user))["roles"] == ["SUPER_ADMIN"]
+
+    def test_dict_and_list(self, backend):
+        assert json.loads(serialize_body([{"genreId": 1, "published": False}])) == [{"genreId": 1, "published": False}]
@@ -0,0 +1,115 @@
+import time
+
+import pytest
+
+from api_clients import auth_api as auth_api_module
+from api_clients.auth_api import AuthAPI
+from api_clients.token_cache import DEFAULT_TOKEN_TTL, CachedToken, TokenCache
+from fake_cinescope.app import encode_jwt
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Свой TokenCache вместо общего кэша процесса."""
+    cache = TokenCache(refresh_margin=60)
+    monkeypatch.setattr(auth_api_module, "token_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def new_auth_api(fake_transport):
+    """Фабрика AuthAPI на отдельных сессиях - как у разных тестов одного прогона."""
+    return lambda: AuthAPI(fake_transport.new_session())
+
+
+@pytest.mark.unit
+class TestCachedToken:
+
+    def test_expiry_from_jwt_exp(self):
+        token = CachedToken.from_response({"accessToken": encode_jwt({"exp": 2_000_000_000}), "expiresIn": 5})
+
+        assert token.expires_at == 2_000_000_000
+
+    @pytest.mark.parametrize("expires_in, expected_offset", [
+        ((time.time() + 300) * 1000, 300),  # метка времени в миллисекундах
+        (time.time() + 300, 300),  # метка времени в секундах
+        (300, 300),  # время жизни
+        (None, DEFAULT_TOKEN_TTL),
+    ])
+    def test_expiry_fallbacks_for_opaque_token(self, expires_in, expected_offset):
+        token = CachedToken.from_response({"accessToken": "opaque", "expiresIn": expires_in})
+
+        assert token.expires_at - time.time() == pytest.approx(expected_offset, abs=5)
+
+    def test_dict_roundtrip(self):
+        token = CachedToken("t", 123.0, {"refresh_token": "r"}, {"user": {"id": "1"}})
+
+        restored = CachedToken.from_dict(token.to_dict())
+        assert restored.to_dict() == token.to_dict()
+
+
+@pytest.mark.unit
+class TestTokenCache:
+
+    def test_expired_token_is_evicted(self):
+        cache = TokenCache()
+        cache.put(FAKE_SUPER_ADMIN_CREDS, CachedToken("t", time.time() - 1))
+
+        assert cache.get(FAKE_SUPER_ADMIN_CREDS) is None
+        assert cache._tokens == {}
+
+    def test_key_ignores_extra_fields(self):
+        cache = TokenCache()
+        cache.put(("a@b.ru", "P", "extra"), CachedToken("t", time.time() + 600))
+
+        assert cache.get(("a@b.ru", "P")).access_token == "t"
+
+
+@pytest.mark.unit
+class TestAuthenticateWithCache:
+
+    def test_second_authenticate_is_cache_hit(self, fake_app, cache, new_auth_api):
+        first, second = new_auth_api(), new_auth_api()
+        first.authenticate(FAKE_SUPER_ADMIN_CREDS)
+        served = fake_app.requests_served
+
+        second.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        assert fake_app.requests_served == served, "Повторный логин при валидном токене в кэше"
+        assert (cache.logins, cache.hits) == (1, 1)
+        assert second.session.headers["authorization"] == first.session.headers["authorization"]
+        assert second.user_id == first.user_id
+
+    def test_refresh_before_expiry(self, fake_app, cache, new_auth_api):
+        fake_app.access_token_ttl = 30  # меньше refresh_margin - токен сразу "истекающий"
+        first = new_auth_api()
+        first.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        second = new_auth_api()
+        second.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        assert (cache.logins, cache.refreshes) == (1, 1)
+        assert second.session.headers["authorization"] != first.session.headers["authorization"]
+        assert second.user_profile == first.user_profile, "Профиль логина потерян после refresh"
+
+    def test_failed_refresh_falls_back_to_login(self, fake_app, cache, new_auth_api):
+        fake_app.access_token_ttl = 30
+        new_auth_api().authenticate(FAKE_SUPER_ADMIN_CREDS)
+        cached = cache.get(FAKE_SUPER_ADMIN_CREDS)
+        cached.cookies = {}  # refresh-cookie потерян - /refresh-tokens ответит 401
+
+        api = new_auth_api()
+        api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        assert (cache.logins, cache.refreshes) == (2, 0)
+        assert api.user_id == cache.get(FAKE_SUPER_ADMIN_CREDS).login_response["user"]["id"]
+
+    def test_disabled_cache_always_logs_in(self, cache, new_auth_api):
+        cache.enabled = False
+
+        for _ in range(2):
+            new_auth_api().authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        assert (cache.logins, cache.hits) == (0, 0)
+        assert cache._tokens == {}
@@ -0,0 +1,110 @@
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from api_clients import auth_api as auth_api_module
+from api_clients.auth_api import AuthAPI
+from api_clients.token_cache import CachedToken, TokenCache
+from api_clients.token_store import FileTokenStore
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+
+CREDS = ("user@fake.test", "Secret123")
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FileTokenStore(str(tmp_path / "tokens.json"))
+
+
+@pytest.mark.unit
+class TestFileTokenStore:
+
+    def test_write_read_roundtrip(self, store):
+        data = CachedToken("t", time.time() + 600, {"refresh_token": "r"}).to_dict()
+        with store.locked():
+            store.write(CREDS, data)
+
+        with store.locked():
+            assert store.read(CREDS) == data
+            assert store.read(("other@fake.test", "Secret123")) is None
+
+    def test_password_not_stored(self, store):
+        with store.locked():
+            store.write(CREDS, {"expires_at": time.time() + 600})
+
+        content = open(store.path, encoding="utf-8").read()
+        assert CREDS[1] not in content
+        assert list(json.loads(content)) == [store.key(CREDS)]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX-права файлов")
+    def test_files_are_private(self, store):
+        with store.locked():
+            store.write(CREDS, {"expires_at": time.time() + 600})
+
+        assert mode(store.path) == 0o600
+        assert mode(store.lock_path) == 0o600
+
+    def test_write_drops_expired_entries(self, store):
+        with store.locked():
+            store.write(("old@fake.test", "x"), {"expires_at": time.time() - 1})
+            store.write(CREDS, {"expires_at": time.time() + 600})
+
+            assert store.read(("old@fake.test", "x")) is None
+
+    def test_corrupted_file_reads_as_empty(self, store):
+        with open(store.path, "w", encoding="utf-8") as store_file:
+            store_file.write("{not json")
+
+        with store.locked():
+            assert store.read(CREDS) is None
+
+    def test_remove(self, store):
+        with store.locked():
+            store.write(CREDS, {"expires_at": time.time() + 600})
+
+        store.remove()
+        store.remove()  # повторное удаление не падает
+
+        assert not os.path.exists(store.path) and not os.path.exists(store.lock_path)
+
+    def test_lock_is_exclusive(self, store):
+        inside = []
+
+        def worker(name):
+            with store.locked():
+                inside.append(name)
+                time.sleep(0.05)
+                inside.append(name)
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert inside[0] == inside[1] and inside[2] == inside[3], "Два владельца блокировки одновременно"
+
+
+@pytest.mark.unit
+def test_workers_share_one_login(fake_app, fake_transport, store, monkeypatch):
+    """Два "воркера" со своими TokenCache и общим файлом: логинится только первый."""
+    first, second = TokenCache(store=store), TokenCache(store=store)
+
+    monkeypatch.setattr(auth_api_module, "token_cache", first)
+    AuthAPI(fake_transport.new_session()).authenticate(FAKE_SUPER_ADMIN_CREDS)
+    monkeypatch.setattr(auth_api_module, "token_cache", second)
+    api = AuthAPI(fake_transport.new_session())
+    served = fake_app.requests_served
+    api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+    assert fake_app.requests_served == served, "Второй воркер залогинился заново"
+    assert (first.logins, second.logins, second.hits) == (1, 0, 1)
+    assert api.user_id is not None
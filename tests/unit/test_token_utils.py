@@ -0,0 +1,78 @@
+import base64
+import json
+
+import pytest
+
+from api_clients import auth_api as auth_api_module
+from api_clients.auth_api import AuthAPI
+from api_clients.token_cache import CachedToken, TokenCache
+from constants.roles import Roles
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+from utils.token_utils import decode_jwt_payload
+
+
+def b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def jwt_with_payload(payload: bytes) -> str:
+    return f"{b64(b'{}')}.{b64(payload)}.sig"
+
+
+@pytest.mark.unit
+class TestDecodeJwtPayload:
+
+    def test_reads_claims_without_padding(self):
+        claims = {"id": "42", "roles": ["USER"], "exp": 1}
+
+        assert decode_jwt_payload(jwt_with_payload(json.dumps(claims).encode())) == claims
+
+    @pytest.mark.parametrize("token", [
+        None,
+        "",
+        "opaque-token",
+        "a.!!!.c",
+        jwt_with_payload(b"not json"),
+        jwt_with_payload(b"\xff\xfe"),
+        jwt_with_payload(b"[1, 2]"),
+        jwt_with_payload(b'"string"'),
+        jwt_with_payload(b"42"),
+    ])
+    def test_malformed_token_gives_empty_claims(self, token):
+        assert decode_jwt_payload(token) == {}
+
+
+@pytest.mark.unit
+class TestAuthApiClaims:
+
+    @pytest.fixture(autouse=True)
+    def cache(self, monkeypatch):
+        monkeypatch.setattr(auth_api_module, "token_cache", TokenCache())
+
+    def test_profile_and_claims_after_authenticate(self, fake_app, fake_transport):
+        api = AuthAPI(fake_transport.new_session())
+
+        api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+
+        assert api.user_profile["email"] == FAKE_SUPER_ADMIN_CREDS[0]
+        assert api.token_claims["type"] == "access"
+        assert api.user_id == api.token_claims["id"]
+        assert api.user_roles == [Roles.SUPER_ADMIN.value]
+        assert api.token_expires_at == api.token_claims["exp"]
+
+    def test_opaque_token_applies_without_claims(self, fake_transport):
+        api = AuthAPI(fake_transport.new_session())
+
+        api._apply_token(CachedToken.from_response({"accessToken": "opaque", "expiresIn": 60}))
+
+        assert api.token_claims == {}
+        assert api.user_id is None and api.user_roles == []
+        assert api.session.headers["authorization"] == "Bearer opaque"
+
+    def test_claims_fallback_when_profile_missing(self, fake_transport):
+        token = jwt_with_payload(json.dumps({"sub": "7", "roles": ["ADMIN"]}).encode())
+        api = AuthAPI(fake_transport.new_session())
+
+        api._apply_token(CachedToken.from_response({"accessToken": token}))
+
+        assert (api.user_id, api.user_roles) == ("7", ["ADMIN"])
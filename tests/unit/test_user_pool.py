@@ -0,0 +1,103 @@
+import pytest
+
+from api_clients.api_manager import ApiManager
+from resources.user_creds import FAKE_SUPER_ADMIN_CREDS
+from utils.user_pool import UserPool
+
+
+def wait_idle(pool, timeout=5.0):
+    """Ждёт окончания фонового сброса и пополнения пула."""
+    with pool._condition:
+        assert pool._condition.wait_for(lambda: pool._pending == 0, timeout=timeout)
+
+
+@pytest.fixture
+def admin_api(fake_transport):
+    api = ApiManager(fake_transport.new_session())
+    api.auth_api.authenticate(FAKE_SUPER_ADMIN_CREDS)
+    yield api
+    api.close_session()
+
+
+@pytest.fixture
+def pool(admin_api, fake_transport):
+    pool = UserPool(admin_api, fake_transport.new_session, size=3, low_watermark=2, workers=4)
+    yield pool
+    pool.close()
+
+
+def pool_user_ids(fake_app, pool):
+    return {user_id for user_id in pool.user_ids.values() if user_id in fake_app.users}
+
+
+@pytest.mark.unit
+class TestUserPool:
+
+    def test_fill_creates_logged_in_users(self, pool, fake_app):
+        pool.fill()
+
+        assert len(pool._available) == 3
+        assert len(pool_user_ids(fake_app, pool)) == 3
+        assert all(user.api.auth_api.user_id == pool.user_ids[user.email] for user in pool._available)
+
+    def test_lease_refills_below_low_watermark(self, pool):
+        pool.fill()
+        leased = [pool.lease(), pool.lease()]
+        wait_idle(pool)
+
+        assert pool.leases == 2
+        assert len(pool._available) == 3, "после двух аренд свободных стало меньше порога - пул дополнен"
+        assert len(pool.user_ids) == 5
+        assert leased[0].email != leased[1].email
+
+    def test_release_restores_default_state(self, pool, admin_api, fake_app):
+        pool.fill()
+        user = pool.lease()
+        user_id = pool.user_ids[user.email]
+        admin_api.user_api.edit_user(user_id, {"banned": True, "roles": ["ADMIN"], "verified": True})
+
+        pool.release(user)
+        wait_idle(pool)
+
+        assert user in pool._available
+        assert fake_app.users[user_id]["banned"] is False
+        assert fake_app.users[user_id]["roles"] == ["USER"]
+
+    def test_release_of_deleted_user_provisions_replacement(self, pool, admin_api):
+        pool.fill()
+        user = pool.lease()
+        admin_api.user_api.delete_user(pool.user_ids[user.email])
+
+        pool.release(user)
+        wait_idle(pool)
+
+        assert user.email not in pool.user_ids
+        assert user not in pool._available
+        assert len(pool._available) == 3
+
+    def test_unexpected_status_keeps_user_for_cleanup(self, pool, admin_api, fake_app, monkeypatch):
+        pool.fill()
+        user = pool.lease()
+        user_id = pool.user_ids[user.email]
+
+        def get_user_unavailable(locator, expected_status=200):
+            raise ValueError(f"Unexpected status code: 503. Expected: {expected_status}")
+
+        monkeypatch.setattr(admin_api.user_api, "get_user", get_user_unavailable)
+        pool.release(user)
+        wait_idle(pool)
+
+        assert pool.user_ids[user.email] == user_id, "id не теряется - его удалит close()"
+        assert user not in pool._available
+        monkeypatch.undo()
+        pool.close()
+        assert user_id not in fake_app.users
+
+    def test_close_deletes_all_pool_users(self, pool, fake_app):
+        pool.fill()
+        pool.lease()
+        created = set(pool.user_ids.values())
+
+        pool.close()
+
+        assert created and not created & set(fake_app.users)
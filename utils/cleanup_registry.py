@@ -0,0 +1,131 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from api_clients.api_manager import ApiManager
+from db_models.movie import MovieDBModel
+from db_models.user import UserDBModel
+from db_requester.db_helpers import DBHelper
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupRegistry:
+    """
+    Отложенная очистка созданных тестами сущностей.
+    Фикстуры регистрируют id фильмов и пользователей, а удаление выполняется один раз в конце сессии:
+    одним DELETE ... WHERE id IN (...) через БД, если она доступна, иначе параллельными запросами через API.
+    """
+
+    MOVIES = "movies"
+    USERS = "users"
+
+    def __init__(self, admin_api_factory, db_session_factory=None, backend="auto", workers=8,
+                 sweep_email_prefix=None):
+        """
+        :param admin_api_factory: Функция без аргументов, возвращающая ApiManager с авторизацией SUPER_ADMIN.
+            Вызывается, только если удалять приходится через API.
+        :param db_session_factory: Функция без аргументов, возвращающая новую сессию БД (None - только API).
+        :param backend: "auto" - БД с откатом на API, "db" - только БД, "api" - только API.
+        :param workers: Сколько запросов удаления выполнять параллельно.
+        :param sweep_email_prefix: Префикс email пространства имён воркера (DataNamespace.email_prefix).
+            Если задан, при очистке через БД удаляются и незарегистрированные пользователи с таким email.
+            БД стенда общая, поэтому это только явная опция (--cleanup-sweep-namespace), по умолчанию None.
+        """
+        self.admin_api_factory = admin_api_factory
+        self.db_session_factory = db_session_factory
+        self.backend = backend
+        self.workers = workers
+        self.sweep_email_prefix = sweep_email_prefix
+        self.registered = {self.MOVIES: set(), self.USERS: set()}
+        self.deleted = {self.MOVIES: 0, self.USERS: 0}
+        self.failed = {self.MOVIES: {}, self.USERS: {}}  # id -> причина
+        self._lock = threading.Lock()
+
+    def register_movie(self, movie_id):
+        with self._lock:
+            self.registered[self.MOVIES].add(movie_id)
+
+    def register_user(self, user_id):
+        with self._lock:
+            self.registered[self.USERS].add(user_id)
+
+    def run(self):
+        """Удаляет все зарегистрированные сущности. Неудалённые собираются в self.failed."""
+        with self._lock:
+            movie_ids = sorted(self.registered[self.MOVIES])
+            user_ids = sorted(self.registered[self.USERS])
+            self.registered = {self.MOVIES: set(), self.USERS: set()}
+        if not movie_ids and not user_ids and not self.sweep_email_prefix:
+            # Нечего удалять - к БД и API не подключаемся
+            return
+        if self.backend != "api" and self.db_session_factory is not None:
+            try:
+                self._delete_in_db(movie_ids, user_ids)
+                return
+            except Exception as e:
+                if self.backend == "db":
+                    reason = f"{type(e).__name__}: {e}"
+                    self.failed[self.MOVIES].update(dict.fromkeys(movie_ids, reason))
+                    self.failed[self.USERS].update(dict.fromkeys(user_ids, reason))
+                    return
+                logger.info(f"Cleanup: DB unavailable, falling back to API: {type(e).__name__} - {e}")
+        self._delete_via_api(movie_ids, user_ids)
+
+    def _delete_in_db(self, movie_ids, user_ids):
+        db_session = self.db_session_factory()
+        try:
+            db_helper = DBHelper(db_session)
+            # Все таблицы - одной транзакцией: при ошибке откатывается всё, и откат на API повторяет очистку целиком
+            # id, которых уже нет (тест удалил сам), просто не попадают в rowcount
+            movies_deleted = db_helper.bulk_delete(MovieDBModel, movie_ids, commit=False)
+            users_deleted = db_helper.bulk_delete(UserDBModel, user_ids, commit=False)
+            if self.sweep_email_prefix:
+                # Пользователи воркера, которых не зарегистрировала ни одна фикстура (регистрация в самих тестах)
+                users_deleted += db_helper.delete_users_by_email_prefix(self.sweep_email_prefix, commit=False)
+            db_session.commit()
+            self.deleted[self.MOVIES] += movies_deleted
+            self.deleted[self.USERS] += users_deleted
+        except Exception:
+            db_session.rollback()
+            raise
+        finally:
+            db_session.close()
+
+    def _delete_via_api(self, movie_ids, user_ids):
+        if not movie_ids and not user_ids:
+            return
+        try:
+            admin_api: ApiManager = self.admin_api_factory()
+        except Exception as e:
+            reason = f"{type(e).__name__}: {e}"
+            self.failed[self.MOVIES].update(dict.fromkeys(movie_ids, reason))
+            self.failed[self.USERS].update(dict.fromkeys(user_ids, reason))
+            return
+        movies_api = admin_api.movies_api
+        user_api = admin_api.user_api
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cleanup") as pool:
+                for movie_id in movie_ids:
+                    pool.submit(self._delete_one, self.MOVIES, movie_id,
+                                movies_api.delete_movie, movies_api.get_movie_by_id)
+                for user_id in user_ids:
+                    pool.submit(self._delete_one, self.USERS, user_id, user_api.delete_user, user_api.get_user)
+        finally:
+            admin_api.close_session()
+
+    def _delete_one(self, kind, entity_id, delete, get):
+        try:
+            delete(entity_id)
+        except Exception as e:
+            # Сущность могла удалить сам тест - это не ошибка очистки
+            try:
+                get(entity_id, expected_status=404)
+                return
+            except Exception:
+                pass
+            with self._lock:
+                self.failed[kind][entity_id] = f"{type(e).__name__}: {e}"
+            return
+        with self._lock:
+            self.deleted[kind] += 1
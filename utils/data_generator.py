@@ -1,18 +1,70 @@
 import datetime
+import hashlib
+import itertools
+import os
 import random
 import string
+from uuid import uuid4
 
 
 from faker import Faker
 
-faker = Faker()
+RUN_UID_LENGTH = 12  # hex-символов id прогона в префиксе: 48 бит, совпадение прогонов на общей БД практически исключено
+
+
+class DataNamespace:
+    """
+    Пространство имён тестовых данных процесса (воркера xdist).
+    Уникальные значения строятся из id прогона, id воркера и монотонного счётчика, поэтому
+    параллельные воркеры и повторные прогоны не пересекаются без повторов и 409 на /register.
+    У каждого воркера свой seed и свои экземпляры Random и Faker - данные воспроизводимы при том же seed,
+    и никто кроме DataGenerator (например, fake-стенд в том же процессе) их не сдвигает.
+    """
+
+    def __init__(self, worker="main", run_uid=None, seed=None):
+        """
+        :param worker: id воркера xdist (gw0, gw1, ...) или main без xdist.
+        :param run_uid: id прогона (testrunuid xdist); по умолчанию случайный для процесса.
+        :param seed: Базовый seed прогона; seed воркера выводится из него и worker.
+        """
+        self.random = random.Random()
+        self.faker = Faker()
+        self.configure(worker, run_uid, seed)
+
+    def configure(self, worker="main", run_uid=None, seed=None):
+        self.worker = worker
+        self.run_uid = (run_uid or uuid4().hex)[:RUN_UID_LENGTH].lower()
+        self.prefix = f"{self.run_uid}{worker.lower()}"
+        self.base_seed = seed if seed is not None else self.run_uid
+        self.seed = int(hashlib.sha256(f"{self.base_seed}:{worker}".encode()).hexdigest()[:8], 16)
+        # Те же объекты Random и Faker пересеиваются на месте - ссылки на них остаются валидными
+        self.random.seed(self.seed)
+        self.faker.seed_instance(self.seed)
+        self._counter = itertools.count(1)
+
+    def next_id(self) -> str:
+        """Уникальный в рамках прогона идентификатор: <run><worker>x<счётчик>."""
+        return f"{self.prefix}x{next(self._counter)}"
+
+    @property
+    def email_prefix(self) -> str:
+        """Начало всех email, сгенерированных этим воркером (для очистки по пространству имён)."""
+        return f"kek{self.prefix}x"
+
+
+# Пространство имён текущего процесса; под xdist воркер и прогон берутся из окружения,
+# seed можно задать опцией --data-seed (plugins.data_namespace)
+data_namespace = DataNamespace(worker=os.getenv("PYTEST_XDIST_WORKER", "main"),
+                               run_uid=os.getenv("PYTEST_XDIST_TESTRUNUID"))
+_random = data_namespace.random
+faker = data_namespace.faker
+
 
 class DataGenerator:
 
     @staticmethod
     def generate_random_email():
-        random_string = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-        return f"kek{random_string}@gmail.com"
+        return f"kek{data_namespace.next_id()}@gmail.com"
 
 
     @staticmethod
@@ -28,23 +80,24 @@ class DataGenerator:
               - Допустимые символы.
               - Длина от 8 до 20 символов.
               """
-        upper_letter = random.choice(string.ascii_uppercase)
-        lower_letter = random.choice(string.ascii_lowercase)
-        digit = random.choice(string.digits)
+        upper_letter = _random.choice(string.ascii_uppercase)
+        lower_letter = _random.choice(string.ascii_lowercase)
+        digit = _random.choice(string.digits)
         special_chars = "?@#$%^&*|:"
         all_chars = string.ascii_letters + string.digits + special_chars
-        remaining_length = random.randint(5, 17)
+        remaining_length = _random.randint(5, 17)
 
-        remaining_chars  = ''.join(random.choices(all_chars, k=remaining_length))
+        remaining_chars  = ''.join(_random.choices(all_chars, k=remaining_length))
 
         password = list(upper_letter + lower_letter + digit + remaining_chars)
-        random.shuffle(password)
+        _random.shuffle(password)
 
         return ''.join(password)
 
     @staticmethod
     def generate_movie_name():
-        return faker.sentence(nb_words=3).rstrip(".")
+        # Суффикс из пространства имён - у сервиса название фильма уникально
+        return f'{faker.sentence(nb_words=3).rstrip(".")} {data_namespace.next_id()}'
 
     @staticmethod
     def generate_movie_image_url():
@@ -52,7 +105,7 @@ class DataGenerator:
 
     @staticmethod
     def generate_movie_price(min_price: int = 50, max_price: int = 500):
-        return random.randint(min_price, max_price)
+        return _random.randint(min_price, max_price)
 
     @staticmethod
     def generate_movie_description():
@@ -60,7 +113,7 @@ class DataGenerator:
 
     @staticmethod
     def generate_movie_location():
-        return random.choice(["SPB", "MSK"])
+        return _random.choice(["SPB", "MSK"])
 
     @staticmethod
     def generate_movie_published():
@@ -68,24 +121,24 @@ class DataGenerator:
 
     @staticmethod
     def generate_movie_genre_id():
-        return random.randint(1, 5)
+        return _random.randint(1, 5)
 
     @staticmethod
     def generate_movie_genre():
-        return random.choice(["Драма", "Комедия", "Фантастика", "Криминал",
-                              "Триллер", "Аниме", "Мюзикл", "Фэнтези", "Анимация"]
-                             )
+        return _random.choice(["Драма", "Комедия", "Фантастика", "Криминал",
+                               "Триллер", "Аниме", "Мюзикл", "Фэнтези", "Анимация"]
+                              )
 
     @staticmethod
     def query_params():
         city_list = ["MSK", "SPB"]
         return {
-            "pageSize": random.randint(1, 10),
-            "page": random.randint(1, 10),
-            "minPrice": random.randint(1, 1000),
-            "locations": random.choice(city_list),
+            "pageSize": _random.randint(1, 10),
+            "page": _random.randint(1, 10),
+            "minPrice": _random.randint(1, 1000),
+            "locations": _random.choice(city_list),
             "published": True,
-            "genreId": random.randint(1, 10),
+            "genreId": _random.randint(1, 10),
             "createdAt": "asc"
         }
 
@@ -108,6 +161,6 @@ class DataGenerator:
 
     @classmethod
     def generate_random_int(cls, param):
-        return random.randint(0, param)
+        return _random.randint(0, param)
 
 
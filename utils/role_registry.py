@@ -0,0 +1,66 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from api_clients.api_manager import ApiManager
+from constants.roles import Roles
+from entities.user import User
+from models.base_models import TestUser
+from resources.user_creds import SuperAdminCreds
+from utils.data_generator import DataGenerator
+
+
+class RoleRegistry:
+    """
+    По одному авторизованному пользователю (User с ApiManager) на каждую роль из Roles на весь прогон.
+    При первом обращении все роли создаются и логинятся параллельно, дальше отдаются готовыми.
+    Пользователи общие для тестов - менять их (роли, бан, логаут) в тестах нельзя.
+    """
+
+    def __init__(self, admin_api: ApiManager, session_factory, cleanup_registry=None):
+        """
+        :param admin_api: ApiManager с авторизацией SUPER_ADMIN - создаёт пользователей USER и ADMIN.
+        :param session_factory: Функция без аргументов, возвращающая новую requests.Session.
+        :param cleanup_registry: CleanupRegistry, в котором регистрируются созданные пользователи.
+        """
+        self.admin_api = admin_api
+        self.session_factory = session_factory
+        self.cleanup_registry = cleanup_registry
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(Roles), thread_name_prefix="role-registry")
+
+    def _build(self, role: Roles) -> User:
+        if role == Roles.SUPER_ADMIN:
+            user = User(SuperAdminCreds.USERNAME, SuperAdminCreds.PASSWORD, [role.value],
+                        ApiManager(self.session_factory()))
+        else:
+            password = DataGenerator.generate_random_password()
+            user_data = TestUser(
+                email=DataGenerator.generate_random_email(),
+                fullName=DataGenerator.generate_random_name(),
+                password=password,
+                passwordRepeat=password,
+                roles=[role],
+                verified=True,
+                banned=False,
+            )
+            response = self.admin_api.user_api.create_user(user_data).json()
+            if self.cleanup_registry is not None:
+                self.cleanup_registry.register_user(response["id"])
+            user = User(user_data.email, password, [role.value], ApiManager(self.session_factory()))
+        user.api.auth_api.authenticate(user.creds)
+        return user
+
+    def get(self, role: Roles) -> User:
+        """Авторизованный пользователь с ролью role."""
+        with self._lock:
+            if not self._futures:
+                # Первое обращение - создаём все роли разом, следующие параметры теста их уже не ждут
+                self._futures = {each: self._executor.submit(self._build, each) for each in Roles}
+        return self._futures[role].result()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for future in self._futures.values():
+            if future.exception() is None:
+                future.result().api.close_session()
@@ -0,0 +1,9 @@
+import math
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    """Перцентиль по методу ближайшего ранга для заранее отсортированного списка."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
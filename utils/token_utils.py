@@ -0,0 +1,17 @@
+import base64
+import json
+
+
+def decode_jwt_payload(token: str) -> dict:
+    """
+    Декодирует payload JWT без проверки подписи (для чтения id, ролей и exp в тестах).
+    :param token: JWT вида header.payload.signature
+    :return: Словарь claims или пустой словарь, если токен не JWT (в т.ч. payload - не JSON-объект).
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError, AttributeError, TypeError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
@@ -0,0 +1,172 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from api_clients.api_manager import ApiManager
+from constants.roles import Roles
+from entities.user import User
+from models.base_models import TestUser
+from utils.data_generator import DataGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class UserPool:
+    """
+    Пул заранее созданных подтверждённых пользователей с ролью USER.
+    Тест берёт пользователя в аренду (lease) и возвращает (release); после возврата пользователь
+    в фоне приводится к исходному состоянию или, если тест его удалил, заменяется новым.
+    Когда свободных остаётся меньше low_watermark, пул пополняется в фоне.
+    """
+
+    # Исходное состояние пользователя пула, к которому он приводится после теста
+    DEFAULT_STATE = {"roles": [Roles.USER.value], "verified": True, "banned": False}
+
+    def __init__(self, admin_api: ApiManager, session_factory, size=5, low_watermark=2, workers=8):
+        """
+        :param admin_api: ApiManager с авторизацией SUPER_ADMIN - создаёт, сбрасывает и удаляет пользователей.
+        :param session_factory: Функция без аргументов, возвращающая новую requests.Session.
+        :param size: Сколько пользователей держать в пуле.
+        :param low_watermark: Порог свободных пользователей, ниже которого пул пополняется в фоне.
+        :param workers: Сколько запросов создания/сброса выполнять параллельно.
+        """
+        self.admin_api = admin_api
+        self.session_factory = session_factory
+        self.size = size
+        self.low_watermark = low_watermark
+        self.user_ids = {}  # email -> id всех созданных пулом пользователей
+        self.leases = 0
+        self._available = []
+        self._pending = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="user-pool")
+
+    def _provision(self) -> User:
+        """Создаёт подтверждённого пользователя через API и логинит его."""
+        password = DataGenerator.generate_random_password()
+        user_data = TestUser(
+            email=DataGenerator.generate_random_email(),
+            fullName=DataGenerator.generate_random_name(),
+            password=password,
+            passwordRepeat=password,
+            roles=[Roles.USER],
+            verified=True,
+            banned=False,
+        )
+        response = self.admin_api.user_api.create_user(user_data).json()
+        with self._condition:
+            self.user_ids[user_data.email] = response["id"]
+        user = User(user_data.email, password, [Roles.USER.value], ApiManager(self.session_factory()))
+        user.api.auth_api.authenticate(user.creds)
+        return user
+
+    def _provision_into_pool(self):
+        try:
+            user = self._provision()
+        except Exception as e:
+            logger.info(f"User pool: failed to provision user: {type(e).__name__} - {e}")
+            user = None
+        with self._condition:
+            self._pending -= 1
+            if user is not None:
+                self._available.append(user)
+            self._condition.notify_all()
+
+    def _replenish(self):
+        """Запускает фоновое создание пользователей до size. Вызывать под self._condition."""
+        if self._closed or len(self._available) + self._pending >= self.low_watermark:
+            return
+        missing = self.size - len(self._available) - self._pending
+        for _ in range(missing):
+            self._pending += 1
+            self._executor.submit(self._provision_into_pool)
+
+    def fill(self):
+        """Создаёт пользователей пула параллельно и ждёт окончания."""
+        with self._condition:
+            missing = self.size - len(self._available) - self._pending
+            self._pending += missing
+        wait([self._executor.submit(self._provision_into_pool) for _ in range(missing)])
+
+    def lease(self, timeout=60.0) -> User:
+        """
+        Выдаёт свободного пользователя (при необходимости ждёт фонового создания).
+        :param timeout: Сколько секунд ждать свободного пользователя.
+        """
+        with self._condition:
+            if not self._available and not self._pending:
+                self._pending += 1
+                self._executor.submit(self._provision_into_pool)
+            if not self._condition.wait_for(lambda: self._available, timeout=timeout):
+                raise TimeoutError(f"No free user in pool after {timeout}s")
+            user = self._available.pop()
+            self.leases += 1
+            self._replenish()
+        # Тест мог разлогинить сессию или поменять заголовки - токен из кэша восстанавливается без /login
+        user.api.auth_api.authenticate(user.creds)
+        return user
+
+    def release(self, user: User):
+        """Возвращает пользователя в пул; сброс состояния выполняется в фоне."""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending += 1
+        self._executor.submit(self._reset_into_pool, user)
+
+    def _reset_into_pool(self, user: User):
+        user_id = self.user_ids[user.email]
+        try:
+            try:
+                data = self.admin_api.user_api.get_user(user_id).json()
+            except ValueError:
+                if not self._is_deleted(user_id):
+                    raise
+                # Тест удалил пользователя - вместо него создаём нового
+                with self._condition:
+                    self.user_ids.pop(user.email, None)
+                user.api.close_session()
+                self._provision_into_pool()
+                return
+            if any(data.get(field) != value for field, value in self.DEFAULT_STATE.items()):
+                self.admin_api.user_api.edit_user(user_id, self.DEFAULT_STATE)
+        except Exception as e:
+            # Пользователь в неизвестном состоянии (5xx, 401...) - в пул не возвращаем,
+            # но id остаётся в user_ids, и close() его удалит
+            logger.info(f"User pool: failed to reset {user.email}: {type(e).__name__} - {e}")
+            user.api.close_session()
+            with self._condition:
+                self._pending -= 1
+                self._replenish()
+                self._condition.notify_all()
+            return
+        with self._condition:
+            self._pending -= 1
+            self._available.append(user)
+            self._condition.notify_all()
+
+    def _is_deleted(self, user_id) -> bool:
+        """Пользователь удалён, только если сервис ответил на него 404 (а не 5xx или 401)."""
+        try:
+            self.admin_api.user_api.get_user(user_id, expected_status=404)
+            return True
+        except Exception:
+            return False
+
+    def close(self):
+        """Останавливает пополнение и удаляет всех созданных пулом пользователей."""
+        with self._condition:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="user-pool-cleanup") as cleanup:
+            for user_id in list(self.user_ids.values()):
+                cleanup.submit(self._delete, user_id)
+        for user in self._available:
+            user.api.close_session()
+
+    def _delete(self, user_id):
+        try:
+            self.admin_api.user_api.delete_user(user_id)
+        except Exception as e:
+            logger.info(f"User pool: failed to delete user {user_id}: {type(e).__name__} - {e}")